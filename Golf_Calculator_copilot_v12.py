@@ -1,3 +1,9 @@
+import time
+
+# taken first so the startup report can time everything after the interpreter is up
+_STARTUP_T0 = time.perf_counter()
+_STARTUP_CPU0 = time.process_time()
+
 import ctypes
 import sys
 
@@ -12,17 +18,37 @@ except Exception:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from tkcalendar import DateEntry
-import pandas as pd
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+import numpy as np
+from contextlib import contextmanager
 from datetime import datetime
+import multiprocessing
 import os
+import queue
+import threading
+import tracemalloc
+
+from skins_engine import (
+    HOLES, MAX_HOLE_SCORE, MISSING_SCORE, RULE_TOGGLES,
+    LiveSkinsBoard, SkinsEngine, SkinsSettings, hole_result_text, parse_handicap, parse_score,
+)
+import skins_diag
+from skins_formats import load_round, write_round
+from skins_model import (
+    Player, Round, flight_label, flight_pots_text, new_round_id, parse_flight_pots, parse_score_block,
+)
+from skins_store import DEFAULT_DB_PATH, RoundStore
+# skins_excel (openpyxl), skins_sim (process pools) and tkcalendar are imported
+# where first used so the window shows sooner; see warm_up_imports()
 
 
 VERSION = "V1.0"
 APP_ICON_FILENAME = "Golf_Icon.png"
+# import the deferred modules in a background thread once the window is up
+WARM_UP_IMPORTS = True
+# set (or pass --startup-report) to print where cold-start time goes
+STARTUP_REPORT_ENV = "BIGBOYSKINS_STARTUP_REPORT"
+# also written here, since the frozen windowed build has no console
+STARTUP_REPORT_PATH = os.path.join(os.path.expanduser("~"), "BigBoySkins_startup.txt")
 
 
 def get_app_icon_path():
@@ -33,30 +59,155 @@ def get_app_icon_path():
         base_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_dir, APP_ICON_FILENAME)
 
-MAX_PLAYERS = 40
-MAX_HOLE_SCORE = 9
-HOLES = 18
+MAX_PLAYERS = 300
+# fallback pixel height of one grid row before widgets can be measured
+PLAYER_ROW_HEIGHT = 26
+MIN_POOL_ROWS = 2
+# how often the Tk loop drains a background job's message queue
+JOB_POLL_MS = 50
+# synthetic rounds per "Simulate Payouts" run
+SIM_ROUNDS = 200_000
+ROUND_FILETYPES = [("Excel files", "*.xlsx"), ("Round CSV", "*.csv"), ("Round JSON", "*.json")]
+DATE_ENTRY_GRID = dict(row=0, column=3, sticky="ew", padx=(0, 12), pady=4)
+SAVED_ROUND_FILETYPES = [("Saved rounds", "*.skins")]
+# how long the "Saved ..." note stays next to the buttons
+SAVE_NOTE_MS = 3000
+
+
+class StartupReport:
+    """Wall-clock marks from process start to first paint, plus background warm-up imports."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        # CPU time already spent before this module ran (interpreter, frozen-app unpacking)
+        self.before_module = _STARTUP_CPU0
+        self.marks = [("module start", _STARTUP_T0)]
+        self.imports = []
+        self._lock = threading.Lock()
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter()))
+
+    def timed_import(self, module):
+        t = time.perf_counter()
+        __import__(module)
+        with self._lock:
+            self.imports.append((module, time.perf_counter() - t))
+
+    def lines(self):
+        out = [f"{'before main module (CPU)':<28} {1000 * self.before_module:8.1f} ms"]
+        for (_, t0), (label, t1) in zip(self.marks, self.marks[1:]):
+            out.append(f"{label:<28} {1000 * (t1 - t0):8.1f} ms")
+        out.append(f"{'total to ' + self.marks[-1][0]:<28} {1000 * (self.marks[-1][1] - _STARTUP_T0):8.1f} ms")
+        with self._lock:
+            for module, dt in self.imports:
+                out.append(f"{'  warm-up import ' + module:<28} {1000 * dt:8.1f} ms")
+        return out
+
+    def write(self):
+        if not self.enabled:
+            return
+        text = "\n".join(["Big Boy Skins startup"] + self.lines()) + "\n"
+        if sys.stderr is not None:
+            sys.stderr.write(text)
+        try:
+            with open(STARTUP_REPORT_PATH, "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass
+
 
-# canonical reason codes for hole results
-REASON_NO_SCORES = "NO_SCORES"
-REASON_SOLE = "SOLE"
-REASON_CARRY = "CARRY"
-REASON_SPLIT = "SPLIT"
+def warm_up_imports(startup):
+    """Import the modules the GUI defers (openpyxl, process pools) so the first export is quick.
+
+    Runs in a daemon thread; it only imports, never touches Tk.
+    """
+    for module in ("skins_excel", "skins_sim"):
+        try:
+            startup.timed_import(module)
+        except Exception as e:
+            skins_diag.error(f"Warm-up import of {module} failed", e)
+    startup.write()
+
+
+class PlayerTable:
+    """Every player in the field.
+
+    Scores live in an int8 players x holes array (MISSING_SCORE for blanks);
+    the grid's pooled PlayerRow widgets are only views onto these rows.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.handicaps = []
+        self.included = []
+        self.flights = []
+        # capacity grows by doubling so adding a player doesn't copy every time
+        self.scores = np.full((8, HOLES), MISSING_SCORE, dtype=np.int8)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name="", handicap="0", included=True, flight=""):
+        i = len(self.names)
+        if i == self.scores.shape[0]:
+            grown = np.full((2 * i, HOLES), MISSING_SCORE, dtype=np.int8)
+            grown[:i] = self.scores[:i]
+            self.scores = grown
+        self.names.append(name)
+        self.handicaps.append(handicap)
+        self.included.append(included)
+        self.flights.append(flight)
+        self.scores[i] = MISSING_SCORE
+        return i
+
+    def clear(self):
+        self.names = []
+        self.handicaps = []
+        self.included = []
+        self.flights = []
+        self.scores[:] = MISSING_SCORE
+
+    def set_score(self, i, hole, value):
+        score = parse_score(value)
+        self.scores[i, hole] = MISSING_SCORE if score is None else score
+
+    def score_text(self, i, hole):
+        v = int(self.scores[i, hole])
+        return "" if v == MISSING_SCORE else str(v)
+
+    def nine_total(self, i, nine):
+        row = self.scores[i, nine * 9:(nine + 1) * 9]
+        return int(row[row != MISSING_SCORE].sum())
+
+    def to_player(self, i):
+        hcp = str(self.handicaps[i]).strip()
+        return Player(self.names[i].strip(), parse_handicap(hcp) if hcp != "" else None,
+                      bool(self.included[i]), self.scores[i].copy(), self.flights[i].strip())
 
 
 class PlayerRow:
-    def __init__(self, parent, idx, app):
+    """One pooled row of grid widgets, bound to a PlayerTable index with bind()."""
+
+    def __init__(self, parent, slot, app):
         # place widgets directly into the parent grid so their columns align with header labels
         self.parent = parent
         self.app = app
-        # players start after Par (row0), Stroke Index (row1), Header (row2)
-        self.row = idx + 3
+        # pool rows start after Par (row0), Stroke Index (row1), Header (row2)
+        self.row = slot + 3
+        self.index = None
         self.name_var = tk.StringVar()
         self.handicap_var = tk.StringVar(value="0")
         self.include_var = tk.BooleanVar(value=True)
+        self.flight_var = tk.StringVar()
         self.score_vars = [tk.StringVar(value="") for _ in range(HOLES)]
         self.score_entries = []
         self.score_entry_defaults = []
+        # cached colors so an edit only reconfigures its own hole
+        self._hole_bg = [None] * HOLES
+        self._dirty_holes = set()
+        self._flush_id = None
+        self._traces_suspended = False
 
         self.name_entry = ttk.Entry(self.parent, textvariable=self.name_var, width=20)
         self.name_entry.grid(row=self.row, column=0, padx=2, pady=2)
@@ -82,9 +233,100 @@ class PlayerRow:
         self.front9_lbl.grid(row=self.row, column=12, padx=4)
         self.back9_lbl = ttk.Label(self.parent, text="0", width=5)
         self.back9_lbl.grid(row=self.row, column=4 + HOLES, padx=4)
+        self.flight_entry = ttk.Entry(self.parent, textvariable=self.flight_var, width=6)
+        self.flight_entry.grid(row=self.row, column=5 + HOLES, padx=2, pady=2)
+        self.widgets = [self.name_entry, self.handicap_entry, self.include_cb, *self.score_entries,
+                        self.front9_lbl, self.back9_lbl, self.flight_entry]
+        self._shown = True
+
+        for h, sv in enumerate(self.score_vars):
+            sv.trace_add("write", lambda *a, h=h: self._on_score_write(h))
+        self.name_var.trace_add("write", lambda *a: self._on_player_write())
+        self.handicap_var.trace_add("write", lambda *a: self._on_player_write())
+        self.include_var.trace_add("write", lambda *a: self._on_player_write())
+        self.flight_var.trace_add("write", lambda *a: self._on_player_write())
+
+    def bind(self, index):
+        """Show player `index` of the app's table in this row (None hides the row)."""
+        self.index = index
+        if index is None:
+            if self._shown:
+                for w in self.widgets:
+                    w.grid_remove()
+                self._shown = False
+            return
+        if not self._shown:
+            for w in self.widgets:
+                w.grid()
+            self._shown = True
+        table = self.app.table
+        with self.suspend_traces():
+            self.name_var.set(table.names[index])
+            self.handicap_var.set(table.handicaps[index])
+            self.include_var.set(table.included[index])
+            self.flight_var.set(table.flights[index])
+            for h in range(HOLES):
+                self.score_vars[h].set(table.score_text(index, h))
+
+    def _on_score_write(self, hole):
+        if self._traces_suspended or self.index is None:
+            return
+        self.app.table.set_score(self.index, hole, self.score_vars[hole].get())
+        self.app.live_score_changed(self.index, hole)
+        self.refresh_hole(hole)
+
+    def _on_player_write(self):
+        if self._traces_suspended or self.index is None:
+            return
+        table = self.app.table
+        table.names[self.index] = self.name_var.get()
+        table.handicaps[self.index] = self.handicap_var.get()
+        table.flights[self.index] = self.flight_var.get()
+        try:
+            table.included[self.index] = bool(self.include_var.get())
+        except Exception:
+            pass
+        # anything other than a single score changes every hole of the live board
+        self.app.schedule_live_refresh(reload=True)
+
+    def refresh_hole(self, hole):
+        """Queue a hole for recolor/retotal; all queued holes are handled in one after_idle pass."""
+        self._dirty_holes.add(hole)
+        if self._flush_id is None:
+            self._flush_id = self.app.root.after_idle(self._flush_dirty_holes)
+
+    def _cancel_flush(self):
+        self._dirty_holes.clear()
+        if self._flush_id is not None:
+            try:
+                self.app.root.after_cancel(self._flush_id)
+            except Exception:
+                pass
+            self._flush_id = None
 
-        for sv in self.score_vars:
-            sv.trace_add("write", lambda *a: self.update_totals())
+    def _flush_dirty_holes(self):
+        self._flush_id = None
+        holes = sorted(self._dirty_holes)
+        self._dirty_holes.clear()
+        if self.index is None:
+            return
+        for h in holes:
+            self._update_hole_color(h)
+        nines = {h // 9 for h in holes}
+        if 0 in nines:
+            self.front9_lbl.config(text=str(self.app.table.nine_total(self.index, 0)))
+        if 1 in nines:
+            self.back9_lbl.config(text=str(self.app.table.nine_total(self.index, 1)))
+
+    @contextmanager
+    def suspend_traces(self):
+        """Bulk-set this row's vars without per-write work; the row is refreshed once on exit."""
+        self._traces_suspended = True
+        try:
+            yield self
+        finally:
+            self._traces_suspended = False
+            self.update_totals()
 
     def _validate_score_var(self, var):
         v = var.get().strip()
@@ -100,119 +342,136 @@ class PlayerRow:
             var.set("")
 
     def update_totals(self):
-        front = 0
-        back = 0
-        for i in range(9):
-            v = self.score_vars[i].get().strip()
-            if v.isdigit():
-                front += int(v)
-        for i in range(9, 18):
-            v = self.score_vars[i].get().strip()
-            if v.isdigit():
-                back += int(v)
-        self.front9_lbl.config(text=str(front))
-        self.back9_lbl.config(text=str(back))
+        """Full refresh of both totals and every hole color (used after bind/bulk loads)."""
+        self._cancel_flush()
+        if self.index is None:
+            return
+        for i in range(HOLES):
+            self._update_hole_color(i)
+        self.front9_lbl.config(text=str(self.app.table.nine_total(self.index, 0)))
+        self.back9_lbl.config(text=str(self.app.table.nine_total(self.index, 1)))
 
+    def _update_hole_color(self, i):
         # Highlight birdies/eagles
-        for i in range(HOLES):
-            try:
-                ent = self.score_entries[i]
-            except Exception:
-                continue
-            val = self.score_vars[i].get().strip()
-            if val == "":
-                try:
-                    default = self.score_entry_defaults[i]
-                    ent.config(bg=default if default is not None else 'white')
-                except Exception:
-                    pass
-                continue
-            try:
-                score = int(val)
-            except Exception:
-                continue
+        try:
+            ent = self.score_entries[i]
+        except Exception:
+            return
+        default = self.score_entry_defaults[i]
+        default = default if default is not None else 'white'
+        score = int(self.app.table.scores[self.index, i])
+        if score == MISSING_SCORE:
+            color = default
+        else:
             try:
                 par_v = int(self.app.par_vars[i].get())
             except Exception:
                 par_v = 4
             if score == par_v - 1:
-                try:
-                    ent.config(bg="#FFF59D")
-                except Exception:
-                    pass
+                color = "#FFF59D"
             elif score <= par_v - 2:
-                try:
-                    ent.config(bg="#C8E6C9")
-                except Exception:
-                    pass
+                color = "#C8E6C9"
             else:
-                try:
-                    default = self.score_entry_defaults[i]
-                    ent.config(bg=default if default is not None else 'white')
-                except Exception:
-                    pass
-
-    def destroy(self):
-        try:
-            self.name_entry.destroy()
-        except:
-            pass
-        try:
-            self.handicap_entry.destroy()
-        except:
-            pass
+                color = default
+        if color == self._hole_bg[i]:
+            return
         try:
-            self.include_cb.destroy()
-        except:
+            ent.config(bg=color)
+            self._hole_bg[i] = color
+        except Exception:
             pass
-        for h in range(HOLES):
+
+    def destroy(self):
+        self._cancel_flush()
+        for w in self.widgets:
             try:
-                col = 3 + h if h < 9 else 4 + h
-                w = self.parent.grid_slaves(row=self.row, column=col)
-                if w:
-                    w[0].destroy()
-            except:
+                w.destroy()
+            except Exception:
                 pass
+
+
+class JobCancelled(Exception):
+    """Raised inside a background job's work function once Cancel was pressed."""
+
+
+class BackgroundJob:
+    """Run work(job) on a daemon thread and hand the outcome back to the Tk loop.
+
+    The worker must not touch Tk; it calls job.report(fraction) as it goes,
+    which also raises JobCancelled after cancel(). Messages are queued and
+    drained on the main thread with root.after, where on_progress, on_done,
+    on_error and on_cancel are invoked.
+    """
+
+    def __init__(self, root, work, on_done, on_error, on_progress=None, on_cancel=None):
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self._cancel = threading.Event()
+        self._messages = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self.root.after(JOB_POLL_MS, self._poll)
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def report(self, fraction):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self._messages.put(("progress", fraction))
+
+    def _run(self):
         try:
-            self.front9_lbl.destroy()
-        except:
-            pass
-        try:
-            self.back9_lbl.destroy()
-        except:
-            pass
+            result = self.work(self)
+        except JobCancelled:
+            self._messages.put(("cancelled", None))
+        except Exception as e:
+            skins_diag.error("Background job failed", e)
+            self._messages.put(("error", e))
+        else:
+            self._messages.put(("done", result))
 
-    def to_dict(self):
-        d = {
-            "Name": self.name_var.get().strip(),
-            "Handicap": self.handicap_var.get().strip(),
-            "Included": self.include_var.get()
-        }
-        for i in range(HOLES):
-            d[f"H{i+1}"] = self.score_vars[i].get().strip()
-        d["Front9"] = self.front9_lbl.cget("text")
-        d["Back9"] = self.back9_lbl.cget("text")
-        return d
-
-    def load_from_dict(self, d):
-        self.name_var.set(d.get("Name", ""))
-        self.handicap_var.set(str(d.get("Handicap", "0")))
-        self.include_var.set(bool(d.get("Included", True)))
-        for i in range(HOLES):
-            key = f"H{i+1}"
-            val = d.get(key, "")
-            if pd.isna(val):
-                self.score_vars[i].set("")
-            else:
-                self.score_vars[i].set(str(val))
-        self.update_totals()
+    def _poll(self):
+        progress = None
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                progress = payload
+                continue
+            if kind == "done":
+                self.on_done(payload)
+            elif kind == "error":
+                self.on_error(payload)
+            elif self.on_cancel is not None:
+                self.on_cancel()
+            return
+        # only the latest fraction matters; intermediate ones are dropped
+        if progress is not None and self.on_progress is not None:
+            self.on_progress(progress)
+        self.root.after(JOB_POLL_MS, self._poll)
 
 
 class BigBoySkinsApp:
     def __init__(self, root):
         self.root = root
         self.root.title(f"Big Boys Skins Manager  {VERSION}")
-        self.players = []
+        self.table = PlayerTable()
+        self.row_pool = []
+        self.top_row = 0
         self.use_net_scores = tk.BooleanVar(value=False)
         self.split_ties = tk.BooleanVar(value=False)
         self.course_name_var = tk.StringVar()
@@ -221,12 +480,44 @@ class BigBoySkinsApp:
         self.per_skin_var = tk.StringVar(value="1")
         self.total_purse_var = tk.StringVar(value="")
         self.carryover_var = tk.BooleanVar(value=True)
+        # optional slope/rating: when slope is set, HCP is read as a handicap index
+        self.slope_var = tk.StringVar(value="")
+        self.course_rating_var = tk.StringVar(value="")
         self.bonus_enabled_var = tk.BooleanVar(value=True)
+        # per-flight pots, e.g. "A=5, B=2, C=purse 120"; flights not listed use Per Skin/Total Purse
+        self.flight_pots_var = tk.StringVar(value="")
         self.par_vars = [tk.StringVar(value="4") for _ in range(HOLES)]
         self.stroke_index_vars = [tk.StringVar(value=str(i+1)) for i in range(HOLES)]
 
+        # live skins boards, one per flight as (flight, board); refreshes are coalesced through after_idle
+        self.live_boards = None
+        # table row -> (board number, row within that board)
+        self._live_index = {}
+        self._live_refresh_pending = False
+        self._live_reload_pending = True
+
+        # at most one export/import runs in the background at a time
+        self.job = None
+        # exported rounds are also kept here for season history
+        self.store_path = DEFAULT_DB_PATH
+        # .skins file the round in progress is saved to (asked for on first save)
+        self.round_path = None
+        # identity of the round in progress in the history, kept through name and score
+        # corrections; a different course or date starts a new round (see collect_round)
+        self.round_id = new_round_id()
+        self._round_id_for = None
+
         self.build_gui()
 
+        live_vars = [self.use_net_scores, self.split_ties, self.per_skin_var, self.total_purse_var,
+                     self.carryover_var, self.slope_var, self.course_rating_var, self.bonus_enabled_var,
+                     self.flight_pots_var]
+        for v in live_vars + self.par_vars + self.stroke_index_vars:
+            v.trace_add("write", lambda *a: self.schedule_live_refresh(reload=True))
+        for i, v in enumerate(self.par_vars):
+            v.trace_add("write", lambda *a, i=i: self._on_par_write(i))
+        self.schedule_live_refresh(reload=True)
+
    # ...existing code...
     def build_gui(self):
         # Large in-app title (can't change OS title bar font from Tkinter)
@@ -259,8 +550,11 @@ class BigBoySkinsApp:
         #self.date_entry = DateEntry(header, textvariable=self.date_var, width=12)
         #self.date_entry.grid(row=0, column=3, sticky="ew")
         ttk.Label(header, text="Date:").grid(row=0, column=2, padx=(6,4), pady=4)
-        self.date_entry = DateEntry(header, textvariable=self.date_var, width=14)
-        self.date_entry.grid(row=0, column=3, sticky="ew", padx=(0,12), pady=4)
+        # plain entry until _install_date_picker() swaps in the tkcalendar DateEntry after first paint
+        self._date_header = header
+        self.date_var.set(datetime.now().strftime("%Y-%m-%d"))
+        self.date_entry = ttk.Entry(header, textvariable=self.date_var, width=14)
+        self.date_entry.grid(**DATE_ENTRY_GRID)
 
         #tk.Label(header, text="Per Skin $").grid(row=0, column=4)
         ttk.Entry(header, textvariable=self.per_skin_var, width=6).grid(row=0, column=5, sticky="ew")
@@ -279,56 +573,44 @@ class BigBoySkinsApp:
         #ttk.Checkbutton(header, text="Split Ties (instead of carryover)", variable=self.split_ties).grid(row=1, column=2, columnspan=2, sticky="w")
         ttk.Checkbutton(header, text="Use Net Scores (based on handicap)", variable=self.use_net_scores).grid(row=1, column=0, columnspan=2, sticky="w", padx=(0,8), pady=6)
         ttk.Checkbutton(header, text="Split Ties (instead of carryover)", variable=self.split_ties).grid(row=1, column=2, columnspan=2, sticky="w", padx=(6,8), pady=6)
+        ttk.Label(header, text="Slope").grid(row=1, column=4, padx=(6,4), pady=6)
+        ttk.Entry(header, textvariable=self.slope_var, width=8).grid(row=1, column=5, sticky="ew", padx=(0,12), pady=6)
+        ttk.Label(header, text="Rating").grid(row=1, column=6, padx=(6,4), pady=6)
+        ttk.Entry(header, textvariable=self.course_rating_var, width=10).grid(row=1, column=7, sticky="ew", padx=(0,12), pady=6)
+        ttk.Label(header, text="Flight Pots").grid(row=1, column=8, padx=(6,4), pady=6)
+        ttk.Entry(header, textvariable=self.flight_pots_var, width=28).grid(row=1, column=9, sticky="ew", padx=(0,12), pady=6)
  # ...existing code...
 
-        # Player list: make it scrollable. Container holds a Canvas and vertical Scrollbar.
+        # Player list: a fixed pool of PlayerRow widgets sized to the viewport is
+        # re-bound to rows of self.table as the user scrolls, so widget count does
+        # not grow with the field size.
         container = ttk.Frame(self.root)
         container.grid(row=2, column=0, sticky="nsew", padx=10, pady=5)
         container.columnconfigure(0, weight=1)
-        # allow the canvas (row 0) to expand vertically when the window is resized
         container.rowconfigure(0, weight=1)
+        # size comes from the window, not from however many pool rows exist
+        container.grid_propagate(False)
 
-        self.player_canvas = tk.Canvas(container, highlightthickness=0)
-        self.player_vscroll = ttk.Scrollbar(container, orient="vertical", command=self.player_canvas.yview)
-        self.player_canvas.configure(yscrollcommand=self.player_vscroll.set)
-
-        self.player_canvas.grid(row=0, column=0, sticky="nsew")
+        self.player_inner = ttk.Frame(container)
+        self.player_inner.grid(row=0, column=0, sticky="new")
+        self.player_vscroll = ttk.Scrollbar(container, orient="vertical", command=self._on_player_scrollbar)
         self.player_vscroll.grid(row=0, column=1, sticky="ns")
 
-        # inner frame where rows live
-        self.player_inner = ttk.Frame(self.player_canvas)
-        self.player_inner_id = self.player_canvas.create_window((0, 0), window=self.player_inner, anchor='nw')
-
         # column weights on inner frame (same as previous player_frame)
         self.player_inner.columnconfigure(0, weight=2)
         for ci in range(1, 8 + HOLES):
             self.player_inner.columnconfigure(ci, weight=1)
 
-        # ensure canvas expands properly when container size changes
-        def _on_inner_config(event):
-            try:
-                self.player_canvas.configure(scrollregion=self.player_canvas.bbox("all"))
-            except Exception:
-                pass
-        self.player_inner.bind('<Configure>', _on_inner_config)
-
-        def _on_canvas_config(event):
-            # keep inner frame width in sync with canvas width
-            try:
-                cw = event.width
-                self.player_canvas.itemconfigure(self.player_inner_id, width=cw)
-            except Exception:
-                pass
-        self.player_canvas.bind('<Configure>', _on_canvas_config)
+        container.bind('<Configure>', lambda event: self._resize_row_pool(event.height))
 
         # mousewheel scrolling (Windows behavior)
         def _on_mousewheel(event):
             # On Windows, event.delta is multiples of 120
             try:
-                self.player_canvas.yview_scroll(int(-1 * (event.delta / 120)), 'units')
+                self._scroll_players(int(-3 * (event.delta / 120)))
             except Exception:
                 pass
-        self.player_canvas.bind_all('<MouseWheel>', _on_mousewheel)
+        container.bind_all('<MouseWheel>', _on_mousewheel)
 
         # Par row
         ttk.Label(self.player_inner, text="Par:").grid(row=0, column=0, sticky="w")
@@ -351,50 +633,238 @@ class BigBoySkinsApp:
             ttk.Label(self.player_inner, text=f"H{i+1}").grid(row=2, column=col)
         ttk.Label(self.player_inner, text="Front9").grid(row=2, column=12)
         ttk.Label(self.player_inner, text="Back9").grid(row=2, column=4 + HOLES)
+        ttk.Label(self.player_inner, text="Flight").grid(row=2, column=5 + HOLES)
+
+        self._build_live_panel()
 
         # Buttons
         btn_frame = ttk.Frame(self.root)
         btn_frame.grid(row=3, column=0, sticky="w", padx=10, pady=10)
         ttk.Button(btn_frame, text="Add Player", command=self.add_player).grid(row=0, column=0, padx=5)
-        ttk.Button(btn_frame, text="Export to Excel", command=self.export_to_excel).grid(row=0, column=1, padx=5)
-        ttk.Button(btn_frame, text="Import from Excel", command=self.import_from_excel).grid(row=0, column=2, padx=5)
-
+        self.export_btn = ttk.Button(btn_frame, text="Export to Excel", command=self.export_to_excel)
+        self.export_btn.grid(row=0, column=1, padx=5)
+        self.import_btn = ttk.Button(btn_frame, text="Import from Excel", command=self.import_from_excel)
+        self.import_btn.grid(row=0, column=2, padx=5)
+        self.simulate_btn = ttk.Button(btn_frame, text="Simulate Payouts", command=self.simulate_payouts)
+        self.simulate_btn.grid(row=0, column=3, padx=5)
+        ttk.Button(btn_frame, text="Compare Rules", command=self.compare_rules).grid(row=0, column=4, padx=5)
+        ttk.Button(btn_frame, text="Paste Scores", command=self.paste_scores).grid(row=0, column=5, padx=5)
+        self.root.bind("<Control-Shift-V>", lambda e: self.paste_scores())
+        ttk.Button(btn_frame, text="Save Round", command=self.save_round).grid(row=0, column=6, padx=5)
+        self.root.bind("<Control-s>", lambda e: self.save_round())
+        # hidden: timings, counters, cache stats and errors for support requests
+        self.root.bind("<Control-Shift-D>", lambda e: self.show_diagnostics())
+        # buttons that start a background job; disabled while one runs
+        self.job_buttons = (self.export_btn, self.import_btn, self.simulate_btn)
+
+        # progress + cancel for background export/import; hidden while idle
+        self.job_status_var = tk.StringVar(value="")
+        self.job_progress = ttk.Progressbar(btn_frame, mode="determinate", maximum=1.0, length=200)
+        self.job_status_lbl = ttk.Label(btn_frame, textvariable=self.job_status_var)
+        self.job_cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self.cancel_job)
+
+        self._resize_row_pool(0)
         for _ in range(2):
             self.add_player()
 
+    def _install_date_picker(self):
+        from tkcalendar import DateEntry
+        text = self.date_var.get()
+        picker = DateEntry(self._date_header, textvariable=self.date_var, width=14)
+        self.date_entry.destroy()
+        self.date_entry = picker
+        self.date_entry.grid(**DATE_ENTRY_GRID)
+        # keep a date typed (or imported) before the picker existed
+        if text:
+            self._set_date(text)
+
+    def after_first_paint(self, startup):
+        """Deferred startup work, run from the event loop once the window is on screen."""
+        startup.mark("first paint")
+        try:
+            self._install_date_picker()
+        except Exception as e:
+            skins_diag.error("Date picker unavailable", e)
+        startup.mark("date picker")
+        if WARM_UP_IMPORTS:
+            threading.Thread(target=warm_up_imports, args=(startup,), daemon=True).start()
+        else:
+            startup.write()
+
+    def _row_height(self):
+        try:
+            h = self.row_pool[0].name_entry.winfo_reqheight() + 4
+        except Exception:
+            h = 0
+        return h if h > 4 else PLAYER_ROW_HEIGHT
+
+    def _resize_row_pool(self, height):
+        """Grow/shrink the pool of row widgets to what fits in `height` pixels."""
+        row_h = self._row_height()
+        # leave room for the Par, Stroke Index and header rows
+        wanted = max(MIN_POOL_ROWS, int(height) // row_h - 3)
+        while len(self.row_pool) < wanted:
+            self.row_pool.append(PlayerRow(self.player_inner, len(self.row_pool), self))
+        while len(self.row_pool) > wanted:
+            self.row_pool.pop().destroy()
+        self._set_top_row(self.top_row)
+
+    @skins_diag.instrumented("grid rebuild")
+    def _set_top_row(self, top):
+        """Bind the pool to players top..top+len(pool) and update the scrollbar."""
+        n = len(self.table)
+        pool = len(self.row_pool)
+        top = max(0, min(int(top), n - pool))
+        self.top_row = top
+        for slot, pr in enumerate(self.row_pool):
+            idx = top + slot
+            pr.bind(idx if idx < n else None)
+        if n <= pool:
+            self.player_vscroll.set(0.0, 1.0)
+        else:
+            self.player_vscroll.set(top / n, (top + pool) / n)
+
+    def _scroll_players(self, rows):
+        self._set_top_row(self.top_row + rows)
+
+    def _on_player_scrollbar(self, *args):
+        n = len(self.table)
+        if not args or n == 0:
+            return
+        if args[0] == "moveto":
+            self._set_top_row(round(float(args[1]) * n))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= max(1, len(self.row_pool) - 1)
+            self._scroll_players(step)
+
+    def _build_live_panel(self):
+        """Running skins board shown next to the score grid."""
+        panel = ttk.LabelFrame(self.root, text="Live Skins", padding=(8, 4))
+        panel.grid(row=2, column=1, sticky="ns", padx=(0, 10), pady=5)
+        panel.rowconfigure(0, weight=1)
+
+        self.live_holes_tree = ttk.Treeview(panel, columns=("hole", "result", "units"), show="headings", height=18)
+        self.live_holes_tree.heading("hole", text="Hole")
+        self.live_holes_tree.heading("result", text="Result")
+        self.live_holes_tree.heading("units", text="Units")
+        self.live_holes_tree.column("hole", width=50, anchor="center")
+        self.live_holes_tree.column("result", width=320)
+        self.live_holes_tree.column("units", width=60, anchor="center")
+        for i in range(HOLES):
+            self.live_holes_tree.insert("", "end", iid=f"H{i+1}", values=(f"H{i+1}", "", ""))
+        self.live_holes_tree.grid(row=0, column=0, sticky="ns")
+
+        self.live_payout_tree = ttk.Treeview(panel, columns=("name", "units", "amount"), show="headings", height=8)
+        self.live_payout_tree.heading("name", text="Name")
+        self.live_payout_tree.heading("units", text="Units")
+        self.live_payout_tree.heading("amount", text="Amount$")
+        self.live_payout_tree.column("name", width=250)
+        self.live_payout_tree.column("units", width=80, anchor="center")
+        self.live_payout_tree.column("amount", width=100, anchor="e")
+        self.live_payout_tree.grid(row=1, column=0, sticky="ew", pady=(6, 0))
+
+        self.live_carry_lbl = ttk.Label(panel, text="")
+        self.live_carry_lbl.grid(row=2, column=0, sticky="w", pady=(4, 0))
+
+    def _on_par_write(self, hole):
+        for pr in self.row_pool:
+            if pr.index is not None:
+                pr.refresh_hole(hole)
+
+    def schedule_live_refresh(self, reload=False):
+        if reload:
+            self._live_reload_pending = True
+        if not self._live_refresh_pending:
+            self._live_refresh_pending = True
+            self.root.after_idle(self._refresh_live_board)
+
+    def live_score_changed(self, index, hole):
+        """Fold a single score edit of table row `index` into the live board (O(players) for that hole)."""
+        if self._live_reload_pending or self.live_boards is None:
+            self.schedule_live_refresh(reload=True)
+            return
+        slot = self._live_index.get(index)
+        if slot is None:
+            return
+        board, idx = slot
+        self.live_boards[board][1].set_score(idx, hole, int(self.table.scores[index, hole]))
+        self.schedule_live_refresh()
+
+    @skins_diag.instrumented("live refresh")
+    def _refresh_live_board(self):
+        self._live_refresh_pending = False
+        try:
+            if self._live_reload_pending or self.live_boards is None:
+                self._live_reload_pending = False
+                pars = self.collect_pars()
+                stroke_index = self._stroke_index(quiet=True)
+                pots = Round(pars, None, self._engine_settings(), flight_pots=self._flight_pots(quiet=True))
+                table = self.table
+                rows = [i for i in range(len(table)) if table.included[i] and table.names[i].strip() != ""]
+                # each flight is its own game; an unflighted field is the single flight ""
+                sizes = {}
+                for i in rows:
+                    sizes[table.flights[i].strip()] = sizes.get(table.flights[i].strip(), 0) + 1
+                flights = list(sizes) or [""]
+                self._live_index = {}
+                self.live_boards = []
+                for k, flight in enumerate(flights):
+                    members = [i for i in rows if table.flights[i].strip() == flight]
+                    self._live_index.update((i, (k, n)) for n, i in enumerate(members))
+                    board = LiveSkinsBoard(SkinsEngine(pars, stroke_index, pots.flight_settings(flight, sizes)))
+                    gross = table.scores[members]
+                    board.load_matrix(
+                        [table.names[i].strip() for i in members],
+                        [parse_handicap(table.handicaps[i]) for i in members],
+                        gross, gross == MISSING_SCORE,
+                    )
+                    self.live_boards.append((flight, board))
+            self._render_live_results([(flight, board.results) for flight, board in self.live_boards])
+        except Exception as e:
+            skins_diag.error("Error updating live skins", e)
+
+    def _render_live_results(self, flight_results):
+        """Show [(flight, results)]; with several flights each hole result, name and carry is tagged with its flight."""
+        tagged = len(flight_results) > 1
+        holes = {}
+        for flight, results in flight_results:
+            for hr in results.get("hole_results", []):
+                text, units = hole_result_text(hr)
+                texts, total = holes.get(hr["hole"], ([], 0))
+                texts.append(f"{flight_label(flight)}: {text}" if tagged else text)
+                holes[hr["hole"]] = (texts, total + (units or 0))
+        for hole, (texts, units) in holes.items():
+            self.live_holes_tree.item(hole, values=(hole, "; ".join(texts), units if units else ""))
+        self.live_payout_tree.delete(*self.live_payout_tree.get_children())
+        carries = []
+        for flight, results in flight_results:
+            amounts = results.get("payout_map_amount", {})
+            for name, units in results.get("payout_map_units", {}).items():
+                amount = amounts.get(name, 0.0)
+                self.live_payout_tree.insert("", "end", values=(
+                    f"{name} ({flight_label(flight)})" if tagged else name,
+                    f"{units:g}" if units else "", f"${amount:,.2f}" if amount else ""))
+            carry = results.get("carryover_remaining", 0)
+            if carry:
+                carries.append(f"{flight_label(flight)} {carry}" if tagged else str(carry))
+        self.live_carry_lbl.config(text=f"Carryover units pending: {', '.join(carries)}" if carries else "")
+
     def _adjust_height(self):
         """Increase window height so player rows are visible. Caps at screen height minus a margin.
 
-        Uses requested geometry to estimate needed height and resizes the root window while
+        Estimates the needed height from the player count and resizes the root window while
         preserving current width.
         """
         try:
-            self.root.update_idletasks()
-
-            # If we have a scrollable player canvas, prefer the canvas content height
-            content_h = None
-            try:
-                if hasattr(self, 'player_canvas') and self.player_canvas is not None:
-                    # ensure scrollregion is up-to-date
-                    try:
-                        self.player_canvas.configure(scrollregion=self.player_canvas.bbox('all'))
-                    except Exception:
-                        pass
-                    bbox = self.player_canvas.bbox('all')
-                    if bbox:
-                        # bbox = (x1, y1, x2, y2)
-                        content_h = int(bbox[3] - bbox[1])
-            except Exception:
-                content_h = None
-
-            if content_h and content_h > 0:
-                # estimate header + controls area height as a constant buffer
-                header_buffer = 420
-                desired_h = content_h + header_buffer
-            else:
-                # fallback to requested height of all widgets
-                req_h = self.root.winfo_reqheight()
-                desired_h = req_h + 24
+            # Par, Stroke Index and header rows plus one row per player
+            content_h = (len(self.table) + 3) * self._row_height()
+            # estimate header + controls area height as a constant buffer
+            header_buffer = 420
+            desired_h = content_h + header_buffer
+            if self.root.winfo_height() >= desired_h:
+                return
 
             screen_h = self.root.winfo_screenheight()
             max_h = max(200, screen_h - 100)
@@ -416,931 +886,504 @@ class BigBoySkinsApp:
             pass
 
     def add_player(self):
-        if len(self.players) >= MAX_PLAYERS:
+        if len(self.table) >= MAX_PLAYERS:
             messagebox.showwarning("Limit reached", f"Maximum {MAX_PLAYERS} players allowed.")
             return
-        idx = len(self.players)
-        row = PlayerRow(self.player_inner, idx, self)
-        self.players.append(row)
+        idx = self.table.add()
         # adjust window height so new row is visible (capped to screen size)
+        try:
+            self._adjust_height()
+        except Exception:
+            pass
+        # scroll so the new player is in view
+        self._set_top_row(idx - len(self.row_pool) + 1)
+        self.schedule_live_refresh(reload=True)
+
+    @skins_diag.instrumented("paste")
+    def paste_scores(self):
+        """Load a tab/comma block from the clipboard (name, HCP, 18 holes per line) in one batch.
+
+        Players already in the grid (matched by name) get their handicap and
+        scores replaced; others are added, filling unnamed rows first. The
+        table is written directly, so the grid and live board refresh once.
+        """
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            text = ""
+        players, rejected = parse_score_block(text)
+        if not players:
+            messagebox.showwarning("Paste Scores", "The clipboard has no player lines (name, HCP, 18 scores).")
+            return
+
+        table = self.table
+        by_name = {n.strip().lower(): i for i, n in enumerate(table.names) if n.strip() != ""}
+        blank_rows = [i for i, n in enumerate(table.names) if n.strip() == "" and (table.scores[i] == MISSING_SCORE).all()]
+        blank_rows.reverse()
+        skipped = 0
+        for p in players:
+            i = by_name.get(p.name.lower())
+            if i is None:
+                if blank_rows:
+                    i = blank_rows.pop()
+                elif len(table) < MAX_PLAYERS:
+                    i = table.add()
+                else:
+                    skipped += 1
+                    continue
+                by_name[p.name.lower()] = i
+                table.names[i] = p.name
+            table.handicaps[i] = "0" if p.handicap is None else str(p.handicap)
+            table.included[i] = p.included
+            table.scores[i] = p.scores
+
+        self._set_top_row(self.top_row)
+        self.schedule_live_refresh(reload=True)
         try:
             self._adjust_height()
         except Exception:
             pass
 
-    def collect_data(self):
+        problems = []
+        if rejected:
+            shown = ", ".join(f"line {line} H{hole} ({cell!r})" for line, hole, cell in rejected[:8])
+            more = f" and {len(rejected) - 8} more" if len(rejected) > 8 else ""
+            problems.append(f"{len(rejected)} invalid score(s) left blank "
+                            f"(must be 0-{MAX_HOLE_SCORE}): {shown}{more}")
+        if skipped:
+            problems.append(f"{skipped} player(s) not added: maximum {MAX_PLAYERS} players allowed.")
+        if problems:
+            messagebox.showwarning("Paste Scores", "\n\n".join(problems))
+
+    def collect_pars(self):
         pars = []
         for v in self.par_vars:
             s = v.get().strip()
             pars.append(int(s) if s.isdigit() else 4)
-        player_dicts = []
-        for pr in self.players:
-            d = pr.to_dict()
-            if d.get("Name", "") == "":
-                continue
-            for i in range(HOLES):
-                key = f"H{i+1}"
-                val = d.get(key, "")
-                if isinstance(val, str) and val.strip() == "":
-                    d[key] = ""
-                else:
-                    try:
-                        n = int(val)
-                        if n < 0 or n > MAX_HOLE_SCORE:
-                            d[key] = ""
-                        else:
-                            d[key] = n
-                    except Exception:
-                        d[key] = ""
-            player_dicts.append(d)
-        return pars, player_dicts
-
-    def _format_bonus_summary(self, hole_result):
-        bonus_map = hole_result.get("gross_bonus_map") or hole_result.get("bonus_map") or {}
-        if not bonus_map:
-            return ""
-
-        parts = []
-        for name, bonus in bonus_map.items():
-            try:
-                bonus_value = float(bonus)
-            except Exception:
-                continue
-            if bonus_value == 0:
-                continue
-            bonus_text = str(int(bonus_value)) if bonus_value.is_integer() else f"{bonus_value:g}"
-            parts.append(f"{name} +{bonus_text}")
-
-        if not parts:
-            return ""
-        return f" (bonus units: {', '.join(parts)})"
-
-    def _compute_skins_and_payouts(self, pars, players_df):
-        included = players_df[players_df.get("Included") == True].reset_index(drop=True)
-        # preserve gross scores (before handicap/net adjustments) so bonuses are based on gross
-        gross_scores = included.copy(deep=True)
-
-        if self.use_net_scores.get():
-            try:
-                hcp = pd.to_numeric(included["Handicap"], errors="coerce").fillna(0)
-                stroke_index = [int(v.get()) for v in self.stroke_index_vars]
-                strokes = []
-                for idx, row in included.iterrows():
-                    player_hcp = hcp.iloc[idx]
-                    strokes_for_player = [1 if si <= player_hcp % 18 else 0 for si in stroke_index]
-                    strokes_for_player = [s + (player_hcp // 18) for s in strokes_for_player]
-                    strokes.append(strokes_for_player)
-                for i, player_strokes in enumerate(strokes):
-                    for h in range(HOLES):
-                        col = f"H{h+1}"
-                        if col in included.columns and included.at[i, col] not in ("", None):
-                            try:
-                                included.at[i, col] = int(included.at[i, col]) - player_strokes[h]
-                            except Exception:
-                                pass
-            except Exception as e:
-                print("Error applying handicaps:", e)
-
-        skins_awarded = {f"H{i+1}": [] for i in range(HOLES)}
-        carryover_on = self.carryover_var.get()
+        return pars
 
-        tp = self.total_purse_var.get().strip()
+    @skins_diag.instrumented("collect")
+    def collect_round(self, quiet=False):
+        """Snapshot the form as a Round (named players only); safe to hand to a worker thread."""
+        course = self.course_var.get().strip()
+        try:
+            date_str = self.date_entry.get_date().strftime("%Y-%m-%d")
+        except Exception:
+            date_str = self.date_var.get().strip()
+        if self._round_id_for != (course, date_str):
+            if self._round_id_for is not None:
+                self.round_id = new_round_id()
+            self._round_id_for = (course, date_str)
+        table = self.table
+        players = [table.to_player(i) for i in range(len(table)) if table.names[i].strip() != ""]
+        return Round(self.collect_pars(), self._stroke_index(quiet), self._engine_settings(), players,
+                     course=course, date=date_str, flight_pots=self._flight_pots(quiet), round_id=self.round_id)
+
+    def _engine_settings(self):
+        """Snapshot the Tk rule/purse variables into a SkinsSettings (main thread only)."""
         try:
             per_skin_input = float(self.per_skin_var.get() or 1)
         except Exception:
             per_skin_input = 1.0
         total_purse = None
+        tp = self.total_purse_var.get().strip()
         if tp != "":
             try:
                 total_purse = float(tp)
             except Exception:
                 total_purse = None
 
-        carryover_units = 0
-        hole_results = []
-        for i in range(HOLES):
-            hole = f"H{i+1}"
-            par_for_hole = pars[i]
-            col = included[hole].replace("", pd.NA).dropna()
-            if col.empty:
-                hole_results.append({
-                    "hole": hole,
-                    "lowest": None,
-                    "tied": [],
-                    "sole_winner": None,
-                    "units_paid": 0,
-                    "carryover_before": carryover_units,
-                    "reason": REASON_NO_SCORES,
-                    "reason_text": "No scores"
-                })
-                continue
-            col_int = col.astype(int)
-            minv = col_int.min()
-            tied_idx = col_int[col_int == minv].index.tolist()
-            tied_names = list(included.loc[tied_idx, "Name"])
-
-            if minv > par_for_hole:
-                carry_before = carryover_units
-                if carryover_on:
-                    carryover_units += 1
-                    reason_text = "All worse than par - carryover"
-                    reason = REASON_CARRY
-                else:
-                    reason_text = "All worse than par - carry disabled"
-                    reason = REASON_NO_SCORES
-                hole_results.append({
-                    "hole": hole,
-                    "lowest": minv,
-                    "tied": tied_names,
-                    "sole_winner": None,
-                    "units_paid": 0,
-                    "carryover_before": carry_before,
-                    "reason": reason,
-                    "reason_text": reason_text
-                })
-                continue
-
-            if len(tied_names) == 1:
-                extra = 0
-                if self.bonus_enabled_var.get():
-                    # bonus should be applied based on gross score (not net). If net scoring is enabled
-                    # we stored the original gross values in `gross_scores` before adjustment above.
-                    try:
-                        if self.use_net_scores.get():
-                            winner_idx = tied_idx[0]
-                            gv = gross_scores.at[winner_idx, hole]
-                            gross_val = int(gv) if (gv is not None and str(gv).strip() != "" and not pd.isna(gv)) else minv
-                        else:
-                            gross_val = minv
-                    except Exception:
-                        gross_val = minv
-
-                    if gross_val == par_for_hole - 1:
-                        extra = 1
-                    elif gross_val <= par_for_hole - 2:
-                        extra = 5
-                units = 1 + carryover_units + extra
-                skins_awarded[hole].append((tied_names[0], units))
-                hole_result = {
-                    "hole": hole,
-                    "lowest": minv,
-                    "tied": tied_names,
-                    "sole_winner": tied_names[0],
-                    "units_paid": units,
-                    "carryover_before": carryover_units,
-                    "reason": REASON_SOLE,
-                    "reason_text": "Sole winner <= par"
-                }
-                if extra:
-                    hole_result["gross_bonus_map"] = {tied_names[0]: extra}
-                hole_results.append(hole_result)
-                carryover_units = 0
-            else:
-                if minv > par_for_hole - 1:
-                    carry_before = carryover_units
-                    if carryover_on:
-                        carryover_units += 1
-                        reason_text = "Tie worse than birdie -> carry"
-                        reason = REASON_CARRY
-                    else:
-                        reason_text = "Tie worse than birdie -> carry disabled"
-                        reason = REASON_NO_SCORES
-                    hole_results.append({
-                        "hole": hole,
-                        "lowest": minv,
-                        "tied": tied_names,
-                        "sole_winner": None,
-                        "units_paid": 0,
-                        "carryover_before": carry_before,
-                        "reason": reason,
-                        "reason_text": reason_text
-                    })
-                else:
-                    n_tied = len(tied_names)
-                    # If more than two players made birdie/eagle on the hole, treat as carry
-                    # (no splits awarded when >2 birdies/eagles).
-                    if n_tied > 2:
-                        # For >2 birdies/eagles: each tied player retains their bonus (if any),
-                        # and the hole becomes a carry (carry increases by 1 only).
-                        bonus_map = {}
-                        try:
-                            for idx_t in tied_idx:
-                                try:
-                                    gv = gross_scores.at[idx_t, hole]
-                                except Exception:
-                                    gv = None
-                                if gv is None or (isinstance(gv, float) and pd.isna(gv)) or str(gv).strip() == "":
-                                    continue
-                                try:
-                                    gvi = int(gv)
-                                except Exception:
-                                    try:
-                                        gvi = int(float(gv))
-                                    except Exception:
-                                        gvi = None
-                                if gvi is None:
-                                    continue
-                                if gvi <= par_for_hole - 2:
-                                    bonus_map[included.at[idx_t, "Name"]] = 5
-                                elif gvi == par_for_hole - 1:
-                                    bonus_map[included.at[idx_t, "Name"]] = 1
-                        except Exception:
-                            bonus_map = {}
-
-                        carry_before = carryover_units
-                        if carryover_on:
-                            carryover_units += 1
-                            if bonus_map:
-                                reason_text = f"More than 2 birdies/eagles -> carry (bonuses retained)"
-                            else:
-                                reason_text = "More than 2 birdies/eagles -> carry"
-                            reason = REASON_CARRY
-                        else:
-                            reason_text = "More than 2 birdies/eagles -> carry disabled"
-                            reason = REASON_NO_SCORES
-                        hole_results.append({
-                            "hole": hole,
-                            "lowest": minv,
-                            "tied": tied_names,
-                            "sole_winner": None,
-                            "units_paid": 0,
-                            "carryover_before": carry_before,
-                            "reason": reason,
-                            "reason_text": reason_text,
-                            "bonus_map": bonus_map
-                        })
-                    else:
-                        # Two-player tie at birdie/eagle: either split or carry depending on setting
-                        if self.split_ties.get():
-                            split_units = 1 + carryover_units
-                            hole_results.append({
-                                "hole": hole,
-                                "lowest": minv,
-                                "tied": tied_names,
-                                "sole_winner": None,
-                                "units_paid": split_units,
-                                "carryover_before": carryover_units,
-                                "reason": REASON_SPLIT,
-                                "reason_text": "Tie at birdie/eagle -> split"
-                            })
-                            carryover_units = 0
-                        else:
-                            carry_before = carryover_units
-                            if carryover_on:
-                                carryover_units += 1
-                                reason_text = "Split ties disabled -> carry"
-                                reason = REASON_CARRY
-                            else:
-                                reason_text = "Split ties disabled -> carry disabled"
-                                reason = REASON_NO_SCORES
-                            hole_results.append({
-                                "hole": hole,
-                                "lowest": minv,
-                                "tied": tied_names,
-                                "sole_winner": None,
-                                "units_paid": 0,
-                                "carryover_before": carry_before,
-                                "reason": reason,
-                                "reason_text": reason_text
-                            })
-
-        # If carryover is disabled, ensure no hole is treated as a carry and
-        # remove any retained bonus_map entries so no units are awarded.
-        if not carryover_on:
-            for rec in hole_results:
-                if rec.get("reason") == REASON_CARRY:
-                    rec["reason"] = REASON_NO_SCORES
-                    # append a note if not already present
-                    rt = rec.get("reason_text", "")
-                    if "carry disabled" not in rt.lower():
-                        rec["reason_text"] = (rt + " - carry disabled").strip()
-                if "bonus_map" in rec:
-                    # remove bonus_map when carry is disabled
-                    rec.pop("bonus_map", None)
-
-        payout_map_units = {name: 0.0 for name in included["Name"].tolist()}
-
-        # Award unconditional gross-based bonuses (birdie=1, eagle=5) to all players
-        # based on preserved `gross_scores`. Bonuses are awarded for ANY under-par score
-        # regardless of whether a skin was won on that hole.
-        if self.bonus_enabled_var.get():
-            hole_to_rec = {rec.get("hole"): rec for rec in hole_results}
-            for idx, prow in included.iterrows():
-                pname = prow.get("Name")
-                for h in range(HOLES):
-                    hole = f"H{h+1}"
-                    try:
-                        gv = gross_scores.at[idx, hole]
-                    except Exception:
-                        gv = None
-                    if gv is None or (isinstance(gv, float) and pd.isna(gv)) or str(gv).strip() == "":
-                        continue
-                    try:
-                        gvi = int(gv)
-                    except Exception:
-                        try:
-                            gvi = int(float(gv))
-                        except Exception:
-                            continue
-                    par_for_hole = pars[h]
-                    bonus = 0
-                    if gvi <= par_for_hole - 2:
-                        bonus = 5
-                    elif gvi == par_for_hole - 1:
-                        bonus = 1
-                    if not bonus:
-                        continue
-
-                    rec = hole_to_rec.get(hole)
-                    # Sole winners already have their birdie/eagle bonus folded into
-                    # units_paid for that hole. Skip the later bonus pass to avoid
-                    # counting the same bonus twice.
-                    if rec is not None and rec.get("sole_winner") == pname:
-                        continue
-
-                    # Award bonus unconditionally for any under-par score
-                    if pname in payout_map_units:
-                        payout_map_units[pname] += float(bonus)
-                    
-                    # Record applied bonus in hole result for reporting
-                    if rec is not None:
-                        rec.setdefault("gross_bonus_map", {})[pname] = int(bonus)
-
-        # Now allocate the standard hole payouts (sole winners and splits).
-        for rec in hole_results:
-            if rec.get("sole_winner"):
-                winner = rec["sole_winner"]
-                units = rec.get("units_paid", 0)
-                if winner in payout_map_units:
-                    payout_map_units[winner] += float(units)
-            else:
-                if rec.get("reason") == REASON_SPLIT and rec.get("tied"):
-                    tied = rec["tied"]
-                    split_units = float(rec.get("units_paid", 0))
-                    share_units = split_units / len(tied) if len(tied) > 0 else 0
-                    for name in tied:
-                        if name in payout_map_units:
-                            payout_map_units[name] += float(share_units)
-
-        carryover_remaining = 0
-        if carryover_on:
-            carry = 0
-            for r in hole_results:
-                if r.get("sole_winner") or r.get("reason") == REASON_SPLIT:
-                    carry = 0
-                else:
-                    if r.get("reason") == REASON_CARRY:
-                        carry += 1
-            carryover_remaining = carry
-
-        if total_purse is not None and total_purse > 0:
-            total_units = sum(payout_map_units.values())
-            per_unit = (total_purse / total_units) if total_units > 0 else 0.0
-        else:
-            per_unit = per_skin_input
-
-        payout_map_amount = {name: round(payout_map_units[name] * per_unit, 2) for name in payout_map_units}
+        def _opt_float(var):
+            try:
+                v = var.get().strip()
+                return float(v) if v != "" else None
+            except Exception:
+                return None
+        return SkinsSettings(
+            use_net=bool(self.use_net_scores.get()),
+            carryover=bool(self.carryover_var.get()),
+            split_ties=bool(self.split_ties.get()),
+            bonus_enabled=bool(self.bonus_enabled_var.get()),
+            per_skin=per_skin_input,
+            total_purse=total_purse,
+            slope=_opt_float(self.slope_var),
+            course_rating=_opt_float(self.course_rating_var),
+        )
+
+    def _flight_pots(self, quiet=False):
+        """{flight: FlightPot} from the Flight Pots field, or {} if it can't be read."""
+        try:
+            return parse_flight_pots(self.flight_pots_var.get())
+        except ValueError as e:
+            if not quiet:
+                skins_diag.error("Error reading flight pots", e)
+            return {}
+
+    def _stroke_index(self, quiet=False):
+        """Stroke index per hole, or None if any entry is not an integer."""
+        try:
+            return [int(v.get()) for v in self.stroke_index_vars]
+        except Exception as e:
+            if self.use_net_scores.get() and not quiet:
+                skins_diag.error("Error applying handicaps", e)
+            return None
+
+    def _start_job(self, label, work, on_done, on_error):
+        """Run work(job) in the background with the progress bar and Cancel button shown."""
+        def finishing(callback):
+            def finish(*args):
+                self._end_job()
+                callback(*args)
+            return finish
+
+        for btn in self.job_buttons:
+            btn.state(["disabled"])
+        self.job_cancel_btn.state(["!disabled"])
+        self.job_status_var.set(f"{label}...")
+        self.job_progress["value"] = 0
+        self.job_progress.grid(row=0, column=7, padx=(20, 5))
+        self.job_status_lbl.grid(row=0, column=8, padx=5)
+        self.job_cancel_btn.grid(row=0, column=9, padx=5)
+        def timed_work(job):
+            with skins_diag.timed(f"{label.lower()} job"):
+                return work(job)
+
+        self.job = BackgroundJob(self.root, timed_work, finishing(on_done), finishing(on_error),
+                                 on_progress=self._job_progress, on_cancel=finishing(lambda: None)).start()
+
+    def _job_progress(self, fraction):
+        self.job_progress["value"] = fraction
+
+    def _end_job(self):
+        self.job = None
+        for w in (self.job_progress, self.job_status_lbl, self.job_cancel_btn):
+            w.grid_remove()
+        for btn in self.job_buttons:
+            btn.state(["!disabled"])
+
+    def cancel_job(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.job_status_var.set("Cancelling...")
+            self.job_cancel_btn.state(["disabled"])
+
+    def save_round(self):
+        """Save the round in progress as a .skins file (fast enough to run on the Tk thread)."""
+        path = self.round_path
+        if path is None:
+            safe_course = ''.join(c for c in (self.course_var.get().strip() or 'course')
+                                  if c.isalnum() or c in (' ', '_', '-')).replace(' ', '_')
+            path = filedialog.asksaveasfilename(
+                defaultextension=".skins", filetypes=SAVED_ROUND_FILETYPES,
+                initialfile=f"BigBoySkins_{safe_course}_{datetime.now().strftime('%Y%m%d')}.skins")
+            if not path:
+                return
+        try:
+            write_round(path, self.collect_round(quiet=True))
+        except Exception as e:
+            messagebox.showerror("Save error", f"Failed to save round: {e}")
+            return
+        self.round_path = path
+        if self.job is None:
+            self.job_status_var.set(f"Saved {os.path.basename(path)}")
+            self.job_status_lbl.grid(row=0, column=8, padx=5)
+            self.root.after(SAVE_NOTE_MS, self._hide_save_note)
 
-        return {
-            "per_skin": per_unit,
-            "payout_map_units": payout_map_units,
-            "payout_map_amount": payout_map_amount,
-            "skins_awarded": skins_awarded,
-            "hole_results": hole_results,
-            "carryover_remaining": carryover_remaining
-        }
+    def _hide_save_note(self):
+        if self.job is None:
+            self.job_status_lbl.grid_remove()
 
    # ...existing code...
     def export_to_excel(self):
-        pars, players = self.collect_data()
-        if len(players) < 2:
+        if self.job is not None:
+            return
+        try:
+            parse_flight_pots(self.flight_pots_var.get())
+        except ValueError as e:
+            messagebox.showwarning("Flight Pots", str(e))
+            return
+        # snapshot everything Tk-owned before handing off to the worker
+        rnd = self.collect_round()
+        if len(rnd.players) < 2:
             messagebox.showwarning("Not enough players", "Enter at least 2 players with names")
             return
 
-        df = pd.DataFrame(players)
-        results = self._compute_skins_and_payouts(pars, df)
-        per_skin = results["per_skin"]
-        payout_units = results["payout_map_units"]
-        payout_amounts = results["payout_map_amount"]
-        hole_results = results.get("hole_results", [])
-        carryover_remaining = results.get("carryover_remaining", 0)
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Big Boy Skins Report"
-        # Leave column A blank to match user's example export (start content in column B)
-        col_off = 1  # number of columns to shift right (1 => start at column B)
-
-        ws.merge_cells(start_row=1, start_column=1 + col_off, end_row=1, end_column=(7 + HOLES) + col_off)
-        hcell = ws.cell(row=1, column=1 + col_off)
-        _course = (self.course_var.get().strip() if hasattr(self, 'course_var') else "")
-        try:
-            _date_str = self.date_entry.get_date().strftime("%Y-%m-%d")
-        except Exception:
-            _date_str = (self.date_var.get().strip() if hasattr(self, 'date_var') else "")
-        if _course and _date_str:
-            hcell.value = f"Big Boy Skins at {_course} — {_date_str}"
-        elif _course:
-            hcell.value = f"Big Boy Skins at {_course}"
-        elif _date_str:
-            hcell.value = f"Big Boy Skins — {_date_str}"
-        else:
-            hcell.value = "Big Boy Skins"
-        hcell.font = Font(size=20, bold=True)
-        hcell.alignment = Alignment(horizontal="center")
-
-        # Metadata (shifted right by col_off)
-        ws.cell(row=2, column=1 + col_off, value="Course:")
-        ws.cell(row=2, column=2 + col_off, value=self.course_var.get().strip())
-        ws.cell(row=3, column=1 + col_off, value="Date:")
-        try:
-            ws.cell(row=3, column=2 + col_off, value=self.date_entry.get_date().strftime("%Y-%m-%d"))
-        except Exception:
-            ws.cell(row=3, column=2 + col_off, value=self.date_var.get().strip())
-        ws.cell(row=2, column=4 + col_off, value="Per-skin $")
-        ws.cell(row=2, column=5 + col_off, value=float(per_skin))
+        safe_course = ''.join(c for c in (rnd.course or 'course') if c.isalnum() or c in (' ', '_', '-')).replace(' ', '_')
+        default_name = f"BigBoySkins_{safe_course}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        path = filedialog.asksaveasfilename(defaultextension=".xlsx", initialfile=default_name,
+                                            filetypes=ROUND_FILETYPES)
+        if not path:
+            return
 
-        tp = self.total_purse_var.get().strip()
-        if tp != "":
+        def work(job):
+            if rnd.is_flighted():
+                return export_flights(job)
+            results = rnd.compute()
+            job.report(0.1)
+            if path.lower().endswith((".csv", ".json")):
+                write_round(path, rnd, results)
+            else:
+                from skins_excel import build_report_workbook
+                wb = build_report_workbook(rnd, results, progress=lambda f: job.report(0.1 + 0.7 * f))
+                # last chance to cancel; once saving starts the file is written in full
+                job.report(0.8)
+                with skins_diag.timed("workbook save"):
+                    wb.save(path)
+            message = f"Report exported to {path}"
             try:
-                ws.cell(row=3, column=4 + col_off, value="Total Purse $")
-                ws.cell(row=3, column=5 + col_off, value=float(tp))
-            except Exception:
-                pass
-
-        ws.cell(row=4, column=4 + col_off, value="Carryover Enabled")
-        ws.cell(row=4, column=5 + col_off, value=str(self.carryover_var.get()))
-
-        start_row = 6
-        headers = ["Name", "HCP", "Included"] + [f"H{i+1}" for i in range(HOLES)] + ["Front9", "Back9", "Units", "Amount$"]
+                with RoundStore(store_path) as store:
+                    # a re-export (e.g. after correcting a score) replaces the stored round
+                    store.save_round(rnd, results)
+            except Exception as e:
+                message += f"\n\nThe round could not be saved to the history database: {e}"
+            return message
+
+        def export_flights(job):
+            # each flight is its own game: scored separately, one overview plus a report per flight
+            from skins_flights import default_jobs, payout_results, score_flights
+            scored = score_flights(rnd, jobs=default_jobs(rnd), progress=lambda f: job.report(0.1 * f))
+            if path.lower().endswith((".csv", ".json")):
+                write_round(path, rnd, payout_results(scored))
+            else:
+                from skins_excel import build_flights_workbook
+                wb = build_flights_workbook(rnd, scored, progress=lambda f: job.report(0.1 + 0.7 * f))
+                job.report(0.8)
+                with skins_diag.timed("workbook save"):
+                    wb.save(path)
+            message = f"Report for {len(scored.flights)} flights exported to {path}"
+            try:
+                with RoundStore(store_path) as store:
+                    store.save_flights(scored)
+            except Exception as e:
+                message += f"\n\nThe flights could not be saved to the history database: {e}"
+            return message
 
-        # thin border for table cells
-        thin = Side(border_style="thin", color="000000")
-        bd = Border(left=thin, right=thin, top=thin, bottom=thin)
+        store_path = self.store_path
+        self._start_job("Exporting", work,
+                        lambda message: messagebox.showinfo("Exported", message),
+                        lambda e: messagebox.showerror("Export error", f"Failed to export: {e}"))
 
-        for c, h in enumerate(headers, start=1):
-            cell = ws.cell(row=start_row, column=c + col_off, value=h)
-            cell.font = Font(bold=True)
-            cell.border = bd
-            if 4 <= c <= 4 + HOLES:
-                cell.alignment = Alignment(horizontal="center")
+    def simulate_payouts(self):
+        """Expected payouts for the included players from their handicaps (Monte Carlo)."""
+        if self.job is not None:
+            return
+        rnd = self.collect_round(quiet=True)
+        names, handicaps, _, _ = rnd.field()
+        if len(names) < 2:
+            messagebox.showwarning("Not enough players", "Enter at least 2 players with names")
+            return
 
-        par_row = start_row + 1
-        si_row = start_row + 2
-        par_fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-        si_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        ws.cell(row=par_row, column=1 + col_off, value="Par").font = Font(bold=True)
-        ws.cell(row=par_row, column=1 + col_off).fill = par_fill
-        ws.cell(row=si_row, column=1 + col_off, value="Stroke Index").font = Font(bold=True)
-        ws.cell(row=si_row, column=1 + col_off).fill = si_fill
+        def work(job):
+            from skins_sim import simulate
+            return simulate(rnd.pars, rnd.stroke_index, rnd.settings, handicaps, rounds=SIM_ROUNDS,
+                            progress=job.report)
+
+        self._start_job("Simulating", work,
+                        lambda result: self._show_simulation(names, handicaps, result),
+                        lambda e: messagebox.showerror("Simulation error", f"Failed to simulate: {e}"))
+
+    def _show_simulation(self, names, handicaps, result):
+        win = tk.Toplevel(self.root)
+        win.title(f"Simulated payouts ({result.rounds:,} rounds)")
+        cols = ("name", "hcp", "units", "units_sd", "amount", "amount_sd", "win")
+        headings = ("Name", "HCP", "Exp. units", "SD", "Exp. $", "SD $", "Top earner %")
+        tree = ttk.Treeview(win, columns=cols, show="headings", height=min(len(names), 25))
+        for col, text in zip(cols, headings):
+            tree.heading(col, text=text)
+            tree.column(col, width=200 if col == "name" else 90, anchor="w" if col == "name" else "e")
+        for i in np.argsort(-result.mean_amount, kind="stable"):
+            tree.insert("", "end", values=(
+                names[i], handicaps[i], f"{result.mean_units[i]:.2f}", f"{np.sqrt(result.var_units[i]):.2f}",
+                f"{result.mean_amount[i]:,.2f}", f"{np.sqrt(result.var_amount[i]):,.2f}",
+                f"{100 * result.win_prob[i]:.1f}"))
+        tree.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+    def compare_rules(self):
+        """What-if table: every player's payout under all 16 rule combinations side by side.
+
+        A flighted round is compared flight by flight, each under its own pot,
+        so flights never tie or carry against each other here either.
+        """
+        from skins_flights import compare_flights
+        rnd = self.collect_round(quiet=True)
+        if len(rnd.included_players()) < 2:
+            messagebox.showwarning("Not enough players", "Enter at least 2 players with names")
+            return
+        variants = compare_flights(rnd)
+        flighted = rnd.is_flighted()
+        names = [p.name for p in rnd.included_players()]
+
+        def label(settings):
+            flags = "".join(ch if getattr(settings, t) else "-"
+                            for ch, t in zip("CSB", RULE_TOGGLES[1:]))
+            return f"{'Net' if settings.use_net else 'Gross'} {flags}"
+
+        def amount(by_flight, name):
+            return sum(res["payout_map_amount"].get(name, 0.0) for res in by_flight.values())
+
+        def carry(by_flight):
+            if not flighted:
+                return by_flight[""]["carryover_remaining"]
+            return " ".join(f"{flight_label(f)}:{res['carryover_remaining']}" for f, res in by_flight.items())
+
+        win = tk.Toplevel(self.root)
+        win.title("Compare rules")
+        cols = ["name"] + [f"v{k}" for k in range(len(variants))]
+        tree = ttk.Treeview(win, columns=cols, show="headings", height=min(len(names) + 2, 30))
+        tree.heading("name", text="Name")
+        tree.column("name", width=180)
+        for k, (settings, _) in enumerate(variants):
+            tree.heading(f"v{k}", text=label(settings) + (" *" if k == 0 else ""))
+            tree.column(f"v{k}", width=85, anchor="e")
+        # payouts are keyed by name, so a repeated name is listed once
+        for name in dict.fromkeys(names):
+            tree.insert("", "end", values=[name] + [f"{amount(by_flight, name):,.2f}" for _, by_flight in variants])
+        tree.insert("", "end", values=["Total paid"] + [
+            f"{sum(sum(res['payout_map_amount'].values()) for res in by_flight.values()):,.2f}"
+            for _, by_flight in variants])
+        tree.insert("", "end", values=["Carry left"] + [carry(by_flight) for _, by_flight in variants])
+        xscroll = ttk.Scrollbar(win, orient="horizontal", command=tree.xview)
+        tree.configure(xscrollcommand=xscroll.set)
+        tree.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 0))
+        xscroll.grid(row=1, column=0, sticky="ew", padx=10)
+        ttk.Label(win, text="C = carryover, S = split ties, B = birdie/eagle bonuses; * = current rules").grid(
+            row=2, column=0, sticky="w", padx=10, pady=(4, 10))
+        win.columnconfigure(0, weight=1)
+        win.rowconfigure(0, weight=1)
+
+    def show_diagnostics(self):
+        """Hidden diagnostics window (Ctrl+Shift+D): operation timings, counters, cache stats, errors."""
+        win = tk.Toplevel(self.root)
+        win.title("Diagnostics")
+        timing_var = tk.BooleanVar(value=skins_diag.ENABLED)
+        memory_var = tk.BooleanVar(value=tracemalloc.is_tracing())
+        text = tk.Text(win, width=100, height=36, font=("Consolas", 10), wrap="none")
+        yscroll = ttk.Scrollbar(win, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=yscroll.set)
+
+        def refresh():
+            text.configure(state="normal")
+            text.delete("1.0", "end")
+            text.insert("end", "\n".join(skins_diag.report_lines()))
+            text.configure(state="disabled")
+
+        def toggle_timing():
+            skins_diag.enable(timing_var.get())
+            refresh()
+
+        def toggle_memory():
+            if memory_var.get():
+                skins_diag.start_tracemalloc()
+            else:
+                skins_diag.stop_tracemalloc()
+            refresh()
 
-        for i in range(HOLES):
-            try:
-                pval = int(pars[i])
-            except Exception:
-                pval = pars[i] if pars[i] is not None else ""
-            cell_par = ws.cell(row=par_row, column=4 + i + col_off, value=pval)
-            cell_par.alignment = Alignment(horizontal="center")
-            cell_par.fill = par_fill
+        def reset():
+            skins_diag.reset()
+            refresh()
 
+        def save_log():
             try:
-                siv = self.stroke_index_vars[i].get()
-            except Exception:
-                siv = ""
-            cell_si = ws.cell(row=si_row, column=4 + i + col_off, value=siv)
-            cell_si.alignment = Alignment(horizontal="center")
-            cell_si.fill = si_fill
-
-        participants = df[df.get("Included") == True]
-        non_participants = df[df.get("Included") == False]
-        write_order = pd.concat([participants, non_participants], ignore_index=True)
-
-        # Data rows start after headers + Par + Stroke Index rows
-        for r, (_, row) in enumerate(write_order.iterrows(), start=start_row + 3):
-            name = row.get("Name", "")
-            included_flag = row.get("Included", False)
-            cell_name = ws.cell(row=r, column=1 + col_off, value=name)
-            cell_name.border = bd
-            hcp = row.get("Handicap", "")
-            cell_hcp = ws.cell(row=r, column=2 + col_off, value=hcp if hcp != "" else None)
-            cell_hcp.border = bd
-            cell_in = ws.cell(row=r, column=3 + col_off, value=included_flag)
-            cell_in.border = bd
-            for i in range(HOLES):
-                v = row.get(f"H{i+1}", "")
-                cell = ws.cell(row=r, column=4 + i + col_off, value=v if v != "" else None)
-                cell.alignment = Alignment(horizontal="center")
-                cell.border = bd
-            cell_f = ws.cell(row=r, column=4 + HOLES + col_off, value=row.get("Front9", ""))
-            cell_f.alignment = Alignment(horizontal="center")
-            cell_f.border = bd
-            cell_b = ws.cell(row=r, column=5 + HOLES + col_off, value=row.get("Back9", ""))
-            cell_b.alignment = Alignment(horizontal="center")
-            cell_b.border = bd
-            units = payout_units.get(name, 0.0)
-            amount = payout_amounts.get(name, 0.0)
-            cell_units = ws.cell(row=r, column=6 + HOLES + col_off, value=units if units != 0 else None)
-            cell_units.border = bd
-            cell_amt = ws.cell(row=r, column=7 + HOLES + col_off, value=round(amount, 2) if amount != 0 else None)
-            cell_amt.number_format = '$#,##0.00'
-            cell_amt.border = bd
-
-        # highlight birdies/eagles (match GUI colors)
-        birdie_fill = PatternFill(start_color="FFF59D", end_color="FFF59D", fill_type="solid")
-        eagle_fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
-        for rr in range(start_row + 3, start_row + 3 + len(write_order)):
-            for hi in range(HOLES):
-                cell = ws.cell(row=rr, column=4 + hi + col_off)
-                if cell.value is None:
-                    continue
-                try:
-                    sv = int(cell.value)
-                except Exception:
-                    continue
-                par_for_hole = pars[hi]
-                if sv == par_for_hole - 1:
-                    cell.fill = birdie_fill
-                elif sv <= par_for_hole - 2:
-                    cell.fill = eagle_fill
-                # ensure hole cells have borders (in case coloring overwrote it visually)
-                try:
-                    cell.border = bd
-                except Exception:
-                    pass
-
-        # Summary section (Skins per hole)
-        summary_row = start_row + 3 + len(write_order) + 2
-        ws.cell(row=summary_row, column=1 + col_off, value="Skins Summary").font = Font(bold=True)
-        ws.cell(row=summary_row, column=1 + col_off).border = bd
-        summary_row += 1
-        ws.cell(row=summary_row, column=1 + col_off, value="Hole").font = Font(bold=True)
-        ws.cell(row=summary_row, column=1 + col_off).border = bd
-        ws.cell(row=summary_row, column=2 + col_off, value="Result").font = Font(bold=True)
-        ws.cell(row=summary_row, column=2 + col_off).border = bd
-        ws.cell(row=summary_row, column=3 + col_off, value="Units Awarded").font = Font(bold=True)
-        ws.cell(row=summary_row, column=3 + col_off).border = bd
-        summary_row += 1
-        for hr in hole_results:
-            bonus_text = self._format_bonus_summary(hr)
-            hole = hr.get("hole", "")
-            if hr.get("sole_winner"):
-                text = f"{hr['sole_winner']}{bonus_text}"
-                units = hr["units_paid"]
-            elif hr.get("tied"):
-                rreason = hr.get("reason")
-                if rreason == REASON_CARRY:
-                    text = hr.get("reason_text", f"Tie ({', '.join(hr.get('tied', []))}) - carryover")
-                    units = 0
-                elif rreason == REASON_SPLIT:
-                    text = f"Tie ({', '.join(hr.get('tied', []))}) - split"
-                    units = hr.get("units_paid", 0)
-                elif rreason == REASON_NO_SCORES:
-                    text = hr.get("reason_text", "No scores")
-                    units = 0
-                else:
-                    text = hr.get("reason_text", "No scores")
-                    units = 0
-                if bonus_text:
-                    text = f"{text}{bonus_text}"
-            else:
-                text = hr.get("reason_text", "No scores")
-                if bonus_text:
-                    text = f"{text}{bonus_text}"
-                units = 0
-            c1 = ws.cell(row=summary_row, column=1 + col_off, value=hole)
-            c1.border = bd
-            c2 = ws.cell(row=summary_row, column=2 + col_off, value=text)
-            c2.border = bd
-            c3 = ws.cell(row=summary_row, column=3 + col_off, value=units)
-            c3.border = bd
-            summary_row += 1
-
-        # Payouts table
-        summary_row += 1
-        ws.cell(row=summary_row, column=1 + col_off, value="Payouts").font = Font(bold=True)
-        ws.cell(row=summary_row, column=1 + col_off).border = bd
-        summary_row += 1
-        ws.cell(row=summary_row, column=1 + col_off, value="Name").font = Font(bold=True)
-        ws.cell(row=summary_row, column=1 + col_off).border = bd
-        ws.cell(row=summary_row, column=2 + col_off, value="Units").font = Font(bold=True)
-        ws.cell(row=summary_row, column=2 + col_off).border = bd
-        ws.cell(row=summary_row, column=3 + col_off, value="Amount$").font = Font(bold=True)
-        ws.cell(row=summary_row, column=3 + col_off).border = bd
-        summary_row += 1
-        for name in participants["Name"].tolist():
-            units = payout_units.get(name, 0.0)
-            amount = payout_amounts.get(name, 0.0)
-            c1 = ws.cell(row=summary_row, column=1 + col_off, value=name)
-            c1.border = bd
-            c2 = ws.cell(row=summary_row, column=2 + col_off, value=round(units, 3) if units != 0 else None)
-            c2.border = bd
-            c3 = ws.cell(row=summary_row, column=3 + col_off, value=round(amount, 2) if amount != 0 else None)
-            c3.number_format = '$#,##0.00'
-            c3.border = bd
-            summary_row += 1
-        if carryover_remaining:
-            ws.cell(row=summary_row, column=1 + col_off, value=f"Carryover units remaining after 18: {carryover_remaining}").font = Font(bold=True)
-            ws.cell(row=summary_row, column=1 + col_off).border = bd
-            summary_row += 1
-
-        # Export Summary sheet (settings + per-player counts)
+                path = skins_diag.write_log()
+            except OSError as e:
+                messagebox.showerror("Diagnostics", f"Could not write the log: {e}", parent=win)
+                return
+            messagebox.showinfo("Diagnostics", f"Saved to {path}", parent=win)
+
+        bar = ttk.Frame(win)
+        bar.grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=(10, 4))
+        ttk.Checkbutton(bar, text="Record timings", variable=timing_var, command=toggle_timing).grid(row=0, column=0, padx=5)
+        ttk.Checkbutton(bar, text="Trace memory", variable=memory_var, command=toggle_memory).grid(row=0, column=1, padx=5)
+        ttk.Button(bar, text="Refresh", command=refresh).grid(row=0, column=2, padx=5)
+        ttk.Button(bar, text="Reset", command=reset).grid(row=0, column=3, padx=5)
+        ttk.Button(bar, text="Save Log", command=save_log).grid(row=0, column=4, padx=5)
+        text.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=(0, 10))
+        yscroll.grid(row=1, column=1, sticky="ns", padx=(0, 10), pady=(0, 10))
+        win.columnconfigure(0, weight=1)
+        win.rowconfigure(1, weight=1)
+        refresh()
+
+    def _set_date(self, val):
         try:
-            summary = wb.create_sheet(title="Export Summary")
-            summary.cell(row=1, column=1 + col_off, value="Setting").font = Font(bold=True)
-            summary.cell(row=1, column=2 + col_off, value="Value").font = Font(bold=True)
-            r = 2
-
-            def srow(k, v):
-                nonlocal r
-                summary.cell(row=r, column=1 + col_off, value=k)
-                summary.cell(row=r, column=2 + col_off, value=v)
-                # add border to summary entries
-                try:
-                    summary.cell(row=r, column=1 + col_off).border = bd
-                    summary.cell(row=r, column=2 + col_off).border = bd
-                except Exception:
-                    pass
-                r += 1
-
-            srow("Course", self.course_var.get().strip())
-            try:
-                srow("Date", self.date_entry.get_date().strftime("%Y-%m-%d"))
-            except Exception:
-                srow("Date", self.date_var.get().strip())
-            srow("Per-skin $", float(per_skin))
-            if tp != "":
-                try:
-                    srow("Total Purse $", float(tp))
-                except Exception:
-                    srow("Total Purse $", tp)
-            srow("Carryover Enabled", str(self.carryover_var.get()))
-            srow("Use Net Scores", str(self.use_net_scores.get()))
-            srow("Bonuses Enabled", str(self.bonus_enabled_var.get()))
-            srow("Split Ties", str(self.split_ties.get()))
-
-            # simple per-player summary
-            participants_df = df[df.get("Included") == True]
-            player_names = participants_df.get("Name").tolist()
-            units_map = results.get("payout_map_units", {})
-            birdie_map = {n: 0 for n in player_names}
-            eagle_map = {n: 0 for n in player_names}
-            for _, prow in participants_df.iterrows():
-                name = prow.get("Name")
-                for i in range(HOLES):
-                    try:
-                        val = prow.get(f"H{i+1}")
-                        if val is None or (isinstance(val, float) and pd.isna(val)) or str(val).strip() == "":
-                            continue
-                        score = int(val)
-                    except Exception:
-                        continue
-                    parv = int(pars[i]) if i < len(pars) else 4
-                    if score == parv - 1:
-                        birdie_map[name] += 1
-                    elif score <= parv - 2:
-                        eagle_map[name] += 1
-
-            r += 1
-            summary.cell(row=r, column=1 + col_off, value="Player").font = Font(bold=True)
-            summary.cell(row=r, column=2 + col_off, value="Total Units").font = Font(bold=True)
-            summary.cell(row=r, column=3 + col_off, value="Birdies").font = Font(bold=True)
-            summary.cell(row=r, column=4 + col_off, value="Eagles").font = Font(bold=True)
-            summary.cell(row=r, column=5 + col_off, value="Amount$").font = Font(bold=True)
-            r += 1
-
-            total_paid = 0.0
-            for name in player_names:
-                u = units_map.get(name, 0.0)
-                amt = payout_amounts.get(name, 0.0)
-                summary.cell(row=r, column=1 + col_off, value=name)
-                summary.cell(row=r, column=2 + col_off, value=float(u) if u != 0 else None)
-                summary.cell(row=r, column=3 + col_off, value=birdie_map.get(name, 0) if birdie_map.get(name, 0) != 0 else None)
-                summary.cell(row=r, column=4 + col_off, value=eagle_map.get(name, 0) if eagle_map.get(name, 0) != 0 else None)
-                cell_amt = summary.cell(row=r, column=5 + col_off, value=round(amt or 0.0, 2))
-                cell_amt.number_format = '$#,##0.00'
-                total_paid += float(amt or 0.0)
-                r += 1
-
-            if total_paid:
-                summary.cell(row=r, column=1 + col_off, value="Total Paid").font = Font(bold=True)
-                cell_total = summary.cell(row=r, column=5 + col_off, value=round(total_paid, 2))
-                cell_total.number_format = '$#,##0.00'
-                cell_total.font = Font(bold=True)
-
+            if isinstance(val, datetime):
+                self.date_entry.set_date(val.date())
+            elif hasattr(val, 'strftime'):
+                self.date_entry.set_date(val)
+            else:
+                self.date_entry.set_date(datetime.strptime(str(val), "%Y-%m-%d").date())
+            return True
         except Exception:
-            # safe to continue even if summary sheet creation failed
-            pass
-
-        for c in range(1, 8 + HOLES):
-            ws.column_dimensions[get_column_letter(c + col_off)].width = 14
+            return False
 
-        safe_course = ''.join(c for c in (self.course_var.get().strip() or 'course') if c.isalnum() or c in (' ', '_', '-')).replace(' ', '_')
-        default_name = f"BigBoySkins_{safe_course}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        path = filedialog.asksaveasfilename(defaultextension=".xlsx", initialfile=default_name,
-                                            filetypes=[("Excel files", "*.xlsx")])
+    def import_from_excel(self):
+        if self.job is not None:
+            return
+        path = filedialog.askopenfilename(filetypes=ROUND_FILETYPES + SAVED_ROUND_FILETYPES)
         if not path:
             return
-        wb.save(path)
-        messagebox.showinfo("Exported", f"Report exported to {path}")
-        
 
-    def import_from_excel(self):
-        path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx")])
-        if not path:
+        def work(job):
+            if path.lower().endswith(".xlsx"):
+                from skins_excel import read_report
+                return read_report(path, progress=job.report)
+            return load_round(path)
+
+        self._start_job("Importing", work, lambda rnd: self._apply_report(rnd, path), self._import_failed)
+
+    def _import_failed(self, e):
+        from skins_excel import ReportFormatError
+        if not isinstance(e, ReportFormatError):
+            messagebox.showerror("Import error", f"Failed to import: {e}")
             return
+        # write a small diagnostic snapshot to help debugging
         try:
-            wb = load_workbook(path, data_only=True)
-            ws = wb.active
+            log_path = os.path.join(os.getcwd(), 'import_error.log')
+            with open(log_path, 'w', encoding='utf-8') as lf:
+                lf.write('Could not find header row. Sheet snapshot (first 20 rows x 10 cols):\n')
+                for rr, row_vals in enumerate(e.snapshot, start=1):
+                    lf.write(f'Row {rr}: ' + '\t'.join(str(v) for v in row_vals) + '\n')
+            messagebox.showerror('Import failed', f'Could not find header row in spreadsheet. See {log_path}')
+        except Exception:
+            messagebox.showerror('Import failed', 'Could not find header row in spreadsheet')
 
-            # read optional Export Summary
-            try:
-                summary_sheet = None
-                for name in wb.sheetnames:
-                    if name.strip().lower() in ("export summary", "export_summary"):
-                        summary_sheet = wb[name]
-                        break
-                if summary_sheet is not None:
-                    def _to_bool(v):
-                        if isinstance(v, bool):
-                            return v
-                        if v is None:
-                            return False
-                        s = str(v).strip().lower()
-                        return s in ("true", "1", "yes")
-                    for row in summary_sheet.iter_rows(values_only=True):
-                        if not row:
-                            continue
-                        # find first non-empty cell in the row (Export Summary may be shifted)
-                        first_cell = None
-                        first_idx = None
-                        for j, cellval in enumerate(row):
-                            try:
-                                if cellval is not None and str(cellval).strip() != "":
-                                    first_cell = cellval
-                                    first_idx = j
-                                    break
-                            except Exception:
-                                continue
-                        if first_cell is None:
-                            continue
-                        key = str(first_cell).strip().lower()
-                        val = row[first_idx + 1] if (first_idx is not None and len(row) > first_idx + 1) else None
-                        try:
-                            if "per-skin" in key:
-                                self.per_skin_var.set(str(val))
-                            elif "total purse" in key:
-                                self.total_purse_var.set(str(val))
-                            elif "carryover" in key:
-                                self.carryover_var.set(_to_bool(val))
-                            elif "use net" in key:
-                                self.use_net_scores.set(_to_bool(val))
-                            elif "split ties" in key:
-                                self.split_ties.set(_to_bool(val))
-                            elif key == "course":
-                                self.course_var.set(str(val))
-                            elif key == "date" and val is not None:
-                                try:
-                                    if hasattr(val, 'strftime'):
-                                        self.date_entry.set_date(val)
-                                    else:
-                                        self.date_entry.set_date(datetime.strptime(str(val), "%Y-%m-%d").date())
-                                except Exception:
-                                    self.date_var.set(str(val))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+    def _apply_report(self, rnd, path=None):
+        """Load a read_report() Round into the Tk variables and player table (main thread).
 
-            # find header row with "Name" (search first 50 rows × first 10 columns)
-            def _norm(v):
-                if v is None:
-                    return ""
-                s = str(v)
-                # remove common invisible/formatting chars
-                for ch in ('\ufeff', '\u200b', '\u2060', '\u00a0'):
-                    s = s.replace(ch, '')
-                return s.strip().lower()
-
-            hr = None
-            header_col = 1
-            for r in range(1, 51):
-                for c in range(1, 11):
-                    try:
-                        val = ws.cell(row=r, column=c).value
-                    except Exception:
-                        val = None
-                    if _norm(val).find('name') != -1 or _norm(val).find('player') != -1:
-                        hr = r
-                        header_col = c
-                        break
-                if hr is not None:
-                    break
-
-            if hr is None:
-                # write a small diagnostic snapshot to help debugging
-                try:
-                    log_path = os.path.join(os.getcwd(), 'import_error.log')
-                    with open(log_path, 'w', encoding='utf-8') as lf:
-                        lf.write('Could not find header row. Sheet snapshot (first 20 rows x 10 cols):\n')
-                        for rr in range(1, 21):
-                            row_vals = []
-                            for cc in range(1, 11):
-                                try:
-                                    row_vals.append(str(ws.cell(row=rr, column=cc).value))
-                                except Exception:
-                                    row_vals.append('')
-                            lf.write(f'Row {rr}: ' + '\t'.join(row_vals) + '\n')
-                    messagebox.showerror('Import failed', f'Could not find header row in spreadsheet. See {log_path}')
-                except Exception:
-                    messagebox.showerror('Import failed', 'Could not find header row in spreadsheet')
-                return
+        Only once the round is fully loaded does Save Round (Ctrl+S) switch to
+        `path` (when it is a .skins file), so a failed or cancelled import
+        never points a later save at the file that could not be opened.
+        """
+        def num_text(v):
+            return "" if v is None else f"{v:g}"
 
-            rows = []
-            r = hr + 1
-
-            # Detect optional Par row
-            first_label = ws.cell(row=r, column=header_col).value
-            if isinstance(first_label, str) and first_label.strip().lower() == "par":
-                for i in range(HOLES):
-                    try:
-                        val = ws.cell(row=r, column=header_col + 3 + i).value
-                        if val is None:
-                            self.par_vars[i].set("4")
-                        else:
-                            self.par_vars[i].set(str(int(val)) if isinstance(val, (int, float)) else str(val))
-                    except Exception:
-                        self.par_vars[i].set("4")
-                r += 1
-
-            # Detect optional Stroke Index row
-            second_label = ws.cell(row=r, column=header_col).value
-            if isinstance(second_label, str) and second_label.strip().lower() in ("stroke index", "stroke_index", "si"):
-                for i in range(HOLES):
-                    try:
-                        val = ws.cell(row=r, column=header_col + 3 + i).value
-                        if val is None:
-                            self.stroke_index_vars[i].set(str(i+1))
-                        else:
-                            self.stroke_index_vars[i].set(str(val))
-                    except Exception:
-                        self.stroke_index_vars[i].set(str(i+1))
-                r += 1
-
-            def _is_bool_like(val):
-                if isinstance(val, bool):
-                    return True
-                if isinstance(val, (int, float)) and val in (0, 1):
-                    return True
-                try:
-                    s = str(val).strip().lower()
-                    if s in ("true", "false", "1", "0", "yes", "no"):
-                        return True
-                except Exception:
-                    pass
-                return False
-
-            hole_col_start = header_col + 3
-            def _row_has_scores(ws_obj, row_idx):
-                for i in range(HOLES):
-                    v = ws_obj.cell(row=row_idx, column=hole_col_start + i).value
-                    if v is None:
-                        continue
-                    if isinstance(v, (int, float)):
-                        return True
-                    if str(v).strip() != "":
-                        return True
-                return False
-
-            while True:
-                name = ws.cell(row=r, column=header_col).value
-                if name is None:
-                    break
-                if isinstance(name, str) and name.strip().lower() in ("skins summary", "payouts"):
-                    break
-                included_cell = ws.cell(row=r, column=header_col + 2).value
-                hcp_cell = ws.cell(row=r, column=header_col + 1).value
-                if not (_is_bool_like(included_cell) or _row_has_scores(ws, r) or (hcp_cell is not None and str(hcp_cell).strip() != "")):
-                    break
-                included = included_cell
-                entry = {"Name": str(name), "Included": bool(included)}
-                hcp = ws.cell(row=r, column=header_col + 1).value
-                entry["Handicap"] = hcp if hcp is not None else "0"
-                for i in range(HOLES):
-                    entry[f"H{i+1}"] = ws.cell(row=r, column=hole_col_start + i).value
-                entry["Front9"] = ws.cell(row=r, column=hole_col_start + HOLES).value
-                entry["Back9"] = ws.cell(row=r, column=hole_col_start + HOLES + 1).value
-                rows.append(entry)
-                r += 1
-
-            for p in self.players:
-                p.destroy()
-            self.players = []
-            for i, row in enumerate(rows):
-                pr = PlayerRow(self.player_inner, i, self)
-                pr.load_from_dict(row)
-                self.players.append(pr)
-            while len(self.players) < 2:
-                self.add_player()
+        try:
+            # settings from the optional Export Summary sheet
+            settings = rnd.settings
+            if settings is not None:
+                self.carryover_var.set(settings.carryover)
+                self.use_net_scores.set(settings.use_net)
+                self.split_ties.set(settings.split_ties)
+                self.bonus_enabled_var.set(settings.bonus_enabled)
+                self.per_skin_var.set(num_text(settings.per_skin))
+                self.total_purse_var.set(num_text(settings.total_purse))
+                self.slope_var.set(num_text(settings.slope))
+                self.course_rating_var.set(num_text(settings.course_rating))
+            self.flight_pots_var.set(flight_pots_text(rnd.flight_pots))
+
+            for i, par in enumerate(rnd.pars):
+                self.par_vars[i].set(str(par))
+            if rnd.stroke_index is not None:
+                for i, si in enumerate(rnd.stroke_index):
+                    self.stroke_index_vars[i].set(str(si))
+
+            self.table.clear()
+            for p in rnd.players:
+                i = self.table.add(p.name, "0" if p.handicap is None else str(p.handicap), p.included, p.flight)
+                self.table.scores[i] = p.scores
+            while len(self.table) < 2:
+                self.table.add()
+            self._set_top_row(0)
+            self.schedule_live_refresh(reload=True)
             # adjust height after import so all imported rows are visible
             try:
                 self._adjust_height()
@@ -1348,31 +1391,27 @@ class BigBoySkinsApp:
                 pass
 
             # import metadata (respect detected header column)
-            try:
-                course = ws.cell(row=2, column=header_col + 1).value
-                date_val = ws.cell(row=3, column=header_col + 1).value
-                if course:
-                    self.course_var.set(str(course))
-                if isinstance(date_val, datetime):
-                    try:
-                        self.date_entry.set_date(date_val.date())
-                    except:
-                        pass
-                else:
-                    try:
-                        self.date_entry.set_date(datetime.strptime(str(date_val), "%Y-%m-%d").date())
-                    except:
-                        pass
-            except:
-                pass
-
+            if rnd.course:
+                self.course_var.set(rnd.course)
+            if rnd.date != "" and not self._set_date(rnd.date):
+                self.date_var.set(str(rnd.date))
+
+            self.round_path = path if path is not None and path.lower().endswith(".skins") else None
+            # the imported round keeps its identity; older files without one get a new id
+            self.round_id = rnd.round_id or new_round_id()
+            self._round_id_for = None
             messagebox.showinfo("Imported", "Contest imported successfully")
         except Exception as e:
             messagebox.showerror("Import error", f"Failed to import: {e}")
 
 
 def main():
+    # flight scoring uses a process pool; a frozen build must not rerun the GUI in its workers
+    multiprocessing.freeze_support()
+    startup = StartupReport("--startup-report" in sys.argv[1:] or bool(os.environ.get(STARTUP_REPORT_ENV)))
+    startup.mark("imports")
     root = tk.Tk()
+    startup.mark("Tk window")
     try:
         icon_path = get_app_icon_path()
         if os.path.exists(icon_path):
@@ -1384,6 +1423,8 @@ def main():
         pass
     root.geometry("2040x700")
     app = BigBoySkinsApp(root)
+    startup.mark("build GUI")
+    root.after_idle(app.after_first_paint, startup)
     root.mainloop()
 
 
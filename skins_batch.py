@@ -0,0 +1,217 @@
+"""Headless batch re-scoring of Big Boy Skins reports.
+
+    python skins_batch.py SEASON_DIR --out-dir rescored --no-carryover
+    python skins_batch.py SEASON_DIR --summary season.json
+    python skins_batch.py SEASON_DIR --out-dir rescored --format json
+
+Every report workbook (or CSV saved from the report sheet, or native round
+.csv/.json/.skins file) in the folder is parsed, re-scored with the skins engine
+under the report's own settings plus any rule flags given here, and written
+out as a fresh report or round file and/or one consolidated JSON/CSV
+summary. A flighted round is scored one game per flight under its Flight
+Pots, as skins_flights does. Files are spread over a process pool.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+
+from skins_engine import SkinsSettings
+from skins_excel import build_flights_workbook, build_report_workbook
+from skins_flights import payout_results, score_flights
+from skins_formats import load_round, write_round
+
+
+REPORT_SUFFIXES = (".xlsx", ".csv", ".json", ".skins")
+OUTPUT_FORMATS = ("xlsx", "csv", "json", "skins")
+SUMMARY_FIELDS = ["file", "course", "date", "name", "units", "amount", "flight"]
+
+
+def find_reports(directory):
+    """Report files directly inside `directory`, sorted; Excel lock files are skipped."""
+    return sorted(
+        os.path.join(directory, f) for f in os.listdir(directory)
+        if f.lower().endswith(REPORT_SUFFIXES) and not f.startswith("~$")
+    )
+
+
+def output_names(paths, out_format):
+    """File name written to --out-dir for each input: the stem plus `out_format`.
+
+    Inputs sharing a stem (r0.xlsx and r0.csv) keep their own suffix in the
+    name, r0_xlsx.csv and r0_csv.csv, so neither overwrites the other.
+    """
+    stems = [os.path.splitext(os.path.basename(p)) for p in paths]
+    shared = {stem for stem, _ in stems if sum(s == stem for s, _ in stems) > 1}
+    return [f"{stem}_{ext.lstrip('.').lower()}.{out_format}" if stem in shared else f"{stem}.{out_format}"
+            for stem, ext in stems]
+
+
+def rescore_file(path, overrides=None, out_dir=None, out_format="xlsx", out_name=None):
+    """Re-score one report; returns a JSON-ready record (with "error" set if it could not be read).
+
+    `overrides` maps SkinsSettings field names to values that replace the
+    report's own settings; `out_format` is one of OUTPUT_FORMATS and
+    `out_name` the file written to `out_dir` (default: the input's stem
+    plus `out_format`). Runs in a worker process, so it takes and returns
+    plain data only.
+    """
+    record = {"file": os.path.basename(path)}
+    out_path = None
+    if out_dir is not None:
+        out_path = os.path.join(out_dir, out_name or output_names([path], out_format)[0])
+    try:
+        record.update(_rescore(path, overrides or {}, out_path, out_format))
+    except Exception as e:
+        # one unreadable workbook should not sink the whole season
+        record["error"] = str(e)
+    return record
+
+
+def _rescore(path, overrides, out_path, out_format):
+    rnd = load_round(path)
+    rnd.settings = replace(rnd.settings or SkinsSettings(), **overrides)
+    if rnd.is_flighted():
+        return _rescore_flights(rnd, out_path, out_format)
+    results = rnd.compute()
+    record = {}
+    if out_path is not None:
+        record["output"] = out_path
+        if out_format == "xlsx":
+            build_report_workbook(rnd, results).save(record["output"])
+        else:
+            write_round(record["output"], rnd, results)
+    record.update({
+        "course": rnd.course,
+        "date": rnd.date_text(),
+        "settings": asdict(rnd.settings),
+        "per_skin": results["per_skin"],
+        "payouts": [
+            {"name": p.name,
+             "units": results["payout_map_units"].get(p.name, 0.0),
+             "amount": results["payout_map_amount"].get(p.name, 0.0)}
+            for p in rnd.included_players()
+        ],
+        "carryover_remaining": results["carryover_remaining"],
+        "hole_results": results["hole_results"],
+    })
+    return record
+
+
+def _rescore_flights(rnd, out_path, out_format):
+    """_rescore() for a flighted round: each flight is its own game, with its own per-skin, carry and holes."""
+    # already in a worker process, so the flights are scored in this one
+    scored = score_flights(rnd)
+    record = {}
+    if out_path is not None:
+        record["output"] = out_path
+        if out_format == "xlsx":
+            build_flights_workbook(rnd, scored).save(record["output"])
+        else:
+            write_round(record["output"], rnd, payout_results(scored))
+    record.update({
+        "course": rnd.course,
+        "date": rnd.date_text(),
+        "settings": asdict(rnd.settings),
+        "payouts": [
+            {"name": p.name,
+             "units": res["payout_map_units"].get(p.name, 0.0),
+             "amount": res["payout_map_amount"].get(p.name, 0.0),
+             "flight": flight}
+            for flight, frnd, res in zip(scored.flights, scored.flight_rounds, scored.flight_results)
+            for p in frnd.included_players()
+        ],
+        "flights": [
+            {"flight": flight,
+             "settings": asdict(frnd.settings),
+             "per_skin": res["per_skin"],
+             "carryover_remaining": res["carryover_remaining"],
+             "hole_results": res["hole_results"]}
+            for flight, frnd, res in zip(scored.flights, scored.flight_rounds, scored.flight_results)
+        ],
+    })
+    return record
+
+
+def rescore_folder(directory, overrides=None, out_dir=None, jobs=None, out_format="xlsx"):
+    """rescore_file() for every report in `directory`, in file order.
+
+    Raises ValueError, before anything is written, when an output would
+    replace one of the input files (--out-dir is the input folder).
+    """
+    paths = find_reports(directory)
+    names = output_names(paths, out_format)
+    if out_dir is not None:
+        inputs = {os.path.normcase(os.path.realpath(p)) for p in paths}
+        clobbered = [n for n in names if os.path.normcase(os.path.realpath(os.path.join(out_dir, n))) in inputs]
+        if clobbered:
+            raise ValueError(f"writing to {out_dir} would overwrite the input file(s) {', '.join(clobbered)}; "
+                             f"choose another --out-dir or --format")
+        os.makedirs(out_dir, exist_ok=True)
+    if jobs == 1 or len(paths) < 2:
+        return [rescore_file(p, overrides, out_dir, out_format, n) for p, n in zip(paths, names)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(rescore_file, p, overrides, out_dir, out_format, n) for p, n in zip(paths, names)]
+        return [f.result() for f in futures]
+
+
+def write_summary(records, path):
+    """Write the records as JSON, or as one CSV row per player when `path` ends in .csv."""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, restval="")
+            writer.writeheader()
+            for rec in records:
+                for p in rec.get("payouts", []):
+                    writer.writerow({"file": rec["file"], "course": rec["course"], "date": rec["date"], **p})
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=2, default=str)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Re-score a folder of Big Boy Skins reports.")
+    parser.add_argument("directory", help="folder of report .xlsx (or .csv/.json/.skins round) files")
+    parser.add_argument("--out-dir", help="write a re-scored report per input file here")
+    parser.add_argument("--format", dest="out_format", choices=OUTPUT_FORMATS, default="xlsx",
+                        help="file type written to --out-dir (default: xlsx)")
+    parser.add_argument("--summary", help="write a consolidated summary (.json, or .csv for one row per player)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    rules = parser.add_argument_group("rule overrides (default: keep each report's own settings)")
+    rules.add_argument("--net", dest="use_net", action=argparse.BooleanOptionalAction, default=None)
+    rules.add_argument("--carryover", action=argparse.BooleanOptionalAction, default=None)
+    rules.add_argument("--split-ties", action=argparse.BooleanOptionalAction, default=None)
+    rules.add_argument("--bonus", dest="bonus_enabled", action=argparse.BooleanOptionalAction, default=None)
+    rules.add_argument("--per-skin", type=float, default=None)
+    rules.add_argument("--total-purse", type=float, default=None)
+    rules.add_argument("--slope", type=float, default=None)
+    rules.add_argument("--course-rating", type=float, default=None)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not args.out_dir and not args.summary:
+        print("nothing to write: give --out-dir and/or --summary", file=sys.stderr)
+        return 2
+    overrides = {k: v for k, v in vars(args).items()
+                 if k in SkinsSettings.__dataclass_fields__ and v is not None}
+    try:
+        records = rescore_folder(args.directory, overrides, args.out_dir, args.jobs, args.out_format)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if args.summary:
+        write_summary(records, args.summary)
+    failed = [r for r in records if "error" in r]
+    for r in failed:
+        print(f"{r['file']}: {r['error']}", file=sys.stderr)
+    print(f"Re-scored {len(records) - len(failed)} of {len(records)} reports")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""Benchmarks for the scoring pipeline on synthetic rounds.
+
+Times the GUI's hot paths at several field sizes: parsing a pasted/typed
+scorecard block, scoring a round (with the result cache cleared), building
+and saving the Excel report, and reading it back. A season of rounds, each
+with its own field drawn from a club roster, goes through the same four
+stages one round at a time, and is also scored in one batch_units call.
+Each stage reports its best wall time over --repeat runs (--season-repeat
+for the season) and its peak traced memory (from one extra run under
+tracemalloc).
+
+    python skins_bench.py
+    python skins_bench.py --players 4 40 --save baseline.json
+    python skins_bench.py --compare baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import numpy as np
+
+from skins_engine import HOLES, MAX_HOLE_SCORE, MISSING_SCORE, RESULT_CACHE, SkinsSettings, allocate_strokes
+from skins_excel import build_report_workbook, read_report
+from skins_model import Player, Round, parse_score_block
+from skins_sim import SCORE_MODEL_OFFSETS, SCORE_MODEL_PROBS
+
+
+DEFAULT_PLAYERS = (4, 40, 400, 4000)
+SEASON_ROUNDS = 1000
+SEASON_PLAYERS = 40
+# the season's fields are drawn from a club this many times the field size
+SEASON_CLUB_FACTOR = 3
+SEASON_START = date(2026, 4, 1)
+SEASON_DAYS = 180
+DEFAULT_PARS = [4, 4, 3, 5, 4, 4, 3, 4, 5, 4, 3, 4, 5, 4, 4, 3, 5, 4]
+# a benchmark this much slower than its baseline counts as a regression
+REGRESSION_RATIO = 1.25
+# ...and at least this many seconds slower, so timer noise on tiny stages is ignored
+REGRESSION_MIN_SECONDS = 0.002
+
+
+def score_model_probs(birdie_rate):
+    """SCORE_MODEL_PROBS with the one-under share set to `birdie_rate`, the rest rescaled."""
+    probs = SCORE_MODEL_PROBS.copy()
+    birdie = int(np.flatnonzero(SCORE_MODEL_OFFSETS == -1)[0])
+    others = np.arange(len(probs)) != birdie
+    probs[others] *= (1.0 - birdie_rate) / probs[others].sum()
+    probs[birdie] = birdie_rate
+    return probs
+
+
+def synthetic_scores(rng, handicaps, rounds=None, birdie_rate=0.15, missing_rate=0.02, pars=DEFAULT_PARS):
+    """int8 ([rounds x] players x holes) gross scores for a field, MISSING_SCORE where a score is blank."""
+    si = range(1, HOLES + 1)
+    net_par = np.asarray(pars, dtype=np.int16) + allocate_strokes(np.asarray(handicaps), si)
+    shape = net_par.shape if rounds is None else (rounds,) + net_par.shape
+    offsets = rng.choice(SCORE_MODEL_OFFSETS, size=shape, p=score_model_probs(birdie_rate))
+    gross = np.clip(net_par + offsets, 1, MAX_HOLE_SCORE).astype(np.int8)
+    gross[rng.random(shape) < missing_rate] = MISSING_SCORE
+    return gross
+
+
+def synthetic_round(players, seed=0, max_handicap=30, birdie_rate=0.15, missing_rate=0.02, settings=None):
+    """A Round of `players` with handicaps spread uniformly over 0..max_handicap."""
+    rng = np.random.default_rng(seed)
+    handicaps = rng.integers(0, max_handicap + 1, players)
+    gross = synthetic_scores(rng, handicaps, birdie_rate=birdie_rate, missing_rate=missing_rate)
+    field = [Player(f"Player {i:04d}", int(h), True, row) for i, (h, row) in enumerate(zip(handicaps, gross))]
+    return Round(DEFAULT_PARS, list(range(1, HOLES + 1)), settings or SkinsSettings(use_net=True), field,
+                 course="Synthetic National", date="2026-05-01")
+
+
+def scorecard_text(rnd):
+    """The round as a tab-delimited block, the way it arrives from a paste or the grid's entries."""
+    lines = []
+    for p in rnd.players:
+        scores = ["" if s == MISSING_SCORE else str(s) for s in p.scores.tolist()]
+        lines.append("\t".join([p.name, str(p.handicap)] + scores))
+    return "\n".join(lines)
+
+
+def measure(fn, repeat):
+    """(best wall seconds over `repeat` runs, peak traced bytes of one more run)."""
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def round_benchmarks(players, repeat, tmpdir, **model):
+    """{stage: (seconds, peak bytes)} for one synthetic round of `players`."""
+    rnd = synthetic_round(players, **model)
+    text = scorecard_text(rnd)
+    path = os.path.join(tmpdir, f"bench_{players}.xlsx")
+    results = rnd.compute()
+
+    def compute():
+        RESULT_CACHE.clear()
+        rnd.compute()
+
+    def export():
+        build_report_workbook(rnd, results).save(path)
+
+    out = {
+        "parse": measure(lambda: parse_score_block(text), repeat),
+        "compute": measure(compute, repeat),
+        "export": measure(export, repeat),
+    }
+    out["import"] = measure(lambda: read_report(path), repeat)
+    return out
+
+
+def season_rounds(rounds, players, seed=0, max_handicap=30, birdie_rate=0.15, missing_rate=0.02):
+    """`rounds` synthetic Rounds of `players`, each with its own field, date and scores.
+
+    Fields are drawn from a club of SEASON_CLUB_FACTOR x `players` members
+    whose handicaps are spread uniformly over 0..max_handicap.
+    """
+    rng = np.random.default_rng(seed)
+    handicaps = rng.integers(0, max_handicap + 1, SEASON_CLUB_FACTOR * players)
+    out = []
+    for k in range(rounds):
+        field = np.sort(rng.choice(len(handicaps), players, replace=False))
+        gross = synthetic_scores(rng, handicaps[field], birdie_rate=birdie_rate, missing_rate=missing_rate)
+        out.append(Round(
+            DEFAULT_PARS, list(range(1, HOLES + 1)), SkinsSettings(use_net=True),
+            [Player(f"Member {m:04d}", int(handicaps[m]), True, row) for m, row in zip(field, gross)],
+            course="Synthetic National", date=(SEASON_START + timedelta(days=k % SEASON_DAYS)).isoformat()))
+    return out
+
+
+def season_benchmarks(rounds, players, repeat, tmpdir, seed=0, max_handicap=30, birdie_rate=0.15,
+                      missing_rate=0.02):
+    """{stage: (seconds, peak bytes)} for a season of `rounds` rounds of `players`.
+
+    parse/compute/export/import run every round through the same path as
+    round_benchmarks(), one after another; batch scores the season's scores
+    in one batch_units call, the simulator's primitive, on one field's handicaps.
+    """
+    rnds = season_rounds(rounds, players, seed, max_handicap, birdie_rate, missing_rate)
+    texts = [scorecard_text(rnd) for rnd in rnds]
+    paths = [os.path.join(tmpdir, f"season_{k:04d}.xlsx") for k in range(rounds)]
+    results = [rnd.compute() for rnd in rnds]
+
+    def parse():
+        for text in texts:
+            parse_score_block(text)
+
+    def compute():
+        RESULT_CACHE.clear()
+        for rnd in rnds:
+            rnd.compute()
+
+    def export():
+        for rnd, res, path in zip(rnds, results, paths):
+            build_report_workbook(rnd, res).save(path)
+
+    def import_():
+        for path in paths:
+            read_report(path)
+
+    engine = rnds[0].engine()
+    handicaps = [p.handicap for p in rnds[0].players]
+    gross = np.stack([rnd.score_matrix()[0] for rnd in rnds])
+
+    def batch():
+        engine.batch_amounts(engine.batch_units(handicaps, gross))
+
+    out = {"parse": measure(parse, repeat), "compute": measure(compute, repeat), "export": measure(export, repeat)}
+    out["import"] = measure(import_, repeat)
+    out["batch"] = measure(batch, repeat)
+    return out
+
+
+def run(player_counts=DEFAULT_PLAYERS, season_rounds=SEASON_ROUNDS, season_players=SEASON_PLAYERS,
+        repeat=3, progress=None, season_repeat=1, **model):
+    """{"name": (seconds, peak bytes)} for every benchmark.
+
+    Names look like "compute/40" for one round and "compute/1000x40" for a season.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stages = [(str(n), lambda n=n: round_benchmarks(n, repeat, tmpdir, **model)) for n in player_counts]
+        if season_rounds:
+            stages.append((f"{season_rounds}x{season_players}", lambda: season_benchmarks(
+                season_rounds, season_players, season_repeat, tmpdir, **model)))
+        for size, bench in stages:
+            for stage, value in bench().items():
+                results[f"{stage}/{size}"] = value
+                if progress is not None:
+                    progress(f"{stage}/{size}", value)
+    return results
+
+
+def save_baseline(path, results):
+    data = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "results": {name: {"seconds": s, "peak_bytes": peak} for name, (s, peak) in results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def compare(results, baseline, ratio=REGRESSION_RATIO):
+    """[(name, seconds, baseline seconds)] for benchmarks more than `ratio` times slower than baseline."""
+    base = {name: b["seconds"] for name, b in baseline["results"].items()}
+    return [(name, s, base[name]) for name, (s, _) in results.items()
+            if name in base and s > ratio * base[name] and s - base[name] > REGRESSION_MIN_SECONDS]
+
+
+def _format(name, value):
+    seconds, peak = value
+    return f"{name:<20} {1000 * seconds:>10.2f} ms {peak / 2 ** 20:>9.2f} MiB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parsing, scoring, export and import.")
+    parser.add_argument("--players", type=int, nargs="+", default=list(DEFAULT_PLAYERS))
+    parser.add_argument("--season-rounds", type=int, default=SEASON_ROUNDS, help="0 skips the season")
+    parser.add_argument("--season-players", type=int, default=SEASON_PLAYERS)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the best is kept")
+    parser.add_argument("--season-repeat", type=int, default=1, help="runs per season stage")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-handicap", type=int, default=30)
+    parser.add_argument("--birdie-rate", type=float, default=0.15)
+    parser.add_argument("--missing-rate", type=float, default=0.02)
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="flag benchmarks slower than this baseline")
+    parser.add_argument("--ratio", type=float, default=REGRESSION_RATIO,
+                        help=f"slowdown that counts as a regression (default {REGRESSION_RATIO})")
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':<20} {'wall':>13} {'peak':>13}")
+    results = run(args.players, args.season_rounds, args.season_players, args.repeat,
+                  progress=lambda name, value: print(_format(name, value), flush=True),
+                  season_repeat=args.season_repeat, seed=args.seed, max_handicap=args.max_handicap, birdie_rate=args.birdie_rate,
+                  missing_rate=args.missing_rate)
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            slower = compare(results, json.load(f), args.ratio)
+        for name, s, base in slower:
+            print(f"REGRESSION {name}: {1000 * s:.2f} ms vs {1000 * base:.2f} ms baseline "
+                  f"({s / base:.2f}x)", file=sys.stderr)
+        if slower:
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
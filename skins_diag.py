@@ -0,0 +1,165 @@
+"""Lightweight timers, counters and error log for the hot paths.
+
+Off by default. While off, `timed()` hands back one shared no-op context
+manager and `count()` returns after a single flag test, so instrumented code
+pays well under a microsecond per call. Turn it on with enable(), the
+BIGBOYSKINS_DIAG environment variable, or the GUI's diagnostics window
+(Ctrl+Shift+D).
+
+    with timed("workbook save"):
+        wb.save(path)
+
+    @instrumented("workbook build")
+    def build_report_workbook(rnd, results, progress=None): ...
+
+Errors passed to error() are kept (the last ERROR_LOG_SIZE of them) whether
+or not timing is on. No Tk here; worker threads and processes may record.
+"""
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from datetime import datetime
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import traceback
+
+
+DIAG_ENV = "BIGBOYSKINS_DIAG"
+# how many recent operation timings and errors are kept
+TIMING_LOG_SIZE = 200
+ERROR_LOG_SIZE = 50
+DEFAULT_LOG_PATH = os.path.join(os.path.expanduser("~"), "BigBoySkins_diagnostics.txt")
+
+ENABLED = bool(os.environ.get(DIAG_ENV))
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_recent = deque(maxlen=TIMING_LOG_SIZE)
+_errors = deque(maxlen=ERROR_LOG_SIZE)
+# name -> [calls, total seconds, max seconds]
+_totals = defaultdict(lambda: [0, 0.0, 0.0])
+_counters = defaultdict(int)
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            _recent.append((datetime.now(), self.name, elapsed, exc_type is None))
+            total = _totals[self.name]
+            total[0] += 1
+            total[1] += elapsed
+            if elapsed > total[2]:
+                total[2] = elapsed
+        return False
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = bool(on)
+
+
+def timed(name):
+    """Context manager that records how long its block took under `name` (no-op while disabled)."""
+    return _Timer(name) if ENABLED else _NULL
+
+
+def instrumented(name):
+    """Decorator form of timed() for whole functions."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with _Timer(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, n=1):
+    if ENABLED:
+        with _lock:
+            _counters[name] += n
+
+
+def error(context, exc):
+    """Keep an exception for the diagnostics view and print it, as the GUI always did."""
+    with _lock:
+        _errors.append((datetime.now(), context, "".join(traceback.format_exception_only(type(exc), exc)).strip()))
+    if sys.stderr is not None:
+        print(f"{context}:", exc, file=sys.stderr)
+
+
+def reset():
+    with _lock:
+        _recent.clear()
+        _errors.clear()
+        _totals.clear()
+        _counters.clear()
+
+
+def start_tracemalloc(frames=1):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def stop_tracemalloc():
+    tracemalloc.stop()
+
+
+def memory_lines(limit=10):
+    """Current/peak traced memory and the top allocation sites, or a hint when tracing is off."""
+    if not tracemalloc.is_tracing():
+        return ["tracemalloc is off"]
+    current, peak = tracemalloc.get_traced_memory()
+    lines = [f"traced {current / 2 ** 20:.2f} MiB now, {peak / 2 ** 20:.2f} MiB peak"]
+    for stat in tracemalloc.take_snapshot().statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d}x  {frame.filename}:{frame.lineno}")
+    return lines
+
+
+def report_lines(recent=50):
+    """Text report: per-operation totals, counters, result cache, recent timings and errors."""
+    with _lock:
+        totals = sorted(_totals.items(), key=lambda kv: -kv[1][1])
+        counters = sorted(_counters.items())
+        timings = list(_recent)[-recent:]
+        errors = list(_errors)
+    lines = [f"Instrumentation {'on' if ENABLED else 'off'}", "",
+             f"{'operation':<24} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+    for name, (calls, total, worst) in totals:
+        lines.append(f"{name:<24} {calls:>7} {1000 * total:>10.2f} {1000 * total / calls:>9.3f} {1000 * worst:>9.3f}")
+    if counters:
+        lines += ["", "counters"] + [f"  {name:<22} {n:>9}" for name, n in counters]
+    # imported here: the engine imports this module
+    from skins_engine import RESULT_CACHE
+    stats = RESULT_CACHE.stats()
+    lines += ["", "result cache  " + "  ".join(f"{k} {v}" for k, v in stats.items())]
+    lines += ["", "memory"] + memory_lines()
+    lines += ["", f"last {len(timings)} operations"]
+    for when, name, elapsed, ok in reversed(timings):
+        lines.append(f"  {when:%H:%M:%S.%f}"[:-3] + f"  {name:<24} {1000 * elapsed:>10.2f} ms{'' if ok else '  FAILED'}")
+    lines += ["", f"errors ({len(errors)})"]
+    for when, context, text in reversed(errors):
+        lines.append(f"  {when:%Y-%m-%d %H:%M:%S}  {context}: {text}")
+    return lines
+
+
+def write_log(path=DEFAULT_LOG_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(report_lines(recent=TIMING_LOG_SIZE)) + "\n")
+    return path
@@ -0,0 +1,698 @@
+"""Headless skins engine for Big Boy Skins.
+
+Nothing in here touches Tk, so rounds can be scored from worker threads,
+process pools and batch jobs as well as from the GUI.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from itertools import product
+from typing import NamedTuple, Optional
+import copy
+import hashlib
+import math
+import threading
+
+import numpy as np
+
+from skins_diag import count, instrumented, timed
+
+
+HOLES = 18
+MAX_HOLE_SCORE = 9
+# sentinel stored in int8 score matrices for a missing score
+MISSING_SCORE = -1
+# larger than any real (net) score, used to mask missing scores out of per-hole minima
+_NO_SCORE_HIGH = np.iinfo(np.int16).max
+
+# canonical reason codes for hole results
+REASON_NO_SCORES = "NO_SCORES"
+REASON_SOLE = "SOLE"
+REASON_CARRY = "CARRY"
+REASON_SPLIT = "SPLIT"
+
+# the four on/off rules; compare_rules() scores every combination of them
+RULE_TOGGLES = ("use_net", "carryover", "split_ties", "bonus_enabled")
+
+
+@dataclass(frozen=True)
+class SkinsSettings:
+    """Rule toggles and purse settings for one round."""
+    use_net: bool = False
+    carryover: bool = True
+    split_ties: bool = False
+    bonus_enabled: bool = True
+    per_skin: float = 1.0
+    total_purse: Optional[float] = None
+    # when slope is set, handicaps are treated as handicap indexes and
+    # converted to course handicaps before strokes are allocated
+    slope: Optional[float] = None
+    course_rating: Optional[float] = None
+
+
+def parse_handicap(value):
+    """Return a numeric handicap, falling back to 0 like pd.to_numeric(...).fillna(0).
+
+    Text written the golf way, "+2" for a plus handicap, is a course handicap
+    of -2: the player gives strokes back instead of receiving them.
+    """
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return 0 if isinstance(value, float) and math.isnan(value) else value
+    text = str(value).strip()
+    plus = text.startswith("+")
+    try:
+        n = float(text[1:] if plus else text)
+    except Exception:
+        return 0
+    if math.isnan(n) or (plus and text[1:].lstrip().startswith(("+", "-"))):
+        return 0
+    if plus:
+        n = -n
+    return int(n) if n.is_integer() else n
+
+
+def parse_score(value):
+    """Return an int score, or None for blank/invalid/out-of-range values."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, str) and value.strip() == "":
+        return None
+    try:
+        n = int(value)
+    except Exception:
+        return None
+    if n < 0 or n > MAX_HOLE_SCORE:
+        return None
+    return n
+
+
+def score_matrix(scores):
+    """Pack per-player score lists (None = missing) into an int8 matrix and missing mask."""
+    flat = [MISSING_SCORE if v is None else v for row in scores for v in row]
+    gross = np.array(flat, dtype=np.int8).reshape(len(scores), HOLES)
+    return gross, gross == MISSING_SCORE
+
+
+@instrumented("bonus pass")
+def bonus_matrix(gross, missing, pars):
+    """Per-player, per-hole birdie/eagle bonus units (0 where missing) in one array op."""
+    par_vec = np.asarray(pars, dtype=np.int16)
+    g = gross.astype(np.int16)
+    bonus = np.where(g <= par_vec - 2, 5, np.where(g == par_vec - 1, 1, 0)).astype(np.int8)
+    bonus[missing] = 0
+    return bonus
+
+
+def course_handicap(index, slope, course_rating=None, par=None):
+    """WHS course handicap(s): index * slope / 113 (+ rating - par when both are given).
+
+    Accepts a scalar or an array of indexes; the result is not rounded.
+    """
+    ch = np.asarray(index, dtype=float) * (float(slope) / 113.0)
+    if course_rating is not None and par is not None:
+        ch = ch + (float(course_rating) - float(par))
+    return ch
+
+
+def allocate_strokes(handicaps, stroke_index):
+    """Strokes received per player and hole as an int16 players x holes matrix.
+
+    Handicaps are rounded to the nearest whole number (.5 up). Every player gets
+    handicap // 18 strokes on every hole plus one more on the holes whose stroke
+    index is <= handicap % 18, so a 40 gets 3 strokes on SI 1-4 and 2 elsewhere,
+    and a plus 2 (-2) gives a stroke back on SI 17 and 18.
+    """
+    ch = np.floor(np.asarray(handicaps, dtype=float).reshape(-1) + 0.5).astype(np.int16)
+    si = np.asarray(stroke_index, dtype=np.int16)
+    base, rem = np.divmod(ch, 18)
+    return (base[:, None] + (si[None, :] <= rem[:, None])).astype(np.int16)
+
+
+def bonus_units(gross, par):
+    """Birdie/eagle bonus units for a gross score on a hole of the given par."""
+    if gross <= par - 2:
+        return 5
+    if gross == par - 1:
+        return 1
+    return 0
+
+
+def format_bonus_summary(hole_result):
+    """Suffix like ' (bonus units: A +1, B +5)' for a hole result, or "" when nobody earned a bonus."""
+    bonus_map = hole_result.get("gross_bonus_map") or hole_result.get("bonus_map") or {}
+    if not bonus_map:
+        return ""
+
+    parts = []
+    for name, bonus in bonus_map.items():
+        try:
+            bonus_value = float(bonus)
+        except Exception:
+            continue
+        if bonus_value == 0:
+            continue
+        bonus_text = str(int(bonus_value)) if bonus_value.is_integer() else f"{bonus_value:g}"
+        parts.append(f"{name} +{bonus_text}")
+
+    if not parts:
+        return ""
+    return f" (bonus units: {', '.join(parts)})"
+
+
+def hole_result_text(hr):
+    """Summary text and units awarded for one hole result (report and live board)."""
+    bonus_text = format_bonus_summary(hr)
+    if hr.get("sole_winner"):
+        text = f"{hr['sole_winner']}{bonus_text}"
+        units = hr["units_paid"]
+    elif hr.get("tied"):
+        rreason = hr.get("reason")
+        if rreason == REASON_CARRY:
+            text = hr.get("reason_text", f"Tie ({', '.join(hr.get('tied', []))}) - carryover")
+            units = 0
+        elif rreason == REASON_SPLIT:
+            text = f"Tie ({', '.join(hr.get('tied', []))}) - split"
+            units = hr.get("units_paid", 0)
+        elif rreason == REASON_NO_SCORES:
+            text = hr.get("reason_text", "No scores")
+            units = 0
+        else:
+            text = hr.get("reason_text", "No scores")
+            units = 0
+        if bonus_text:
+            text = f"{text}{bonus_text}"
+    else:
+        text = hr.get("reason_text", "No scores")
+        if bonus_text:
+            text = f"{text}{bonus_text}"
+        units = 0
+    return text, units
+
+
+class ResultCache:
+    """Bounded LRU of engine results keyed by SkinsEngine.fingerprint().
+
+    Results are deep-copied in and out so callers can't alter a cached entry.
+    Shared by the GUI thread and background jobs, hence the lock.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(results)
+
+    def put(self, key, results):
+        results = copy.deepcopy(results)
+        with self._lock:
+            self._entries[key] = results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+# process-wide cache used by compute_matrix() and LiveSkinsBoard
+RESULT_CACHE = ResultCache()
+
+
+class HoleSummary(NamedTuple):
+    """Everything the carryover scan needs to know about one hole."""
+    lowest: Optional[int]
+    # player indexes sharing the lowest (net) score
+    tied: tuple
+    # (player index, gross bonus units) for every birdie-or-better on the hole
+    bonuses: tuple
+
+
+class SkinsEngine:
+    """Scores a round of skins from plain Python inputs.
+
+    `pars` and `stroke_index` are per-hole ints (stroke_index may be None, in
+    which case net scoring falls back to gross). `compute` takes the included
+    players only: parallel lists of names, handicaps and per-hole scores with
+    None for a missing score.
+
+    Scoring is split in two: `summarize` reduces the players x holes matrix
+    to one HoleSummary per hole with NumPy, and `scan` walks the 18 summaries
+    in order applying carryover, ties and bonuses. Callers that keep the
+    summaries (see LiveSkinsBoard) only need to re-summarize an edited hole.
+    """
+
+    def __init__(self, pars, stroke_index, settings):
+        self.pars = [int(p) for p in pars]
+        self.stroke_index = [int(s) for s in stroke_index] if stroke_index is not None else None
+        self.settings = settings
+
+    def course_handicaps(self, handicaps):
+        settings = self.settings
+        if settings.slope is None:
+            return handicaps
+        return course_handicap(handicaps, settings.slope, settings.course_rating, sum(self.pars))
+
+    @instrumented("net adjustment")
+    def strokes_matrix(self, handicaps):
+        """Strokes subtracted from each gross score (all zero for gross scoring)."""
+        if self.settings.use_net and self.stroke_index is not None:
+            return allocate_strokes(self.course_handicaps(handicaps), self.stroke_index)
+        return np.zeros((len(handicaps), HOLES), dtype=np.int16)
+
+    def compute(self, names, handicaps, scores):
+        gross, missing = score_matrix(scores)
+        return self.compute_matrix(names, handicaps, gross, missing)
+
+    def compute_matrix(self, names, handicaps, gross, missing):
+        """Score a round from an int8 players x holes gross matrix and its missing mask.
+
+        Results are memoized in RESULT_CACHE, so scoring an unchanged round
+        again (re-export, toggling a rule back) is a lookup.
+        """
+        key = self.fingerprint(names, handicaps, gross, missing)
+        results = RESULT_CACHE.get(key)
+        if results is None:
+            play = gross.astype(np.int16) - self.strokes_matrix(handicaps)
+            bonus = bonus_matrix(gross, missing, self.pars)
+            with timed("hole scoring"):
+                results = self.scan(names, self.summarize(play, missing, bonus))
+            RESULT_CACHE.put(key, results)
+        return results
+
+    def fingerprint(self, names, handicaps, gross, missing):
+        """Digest of everything that affects the results: holes, settings and the included field."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((self.pars, self.stroke_index, self.settings)).encode())
+        h.update("\x1f".join(map(str, names)).encode())
+        h.update(repr([float(x) for x in handicaps]).encode())
+        gross = np.ascontiguousarray(gross, dtype=np.int8)
+        h.update(repr(gross.shape).encode())
+        h.update(gross.tobytes())
+        h.update(np.ascontiguousarray(missing, dtype=bool).tobytes())
+        return h.digest()
+
+    def compare_rules(self, names, handicaps, gross, missing):
+        """[(settings, results)] for all 16 combinations of RULE_TOGGLES, current rules first.
+
+        Only net/gross changes the per-hole minima and tie sets, so the matrix
+        is summarized twice and the 16 variants are just 16 scans over those
+        shared summaries. Purse, slope and rating come from this engine.
+        """
+        bonus = bonus_matrix(gross, missing, self.pars)
+        current = tuple(getattr(self.settings, t) for t in RULE_TOGGLES)
+        combos = sorted(product((False, True), repeat=len(RULE_TOGGLES)), key=lambda c: c != current)
+        summaries = {}
+        variants = []
+        for combo in combos:
+            variant = SkinsEngine(self.pars, self.stroke_index,
+                                  replace(self.settings, **dict(zip(RULE_TOGGLES, combo))))
+            use_net = variant.settings.use_net
+            if use_net not in summaries:
+                play = gross.astype(np.int16) - variant.strokes_matrix(handicaps)
+                summaries[use_net] = self.summarize(play, missing, bonus)
+            variants.append((variant.settings, variant.scan(names, summaries[use_net])))
+        return variants
+
+    @instrumented("batch scoring")
+    def batch_units(self, handicaps, gross, missing=None):
+        """Units won per player for a stack of rounds under the same rules as scan().
+
+        `gross` is an int8 rounds x players x holes array (MISSING_SCORE for
+        blanks) sharing one field of `handicaps`. Every round is scored at once;
+        only the 18-hole carryover walk loops, and it is vectorized across
+        rounds. Players are told apart by index here, not by name.
+        """
+        settings = self.settings
+        if missing is None:
+            missing = gross == MISSING_SCORE
+        play = gross.astype(np.int16) - self.strokes_matrix(handicaps)
+        masked = np.where(missing, _NO_SCORE_HIGH, play)
+        lowest = masked.min(axis=1)
+        at_min = ~missing & (masked == lowest[:, None, :])
+        n_tied = at_min.sum(axis=1)
+        rounds = np.arange(gross.shape[0])
+
+        units = np.zeros(gross.shape[:2])
+        if settings.bonus_enabled:
+            # every birdie/eagle pays its bonus, whether or not it wins the hole
+            units += bonus_matrix(gross, missing, self.pars).sum(axis=2)
+        carry = np.zeros(gross.shape[0])
+        for h, par in enumerate(self.pars):
+            scored = n_tied[:, h] > 0
+            low = lowest[:, h]
+            sole = scored & (low <= par) & (n_tied[:, h] == 1)
+            split = scored & (low <= par - 1) & (n_tied[:, h] == 2) & settings.split_ties
+            award = 1 + carry
+            winner = at_min[:, :, h].argmax(axis=1)
+            units[rounds[sole], winner[sole]] += award[sole]
+            if split.any():
+                units[split] += at_min[split, :, h] * (award[split] / 2)[:, None]
+            if settings.carryover:
+                carry = np.where(sole | split, 0, carry + (scored & ~sole & ~split))
+        return units
+
+    def batch_amounts(self, units):
+        """Dollar amounts for batch_units() output (per round when a total purse is set)."""
+        total_purse = self.settings.total_purse
+        if total_purse is not None and total_purse > 0:
+            total = units.sum(axis=1, keepdims=True)
+            per_unit = np.divide(total_purse, total, out=np.zeros_like(total), where=total > 0)
+        else:
+            per_unit = self.settings.per_skin
+        return np.round(units * per_unit, 2)
+
+    def summarize(self, play, missing, bonus):
+        """Per-hole minima, tie sets and bonus sets for the whole matrix in one pass."""
+        valid = ~missing
+        masked = np.where(valid, play, _NO_SCORE_HIGH)
+        has_scores = valid.any(axis=0)
+        lowest = masked.min(axis=0, initial=_NO_SCORE_HIGH)
+        at_min = valid & (masked == lowest)
+        # hole-major nonzero() output, split back into one run per hole
+        tie_holes, tie_players = np.nonzero(at_min.T)
+        tied = np.split(tie_players, np.cumsum(np.bincount(tie_holes, minlength=HOLES))[:-1])
+        bonus_holes, bonus_players = np.nonzero(bonus.T)
+        bonus_vals = bonus.T[bonus_holes, bonus_players]
+        splits = np.cumsum(np.bincount(bonus_holes, minlength=HOLES))[:-1]
+        bonus_players = np.split(bonus_players, splits)
+        bonus_vals = np.split(bonus_vals, splits)
+        return [
+            HoleSummary(
+                int(lowest[h]) if has_scores[h] else None,
+                tuple(tied[h].tolist()),
+                tuple(zip(bonus_players[h].tolist(), bonus_vals[h].tolist())),
+            )
+            for h in range(HOLES)
+        ]
+
+    def summarize_hole(self, play_col, missing_col, bonus_col):
+        """HoleSummary for a single hole column, O(players)."""
+        valid = ~missing_col
+        bonus_players = np.flatnonzero(bonus_col)
+        bonuses = tuple(zip(bonus_players.tolist(), bonus_col[bonus_players].tolist()))
+        if not valid.any():
+            return HoleSummary(None, (), bonuses)
+        lowest = int(play_col[valid].min())
+        tied = np.flatnonzero(valid & (play_col == lowest))
+        return HoleSummary(lowest, tuple(tied.tolist()), bonuses)
+
+    def scan(self, names, summaries, carry_in=0):
+        """Walk the hole summaries in order and build the results/payout dict.
+
+        `carry_in` units are already riding into the first hole (a tournament
+        carrying the previous round's unresolved skins); ignored when
+        carryover is off.
+        """
+        settings = self.settings
+        pars = self.pars
+        names = list(names)
+        skins_awarded = {f"H{i+1}": [] for i in range(HOLES)}
+        carryover_on = settings.carryover
+
+        carryover_units = carry_in if carryover_on else 0
+        hole_results = []
+        for i, summary in enumerate(summaries):
+            hole = f"H{i+1}"
+            par_for_hole = pars[i]
+            if summary.lowest is None:
+                hole_results.append({
+                    "hole": hole,
+                    "lowest": None,
+                    "tied": [],
+                    "sole_winner": None,
+                    "units_paid": 0,
+                    "carryover_before": carryover_units,
+                    "reason": REASON_NO_SCORES,
+                    "reason_text": "No scores"
+                })
+                continue
+            minv = summary.lowest
+            tied_idx = summary.tied
+            tied_names = [names[p] for p in tied_idx]
+
+            if minv > par_for_hole:
+                carry_before = carryover_units
+                if carryover_on:
+                    carryover_units += 1
+                    reason_text = "All worse than par - carryover"
+                    reason = REASON_CARRY
+                else:
+                    reason_text = "All worse than par - carry disabled"
+                    reason = REASON_NO_SCORES
+                hole_results.append({
+                    "hole": hole,
+                    "lowest": minv,
+                    "tied": tied_names,
+                    "sole_winner": None,
+                    "units_paid": 0,
+                    "carryover_before": carry_before,
+                    "reason": reason,
+                    "reason_text": reason_text
+                })
+                continue
+
+            if len(tied_idx) == 1:
+                # bonus is based on the gross score, not the net score used to win the hole
+                extra = dict(summary.bonuses).get(tied_idx[0], 0) if settings.bonus_enabled else 0
+                units = 1 + carryover_units + extra
+                skins_awarded[hole].append((tied_names[0], units))
+                hole_result = {
+                    "hole": hole,
+                    "lowest": minv,
+                    "tied": tied_names,
+                    "sole_winner": tied_names[0],
+                    "units_paid": units,
+                    "carryover_before": carryover_units,
+                    "reason": REASON_SOLE,
+                    "reason_text": "Sole winner <= par"
+                }
+                if extra:
+                    hole_result["gross_bonus_map"] = {tied_names[0]: extra}
+                hole_results.append(hole_result)
+                carryover_units = 0
+            elif minv > par_for_hole - 1:
+                carry_before = carryover_units
+                if carryover_on:
+                    carryover_units += 1
+                    reason_text = "Tie worse than birdie -> carry"
+                    reason = REASON_CARRY
+                else:
+                    reason_text = "Tie worse than birdie -> carry disabled"
+                    reason = REASON_NO_SCORES
+                hole_results.append({
+                    "hole": hole,
+                    "lowest": minv,
+                    "tied": tied_names,
+                    "sole_winner": None,
+                    "units_paid": 0,
+                    "carryover_before": carry_before,
+                    "reason": reason,
+                    "reason_text": reason_text
+                })
+            elif len(tied_idx) > 2:
+                # More than two birdies/eagles: no split, the hole carries and each
+                # tied player retains their bonus (if any).
+                hole_bonus = dict(summary.bonuses)
+                bonus_map = {names[p]: hole_bonus[p] for p in tied_idx if p in hole_bonus}
+
+                carry_before = carryover_units
+                if carryover_on:
+                    carryover_units += 1
+                    if bonus_map:
+                        reason_text = "More than 2 birdies/eagles -> carry (bonuses retained)"
+                    else:
+                        reason_text = "More than 2 birdies/eagles -> carry"
+                    reason = REASON_CARRY
+                else:
+                    reason_text = "More than 2 birdies/eagles -> carry disabled"
+                    reason = REASON_NO_SCORES
+                hole_results.append({
+                    "hole": hole,
+                    "lowest": minv,
+                    "tied": tied_names,
+                    "sole_winner": None,
+                    "units_paid": 0,
+                    "carryover_before": carry_before,
+                    "reason": reason,
+                    "reason_text": reason_text,
+                    "bonus_map": bonus_map
+                })
+            elif settings.split_ties:
+                # Two-player tie at birdie/eagle
+                hole_results.append({
+                    "hole": hole,
+                    "lowest": minv,
+                    "tied": tied_names,
+                    "sole_winner": None,
+                    "units_paid": 1 + carryover_units,
+                    "carryover_before": carryover_units,
+                    "reason": REASON_SPLIT,
+                    "reason_text": "Tie at birdie/eagle -> split"
+                })
+                carryover_units = 0
+            else:
+                carry_before = carryover_units
+                if carryover_on:
+                    carryover_units += 1
+                    reason_text = "Split ties disabled -> carry"
+                    reason = REASON_CARRY
+                else:
+                    reason_text = "Split ties disabled -> carry disabled"
+                    reason = REASON_NO_SCORES
+                hole_results.append({
+                    "hole": hole,
+                    "lowest": minv,
+                    "tied": tied_names,
+                    "sole_winner": None,
+                    "units_paid": 0,
+                    "carryover_before": carry_before,
+                    "reason": reason,
+                    "reason_text": reason_text
+                })
+
+        # If carryover is disabled, ensure no hole is treated as a carry and
+        # remove any retained bonus_map entries so no units are awarded.
+        if not carryover_on:
+            for rec in hole_results:
+                if rec.get("reason") == REASON_CARRY:
+                    rec["reason"] = REASON_NO_SCORES
+                    rt = rec.get("reason_text", "")
+                    if "carry disabled" not in rt.lower():
+                        rec["reason_text"] = (rt + " - carry disabled").strip()
+                rec.pop("bonus_map", None)
+
+        # payouts are keyed by name, so players sharing a name share a total
+        payout_map_units = {name: 0.0 for name in names}
+
+        # Award unconditional gross-based bonuses (birdie=1, eagle=5) for ANY
+        # under-par score, regardless of whether a skin was won on that hole.
+        if settings.bonus_enabled:
+            for rec, summary in zip(hole_results, summaries):
+                for p, bonus in summary.bonuses:
+                    pname = names[p]
+                    # Sole winners already have their bonus folded into units_paid.
+                    if rec.get("sole_winner") == pname:
+                        continue
+                    payout_map_units[pname] += float(bonus)
+                    rec.setdefault("gross_bonus_map", {})[pname] = int(bonus)
+
+        # Now allocate the standard hole payouts (sole winners and splits).
+        for rec in hole_results:
+            if rec.get("sole_winner"):
+                payout_map_units[rec["sole_winner"]] += float(rec.get("units_paid", 0))
+            elif rec.get("reason") == REASON_SPLIT and rec.get("tied"):
+                tied = rec["tied"]
+                share_units = float(rec.get("units_paid", 0)) / len(tied)
+                for name in tied:
+                    payout_map_units[name] += share_units
+
+        carryover_remaining = carry_in if carryover_on else 0
+        if carryover_on:
+            for r in hole_results:
+                if r.get("sole_winner") or r.get("reason") == REASON_SPLIT:
+                    carryover_remaining = 0
+                elif r.get("reason") == REASON_CARRY:
+                    carryover_remaining += 1
+
+        total_purse = settings.total_purse
+        if total_purse is not None and total_purse > 0:
+            total_units = sum(payout_map_units.values())
+            per_unit = (total_purse / total_units) if total_units > 0 else 0.0
+        else:
+            per_unit = settings.per_skin
+
+        payout_map_amount = {name: round(payout_map_units[name] * per_unit, 2) for name in payout_map_units}
+
+        return {
+            "per_skin": per_unit,
+            "payout_map_units": payout_map_units,
+            "payout_map_amount": payout_map_amount,
+            "skins_awarded": skins_awarded,
+            "hole_results": hole_results,
+            "carryover_remaining": carryover_remaining
+        }
+
+
+class LiveSkinsBoard:
+    """Keeps a round's skins results current as single scores are edited.
+
+    The board caches the score, strokes and bonus matrices plus one
+    HoleSummary per hole. `set_score` re-summarizes only the edited hole
+    (O(players)) and re-runs the 18-hole carryover scan, so a keystroke never
+    re-scores the whole field. Anything that changes every hole (names,
+    handicaps, pars, stroke index, settings) goes through `load`.
+    """
+
+    def __init__(self, engine, names=(), handicaps=(), scores=()):
+        self.engine = engine
+        self.load(names, handicaps, scores)
+
+    def load(self, names, handicaps, scores):
+        gross, missing = score_matrix(scores)
+        return self.load_matrix(names, handicaps, gross, missing)
+
+    def load_matrix(self, names, handicaps, gross, missing):
+        """Load from an int8 gross matrix and missing mask (both are copied)."""
+        engine = self.engine
+        self.names = list(names)
+        self.handicaps = list(handicaps)
+        self.gross = np.array(gross, dtype=np.int8)
+        self.missing = np.array(missing, dtype=bool)
+        self.strokes = engine.strokes_matrix(self.handicaps)
+        self.play = self.gross.astype(np.int16) - self.strokes
+        self.bonus = bonus_matrix(self.gross, self.missing, engine.pars)
+        # summaries are only needed once a score is edited; a cache hit skips them
+        self.summaries = None
+        self.results = self._cached_results()
+        return self.results
+
+    def _cached_results(self):
+        key = self.engine.fingerprint(self.names, self.handicaps, self.gross, self.missing)
+        results = RESULT_CACHE.get(key)
+        if results is None:
+            with timed("hole scoring"):
+                if self.summaries is None:
+                    self.summaries = self.engine.summarize(self.play, self.missing, self.bonus)
+                results = self.engine.scan(self.names, self.summaries)
+            RESULT_CACHE.put(key, results)
+        return results
+
+    def set_score(self, player, hole, value):
+        """Update one cell (value may be a raw entry string) and return fresh results."""
+        count("live score edits")
+        score = parse_score(value)
+        if score is None:
+            self.gross[player, hole] = MISSING_SCORE
+            self.missing[player, hole] = True
+            self.bonus[player, hole] = 0
+        else:
+            par = self.engine.pars[hole]
+            self.gross[player, hole] = score
+            self.missing[player, hole] = False
+            self.bonus[player, hole] = bonus_units(score, par)
+        self.play[player, hole] = int(self.gross[player, hole]) - int(self.strokes[player, hole])
+        if self.summaries is not None:
+            self.summaries[hole] = self.engine.summarize_hole(
+                self.play[:, hole], self.missing[:, hole], self.bonus[:, hole])
+        self.results = self._cached_results()
+        return self.results
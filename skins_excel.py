@@ -0,0 +1,701 @@
+"""Excel import/export for Big Boy Skins reports.
+
+Workbooks are read with read_only=True in a single iter_rows(values_only=True)
+pass per sheet, and written with write_only=True as whole rows that share a
+handful of NamedStyles. No Tk here, so this can run off the main thread or in
+batch jobs.
+"""
+import csv
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+import numpy as np
+
+from skins_diag import instrumented
+from skins_engine import HOLES, MISSING_SCORE, SkinsSettings, hole_result_text, parse_handicap, parse_score
+from skins_model import FlightPot, Player, Round, flight_label, flight_pots_text, parse_flight_pots
+
+
+# how far to look for the "Name" header cell (rows x columns)
+HEADER_SEARCH_ROWS = 50
+HEADER_SEARCH_COLS = 10
+
+
+class ReportFormatError(ValueError):
+    """The sheet has no recognizable player table; `snapshot` holds its first rows for diagnostics."""
+
+    def __init__(self, message, snapshot=()):
+        super().__init__(message)
+        self.snapshot = snapshot
+
+
+def _norm(v):
+    if v is None:
+        return ""
+    s = str(v)
+    # remove common invisible/formatting chars
+    for ch in ('\ufeff', '\u200b', '\u2060', '\u00a0'):
+        s = s.replace(ch, '')
+    return s.strip().lower()
+
+
+def _to_bool(v):
+    if isinstance(v, bool):
+        return v
+    if v is None:
+        return False
+    s = str(v).strip().lower()
+    return s in ("true", "1", "yes")
+
+
+def _is_bool_like(val):
+    if isinstance(val, bool):
+        return True
+    if isinstance(val, (int, float)) and val in (0, 1):
+        return True
+    return _norm(val) in ("true", "false", "1", "0", "yes", "no")
+
+
+def _score_cell(v):
+    s = parse_score(v)
+    return MISSING_SCORE if s is None else s
+
+
+def _cell(row, idx):
+    return row[idx] if 0 <= idx < len(row) else None
+
+
+def read_summary_settings(rows):
+    """Settings from the "Export Summary" sheet's key/value rows (only keys that are present)."""
+    settings = {}
+    for row in rows:
+        # find first non-empty cell in the row (Export Summary may be shifted)
+        first_idx = next((j for j, v in enumerate(row) if _norm(v) != ""), None)
+        if first_idx is None:
+            continue
+        key = _norm(row[first_idx])
+        val = _cell(row, first_idx + 1)
+        if "per-skin" in key:
+            settings["per_skin"] = val
+        elif "total purse" in key:
+            settings["total_purse"] = val
+        elif "carryover" in key:
+            settings["carryover"] = _to_bool(val)
+        elif "use net" in key:
+            settings["use_net"] = _to_bool(val)
+        elif "split ties" in key:
+            settings["split_ties"] = _to_bool(val)
+        elif "bonuses" in key:
+            settings["bonus_enabled"] = _to_bool(val)
+        elif key == "flight pots":
+            settings["flight_pots"] = val
+        elif key == "slope":
+            settings["slope"] = val
+        elif key == "course rating":
+            settings["course_rating"] = val
+        elif key == "course":
+            settings["course"] = val
+        elif key == "date" and val is not None:
+            settings["date"] = val
+        elif key == "round id" and val is not None:
+            settings["round_id"] = str(val).strip()
+    return settings
+
+
+def find_header(rows):
+    """(row index, column index) of the player table header, or None.
+
+    A cell reading exactly "Name"/"Player" wins over one that merely contains
+    it, so a title like "Big Boy Skins at Players Club" is not taken for the header.
+    """
+    fallback = None
+    for r, row in enumerate(rows[:HEADER_SEARCH_ROWS]):
+        for c in range(min(len(row), HEADER_SEARCH_COLS)):
+            v = _norm(row[c])
+            if v in ("name", "player"):
+                return r, c
+            if fallback is None and ('name' in v or 'player' in v):
+                fallback = (r, c)
+    return fallback
+
+
+def parse_report_rows(rows):
+    """Parse the report sheet's rows (tuples of cell values) into a Round.
+
+    Pars default to DEFAULT_PAR and the stroke index to None when the sheet
+    has no such row; unnamed player rows are skipped. Settings are left None.
+    A "Flight" column, wherever it sits in the header row, sets the players' flights.
+    """
+    header = find_header(rows)
+    if header is None:
+        snapshot = [tuple(_cell(row, c) for c in range(HEADER_SEARCH_COLS)) for row in rows[:20]]
+        raise ReportFormatError("Could not find header row in spreadsheet", snapshot)
+    hr, header_col = header
+    hole_col_start = header_col + 3
+    flight_col = next((c for c, v in enumerate(rows[hr]) if _norm(v) == "flight"), None)
+
+    def _label(r):
+        return _norm(_cell(rows[r], header_col)) if r < len(rows) else ""
+
+    r = hr + 1
+    pars = None
+    if _label(r) == "par":
+        pars = []
+        for i in range(HOLES):
+            val = _cell(rows[r], hole_col_start + i)
+            try:
+                pars.append(int(val) if val is not None else 4)
+            except Exception:
+                pars.append(4)
+        r += 1
+
+    stroke_index = None
+    if _label(r) in ("stroke index", "stroke_index", "si"):
+        stroke_index = []
+        for i in range(HOLES):
+            val = _cell(rows[r], hole_col_start + i)
+            try:
+                stroke_index.append(int(val) if val is not None else i + 1)
+            except Exception:
+                stroke_index.append(i + 1)
+        r += 1
+
+    players = []
+    for row in rows[r:]:
+        name = _cell(row, header_col)
+        if name is None:
+            break
+        if _norm(name) in ("skins summary", "payouts"):
+            break
+        included_cell = _cell(row, header_col + 2)
+        hcp_cell = _cell(row, header_col + 1)
+        holes = [_cell(row, hole_col_start + i) for i in range(HOLES)]
+        has_scores = any(v is not None and (isinstance(v, (int, float)) or str(v).strip() != "") for v in holes)
+        if not (_is_bool_like(included_cell) or has_scores or (hcp_cell is not None and str(hcp_cell).strip() != "")):
+            break
+        if str(name).strip() == "":
+            continue
+        flight = _cell(row, flight_col) if flight_col is not None else None
+        players.append(Player(
+            str(name).strip(),
+            parse_handicap(hcp_cell) if hcp_cell is not None and str(hcp_cell).strip() != "" else None,
+            _to_bool(included_cell) if isinstance(included_cell, str) else bool(included_cell),
+            [_score_cell(v) for v in holes],
+            str(flight).strip() if flight is not None else "",
+        ))
+
+    # metadata cells sit next to the "Course:"/"Date:" labels in rows 2 and 3
+    course = _cell(rows[1], header_col + 1) if len(rows) > 1 else None
+    date = _cell(rows[2], header_col + 1) if len(rows) > 2 else None
+    return Round(pars, stroke_index, None, players,
+                 course=str(course).strip() if course is not None else "",
+                 date=date if date is not None else "")
+
+
+def _opt_float(value, default=None):
+    try:
+        return float(value) if value is not None and str(value).strip() != "" else default
+    except (TypeError, ValueError):
+        return default
+
+
+def settings_from_summary(summary):
+    """SkinsSettings from read_summary_settings() output (missing keys keep the defaults)."""
+    defaults = SkinsSettings()
+    return SkinsSettings(
+        use_net=summary.get("use_net", defaults.use_net),
+        carryover=summary.get("carryover", defaults.carryover),
+        split_ties=summary.get("split_ties", defaults.split_ties),
+        bonus_enabled=summary.get("bonus_enabled", defaults.bonus_enabled),
+        per_skin=_opt_float(summary.get("per_skin"), defaults.per_skin),
+        total_purse=_opt_float(summary.get("total_purse")),
+        slope=_opt_float(summary.get("slope")),
+        course_rating=_opt_float(summary.get("course_rating")),
+    )
+
+
+def _apply_summary(rnd, summary):
+    """Fill a parsed Round's settings (and any missing course/date) from the Export Summary sheet."""
+    if summary:
+        rnd.settings = settings_from_summary(summary)
+        if not rnd.course and summary.get("course"):
+            rnd.course = str(summary["course"]).strip()
+        if rnd.date == "" and summary.get("date") is not None:
+            rnd.date = summary["date"]
+        rnd.round_id = summary.get("round_id", rnd.round_id)
+    return rnd
+
+
+@instrumented("import scan")
+def read_report(path, progress=None):
+    """Read an exported (or hand-made) skins workbook in one streaming pass per sheet.
+
+    Returns parse_report_rows() for the active sheet, with settings taken from
+    the optional "Export Summary" sheet (None when there is none). A flights
+    workbook (build_flights_workbook) is read back as one Round from its
+    per-flight sheets. `progress`, if given, is called with the fraction done
+    after each stage and may raise to abort.
+    """
+    step = progress or (lambda fraction: None)
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        step(0.25)
+        if FLIGHTS_SHEET in wb.sheetnames:
+            rnd = _read_flight_sheets(wb)
+            step(1.0)
+            return rnd
+        summary = {}
+        for name in wb.sheetnames:
+            if name.strip().lower() in ("export summary", "export_summary"):
+                summary = read_summary_settings(wb[name].iter_rows(values_only=True))
+                break
+        step(0.5)
+        rows = list(wb.active.iter_rows(values_only=True))
+    finally:
+        wb.close()
+    step(0.75)
+    rnd = _apply_summary(parse_report_rows(rows), summary)
+    step(1.0)
+    return rnd
+
+
+def _read_flight_sheets(wb):
+    """One Round from a flights workbook's "<flight> Report"/"<flight> Summary" sheet pairs.
+
+    The round's settings and Flight Pots come from the overview's "Round
+    Settings" block. Workbooks written before it existed fall back to each
+    flight's summary settings as its FlightPot, and the unflighted players'
+    (or else the first flight's) settings for the round.
+    """
+    round_settings = _read_round_settings(wb[FLIGHTS_SHEET].iter_rows(values_only=True))
+    rnd = None
+    for name in wb.sheetnames:
+        if not name.endswith(FLIGHT_REPORT_SUFFIX):
+            continue
+        flight_rnd = parse_report_rows(list(wb[name].iter_rows(values_only=True)))
+        summary_name = name[:-len(FLIGHT_REPORT_SUFFIX)] + FLIGHT_SUMMARY_SUFFIX
+        if summary_name in wb.sheetnames:
+            _apply_summary(flight_rnd, read_summary_settings(wb[summary_name].iter_rows(values_only=True)))
+        if rnd is None:
+            rnd = Round(flight_rnd.pars, flight_rnd.stroke_index, flight_rnd.settings,
+                        course=flight_rnd.course, date=flight_rnd.date)
+        rnd.players += flight_rnd.players
+        st = flight_rnd.settings
+        if st is None or not flight_rnd.players:
+            continue
+        flight = flight_rnd.players[0].flight
+        if flight == "":
+            rnd.settings = st
+        else:
+            rnd.flight_pots[flight] = (
+                FlightPot(None, st.total_purse) if st.total_purse is not None else FlightPot(st.per_skin, None))
+    if rnd is None:
+        raise ReportFormatError("The flights workbook has no flight report sheets")
+    if round_settings:
+        rnd.settings = settings_from_summary(round_settings)
+        rnd.round_id = round_settings.get("round_id", "")
+        try:
+            rnd.flight_pots = parse_flight_pots(round_settings.get("flight_pots") or "")
+        except ValueError as e:
+            raise ReportFormatError(f"Bad Flight Pots on the {FLIGHTS_SHEET} sheet: {e}") from None
+    return rnd
+
+
+def _read_round_settings(rows):
+    """read_summary_settings() of the key/value rows under the Flights sheet's "Round Settings" header."""
+    rows = iter(rows)
+    for row in rows:
+        if any(_norm(v) == ROUND_SETTINGS_HEADER.lower() for v in row):
+            return read_summary_settings(rows)
+    return {}
+
+
+def read_report_csv(path):
+    """Read the report sheet saved as CSV; same result as read_report(), with no settings."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        # blank CSV fields stand in for empty cells
+        rows = [tuple(v if v.strip() != "" else None for v in row) for row in csv.reader(f)]
+    return parse_report_rows(rows)
+
+
+REPORT_SHEET = "Big Boy Skins Report"
+SUMMARY_SHEET = "Export Summary"
+# flights workbooks: an overview sheet, then "<flight> Report" and "<flight> Summary" per flight
+FLIGHTS_SHEET = "Flights"
+FLIGHT_REPORT_SUFFIX = " Report"
+FLIGHT_SUMMARY_SUFFIX = " Summary"
+# the Flights sheet's key/value block of round-level settings, below the players
+ROUND_SETTINGS_HEADER = "Round Settings"
+# Excel caps sheet names at 31 characters and forbids a few
+SHEET_NAME_CHARS = 31
+SHEET_NAME_FORBIDDEN = set('[]:*?/\\')
+MONEY_FORMAT = '$#,##0.00'
+# Leave column A blank to match user's example export (start content in column B)
+COL_OFF = 1
+# sheet row holding the pars; the stroke index row and then the players follow it
+PAR_ROW = 7
+BIRDIE_FILL = PatternFill(start_color="FFF59D", end_color="FFF59D", fill_type="solid")
+EAGLE_FILL = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
+
+
+def _add_score_highlights(ws, first_row, last_row):
+    """Birdie/eagle fills (match GUI colors) as two conditional-formatting rules.
+
+    The rules compare each score with the Par row, so highlighting follows
+    any score or par edited later in Excel; blank cells never match.
+    """
+    first_col = get_column_letter(4 + COL_OFF)
+    last_col = get_column_letter(3 + HOLES + COL_OFF)
+    cell_range = f"{first_col}{first_row}:{last_col}{last_row}"
+    score = f"{first_col}{first_row}"
+    par = f"{first_col}${PAR_ROW}"
+    ws.conditional_formatting.add(cell_range, FormulaRule(
+        formula=[f"AND(ISNUMBER({score}),{score}={par}-1)"], fill=BIRDIE_FILL))
+    ws.conditional_formatting.add(cell_range, FormulaRule(
+        formula=[f"AND(ISNUMBER({score}),{score}<={par}-2)"], fill=EAGLE_FILL))
+
+
+def _report_styles():
+    thin = Side(border_style="thin", color="000000")
+    bd = Border(left=thin, right=thin, top=thin, bottom=thin)
+    center = Alignment(horizontal="center")
+    par_fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    si_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    return [
+        NamedStyle("skins_title", font=Font(size=20, bold=True), alignment=center),
+        NamedStyle("skins_bold", font=Font(bold=True)),
+        NamedStyle("skins_header", font=Font(bold=True), border=bd),
+        NamedStyle("skins_header_center", font=Font(bold=True), border=bd, alignment=center),
+        NamedStyle("skins_cell", border=bd),
+        NamedStyle("skins_cell_center", border=bd, alignment=center),
+        NamedStyle("skins_money", border=bd, number_format=MONEY_FORMAT),
+        NamedStyle("skins_money_plain", number_format=MONEY_FORMAT),
+        NamedStyle("skins_money_bold", font=Font(bold=True), number_format=MONEY_FORMAT),
+        NamedStyle("skins_par_label", font=Font(bold=True), fill=par_fill),
+        NamedStyle("skins_par", fill=par_fill, alignment=center),
+        NamedStyle("skins_si_label", font=Font(bold=True), fill=si_fill),
+        NamedStyle("skins_si", fill=si_fill, alignment=center),
+    ]
+
+
+def report_title(course, date):
+    if course and date:
+        return f"Big Boy Skins at {course} — {date}"
+    if course:
+        return f"Big Boy Skins at {course}"
+    if date:
+        return f"Big Boy Skins — {date}"
+    return "Big Boy Skins"
+
+
+def new_report_workbook():
+    """Empty write-only workbook with the report's NamedStyles registered."""
+    wb = Workbook(write_only=True)
+    for style in _report_styles():
+        wb.add_named_style(style)
+    return wb
+
+
+def _styled(sheet, value, style):
+    cell = WriteOnlyCell(sheet, value=value)
+    cell.style = style
+    return cell
+
+
+def _report_row(*values):
+    return [None] * COL_OFF + list(values)
+
+
+@instrumented("workbook build")
+def build_report_workbook(rnd, results, progress=None):
+    """Build the styled report workbook for a Round (write-only; call .save() exactly once).
+
+    `results` is the engine's result dict for the round's settings.
+    `progress` is called with the fraction of player rows written and may
+    raise to abort the build.
+    """
+    wb = new_report_workbook()
+    write_report_sheets(wb, rnd, results, progress=progress)
+    return wb
+
+
+def write_report_sheets(wb, rnd, results, report_sheet=REPORT_SHEET, summary_sheet=SUMMARY_SHEET, progress=None):
+    """Append one round's report and Export Summary sheets to a new_report_workbook()."""
+    course, date, pars = rnd.course, rnd.date, rnd.pars
+    settings = rnd.settings or SkinsSettings()
+    players = rnd.players
+    per_skin = results["per_skin"]
+    payout_units = results["payout_map_units"]
+    payout_amounts = results["payout_map_amount"]
+    hole_results = results.get("hole_results", [])
+    carryover_remaining = results.get("carryover_remaining", 0)
+
+    ws = wb.create_sheet(report_sheet)
+    summary = wb.create_sheet(summary_sheet)
+    c = _styled
+    row = _report_row
+
+    # column widths must be set before the first row is streamed
+    for col in range(1, 8 + HOLES):
+        ws.column_dimensions[get_column_letter(col + COL_OFF)].width = 14
+    last_col = get_column_letter(7 + HOLES + COL_OFF)
+    ws.merged_cells.add(f"{get_column_letter(1 + COL_OFF)}1:{last_col}1")
+
+    ws.append(row(c(ws, report_title(course, date), "skins_title")))
+    # Metadata
+    ws.append(row("Course:", course, None, "Per-skin $", float(per_skin)))
+    if settings.total_purse is not None:
+        ws.append(row("Date:", date, None, "Total Purse $", float(settings.total_purse)))
+    else:
+        ws.append(row("Date:", date))
+    ws.append(row(None, None, None, "Carryover Enabled", str(settings.carryover)))
+    ws.append([])
+
+    flighted = rnd.is_flighted()
+    headers = ["Name", "HCP", "Included"] + [f"H{i+1}" for i in range(HOLES)] + ["Front9", "Back9", "Units", "Amount$"]
+    if flighted:
+        headers.append("Flight")
+    ws.append(row(*[c(ws, h, "skins_header_center" if 4 <= n <= 4 + HOLES else "skins_header")
+                    for n, h in enumerate(headers, start=1)]))
+    # keep PAR_ROW in step with the rows appended above
+    ws.append(row(c(ws, "Par", "skins_par_label"), None, None, *[c(ws, int(p), "skins_par") for p in pars]))
+    ws.append(row(c(ws, "Stroke Index", "skins_si_label"), None, None,
+                  *[c(ws, si, "skins_si") for si in (rnd.stroke_index or [None] * HOLES)]))
+
+    participants = rnd.included_players()
+    write_order = participants + [p for p in players if not p.included]
+    if write_order:
+        _add_score_highlights(ws, PAR_ROW + 2, PAR_ROW + 1 + len(write_order))
+    for n, p in enumerate(write_order, start=1):
+        name = p.name
+        cells = [c(ws, name, "skins_cell"), c(ws, p.handicap, "skins_cell"), c(ws, p.included, "skins_cell")]
+        cells += [c(ws, v if v != MISSING_SCORE else None, "skins_cell_center") for v in p.scores.tolist()]
+        units = payout_units.get(name, 0.0)
+        amount = payout_amounts.get(name, 0.0)
+        cells += [c(ws, p.front9, "skins_cell_center"), c(ws, p.back9, "skins_cell_center"),
+                  c(ws, units if units != 0 else None, "skins_cell"),
+                  c(ws, round(amount, 2) if amount != 0 else None, "skins_money")]
+        if flighted:
+            cells.append(c(ws, p.flight or None, "skins_cell"))
+        ws.append(row(*cells))
+        if progress is not None:
+            progress(n / len(write_order))
+
+    # Summary section (Skins per hole)
+    ws.append([])
+    ws.append([])
+    ws.append(row(c(ws, "Skins Summary", "skins_header")))
+    ws.append(row(*[c(ws, h, "skins_header") for h in ("Hole", "Result", "Units Awarded")]))
+    for hr in hole_results:
+        text, units = hole_result_text(hr)
+        ws.append(row(c(ws, hr.get("hole", ""), "skins_cell"), c(ws, text, "skins_cell"), c(ws, units, "skins_cell")))
+
+    # Payouts table
+    ws.append([])
+    ws.append(row(c(ws, "Payouts", "skins_header")))
+    ws.append(row(*[c(ws, h, "skins_header") for h in ("Name", "Units", "Amount$")]))
+    for p in participants:
+        name = p.name
+        units = payout_units.get(name, 0.0)
+        amount = payout_amounts.get(name, 0.0)
+        ws.append(row(c(ws, name, "skins_cell"), c(ws, round(units, 3) if units != 0 else None, "skins_cell"),
+                      c(ws, round(amount, 2) if amount != 0 else None, "skins_money")))
+    if carryover_remaining:
+        ws.append(row(c(ws, f"Carryover units remaining after 18: {carryover_remaining}", "skins_header")))
+
+    # Export Summary sheet (settings + per-player counts)
+    summary.append(row(c(summary, "Setting", "skins_bold"), c(summary, "Value", "skins_bold")))
+
+    def srow(k, v):
+        summary.append(row(c(summary, k, "skins_cell"), c(summary, v, "skins_cell")))
+
+    srow("Course", course)
+    srow("Date", date)
+    if rnd.round_id:
+        srow("Round ID", rnd.round_id)
+    srow("Per-skin $", float(per_skin))
+    if settings.total_purse is not None:
+        srow("Total Purse $", float(settings.total_purse))
+    srow("Carryover Enabled", str(settings.carryover))
+    srow("Use Net Scores", str(settings.use_net))
+    srow("Bonuses Enabled", str(settings.bonus_enabled))
+    srow("Split Ties", str(settings.split_ties))
+    if settings.slope is not None:
+        srow("Slope", settings.slope)
+        srow("Course Rating", settings.course_rating)
+
+    par_vec = np.asarray(pars, dtype=np.int16)
+    gross, missing = rnd.score_matrix(participants)
+    gross = gross.astype(np.int16)
+    birdie_counts = (~missing & (gross == par_vec - 1)).sum(axis=1).tolist()
+    eagle_counts = (~missing & (gross <= par_vec - 2)).sum(axis=1).tolist()
+    summary.append([])
+    summary.append(row(*[c(summary, h, "skins_bold") for h in ("Player", "Total Units", "Birdies", "Eagles", "Amount$")]))
+    total_paid = 0.0
+    for p, birdies, eagles in zip(participants, birdie_counts, eagle_counts):
+        name = p.name
+        u = payout_units.get(name, 0.0)
+        amt = payout_amounts.get(name, 0.0)
+        summary.append(row(name, float(u) if u != 0 else None, birdies or None, eagles or None,
+                           c(summary, round(amt or 0.0, 2), "skins_money_plain")))
+        total_paid += float(amt or 0.0)
+    if total_paid:
+        summary.append(row(c(summary, "Total Paid", "skins_bold"), None, None, None,
+                           c(summary, round(total_paid, 2), "skins_money_bold")))
+
+
+TOURNAMENT_SHEET = "Tournament"
+
+
+@instrumented("workbook build")
+def build_tournament_workbook(tournament, scored, progress=None):
+    """One workbook for a scored Tournament: a totals sheet, then each round's report and summary sheets.
+
+    `scored` is skins_tournament.score_tournament() output. `progress` gets
+    the fraction of rounds written and may raise to abort.
+    """
+    wb = new_report_workbook()
+    ws = wb.create_sheet(TOURNAMENT_SHEET)
+    c, row = _styled, _report_row
+    rounds = tournament.rounds
+    n = len(rounds)
+
+    ws.column_dimensions[get_column_letter(1 + COL_OFF)].width = 24
+    for col in range(2, 4 + 2 * n):
+        ws.column_dimensions[get_column_letter(col + COL_OFF)].width = 14
+    ws.merged_cells.add(f"{get_column_letter(1 + COL_OFF)}1:{get_column_letter(2 + 2 * n + COL_OFF)}1")
+    title = tournament.name or f"Big Boy Skins — {n * HOLES} holes"
+    ws.append(row(c(ws, title, "skins_title")))
+    ws.append(row("Rounds:", n, None, "Carry between rounds", str(tournament.carry_between_rounds)))
+    ws.append([])
+
+    headers = ["Name"]
+    for k, rnd in enumerate(rounds, start=1):
+        label = f"R{k} {rnd.date_text()}".strip()
+        headers += [f"{label} Units", f"{label} $"]
+    headers += ["Total Units", "Total $"]
+    ws.append(row(*[c(ws, h, "skins_header") for h in headers]))
+    for name, total_units in scored.total_units.items():
+        cells = [c(ws, name, "skins_cell")]
+        for res in scored.round_results:
+            units = res["payout_map_units"].get(name)
+            amount = res["payout_map_amount"].get(name)
+            cells += [c(ws, units or None, "skins_cell"), c(ws, round(amount, 2) if amount else None, "skins_money")]
+        cells += [c(ws, total_units or None, "skins_cell"),
+                  c(ws, round(scored.total_amount[name], 2), "skins_money")]
+        ws.append(row(*cells))
+    paid = [c(ws, "Total Paid", "skins_bold")]
+    for res in scored.round_results:
+        paid += [None, c(ws, round(sum(res["payout_map_amount"].values()), 2), "skins_money_bold")]
+    paid += [None, c(ws, round(sum(scored.total_amount.values()), 2), "skins_money_bold")]
+    ws.append(row(*paid))
+
+    ws.append([])
+    ws.append(row(*[c(ws, h, "skins_header") for h in ("Round", "Course", "Date", "Carry In", "Carry Out")]))
+    for k, (rnd, carry_in, res) in enumerate(zip(rounds, scored.carry_in, scored.round_results), start=1):
+        ws.append(row(c(ws, f"Round {k}", "skins_cell"), c(ws, rnd.course, "skins_cell"),
+                      c(ws, rnd.date_text(), "skins_cell"), c(ws, carry_in, "skins_cell"),
+                      c(ws, res["carryover_remaining"], "skins_cell")))
+
+    for k, (rnd, res) in enumerate(zip(rounds, scored.round_results), start=1):
+        write_report_sheets(wb, rnd, res, f"Round {k}", f"Round {k} Summary")
+        if progress is not None:
+            progress(k / n)
+    return wb
+
+
+def _flight_sheet_labels(flights):
+    """Sheet-name prefix for each flight: forbidden characters dropped, cut to fit, and unique.
+
+    Flights that clean up to the same name ("A/B" and "AB", or "a" and "A",
+    since Excel ignores case) get " 2", " 3"... so no flight's sheets are
+    renamed by openpyxl and missed on import.
+    """
+    room = SHEET_NAME_CHARS - len(FLIGHT_SUMMARY_SUFFIX)
+    labels, used = [], set()
+    for flight in flights:
+        base = "".join(ch for ch in flight_label(flight) if ch not in SHEET_NAME_FORBIDDEN).strip() or "Flight"
+        label, n = base[:room], 1
+        while label.casefold() in used:
+            n += 1
+            label = f"{base[:room - len(str(n)) - 1].rstrip()} {n}"
+        used.add(label.casefold())
+        labels.append(label)
+    return labels
+
+
+@instrumented("workbook build")
+def build_flights_workbook(rnd, scored, progress=None):
+    """One workbook for a flighted round: a "Flights" overview, then each flight's report and summary sheets.
+
+    `scored` is skins_flights.score_flights() output. The overview lists
+    each flight's pot and payout, every player's combined units and amount,
+    and the round's own settings and Flight Pots, which read_report() takes
+    back. `progress` gets the fraction of flights written and may raise to abort.
+    """
+    wb = new_report_workbook()
+    ws = wb.create_sheet(FLIGHTS_SHEET)
+    c, row = _styled, _report_row
+
+    ws.column_dimensions[get_column_letter(1 + COL_OFF)].width = 24
+    for col in range(2, 7):
+        ws.column_dimensions[get_column_letter(col + COL_OFF)].width = 14
+    ws.merged_cells.add(f"{get_column_letter(1 + COL_OFF)}1:{get_column_letter(6 + COL_OFF)}1")
+    ws.append(row(c(ws, report_title(rnd.course, rnd.date_text()), "skins_title")))
+    ws.append(row("Course:", rnd.course, None, "Flights", len(scored.flights)))
+    ws.append(row("Date:", rnd.date_text()))
+    ws.append([])
+
+    ws.append(row(*[c(ws, h, "skins_header") for h in
+                    ("Flight", "Players", "Per-skin $", "Total Purse $", "Paid $", "Carry Out")]))
+    for flight, frnd, res in zip(scored.flights, scored.flight_rounds, scored.flight_results):
+        purse = frnd.settings.total_purse
+        ws.append(row(c(ws, flight_label(flight), "skins_cell"), c(ws, len(frnd.included_players()), "skins_cell"),
+                      c(ws, round(float(res["per_skin"]), 2), "skins_money"),
+                      c(ws, float(purse) if purse is not None else None, "skins_money"),
+                      c(ws, round(sum(res["payout_map_amount"].values()), 2), "skins_money"),
+                      c(ws, res["carryover_remaining"], "skins_cell")))
+    ws.append([])
+
+    ws.append(row(*[c(ws, h, "skins_header") for h in ("Name", "Flight", "Units", "Amount$")]))
+    for frnd, res in zip(scored.flight_rounds, scored.flight_results):
+        for p in frnd.included_players():
+            units = res["payout_map_units"].get(p.name, 0.0)
+            amount = res["payout_map_amount"].get(p.name, 0.0)
+            ws.append(row(c(ws, p.name, "skins_cell"), c(ws, flight_label(p.flight), "skins_cell"),
+                          c(ws, units if units != 0 else None, "skins_cell"),
+                          c(ws, round(amount, 2) if amount != 0 else None, "skins_money")))
+    ws.append(row(c(ws, "Total Paid", "skins_bold"), None, None,
+                  c(ws, round(sum(scored.total_amount.values()), 2), "skins_money_bold")))
+    ws.append([])
+
+    settings = rnd.settings or SkinsSettings()
+    ws.append(row(c(ws, ROUND_SETTINGS_HEADER, "skins_bold"), c(ws, "Value", "skins_bold")))
+
+    def srow(k, v):
+        ws.append(row(c(ws, k, "skins_cell"), c(ws, v, "skins_cell")))
+
+    srow("Per-skin $", float(settings.per_skin))
+    if settings.total_purse is not None:
+        srow("Total Purse $", float(settings.total_purse))
+    srow("Flight Pots", flight_pots_text(rnd.flight_pots))
+    if rnd.round_id:
+        srow("Round ID", rnd.round_id)
+    srow("Carryover Enabled", str(settings.carryover))
+    srow("Use Net Scores", str(settings.use_net))
+    srow("Bonuses Enabled", str(settings.bonus_enabled))
+    srow("Split Ties", str(settings.split_ties))
+    if settings.slope is not None:
+        srow("Slope", settings.slope)
+        srow("Course Rating", settings.course_rating)
+
+    labels = _flight_sheet_labels(scored.flights)
+    for k, (label, frnd, res) in enumerate(zip(labels, scored.flight_rounds, scored.flight_results), start=1):
+        write_report_sheets(wb, frnd, res, label + FLIGHT_REPORT_SUFFIX, label + FLIGHT_SUMMARY_SUFFIX)
+        if progress is not None:
+            progress(k / len(scored.flights))
+    return wb
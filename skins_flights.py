@@ -0,0 +1,137 @@
+"""Flighted fields: each flight is its own skins game, scored independently.
+
+Players carry a flight label (A, B, C...) and each flight has its own pot
+(Round.flight_pots; flights without one use the round's per-skin, or share
+its total purse in proportion to their players).
+Flights never tie or carry against each other, so a large field no longer
+makes one pool where a skin almost never stands alone. The flights are
+computed through the round engine in parallel (threads for the fields the
+window holds, processes for big ones) and combined into one result and one
+workbook.
+
+    python skins_flights.py saturday.json --pots "A=5, B=3, C=purse 120" --out saturday.xlsx
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from typing import NamedTuple
+
+from skins_engine import RULE_TOGGLES, SkinsSettings
+from skins_formats import load_round
+from skins_model import Round, flight_label, parse_flight_pots
+
+
+# from this many included players flights are scored in processes; below it a
+# process pool costs more than it saves, and threads are used (the engine's
+# NumPy passes release the GIL)
+PARALLEL_MIN_PLAYERS = 400
+
+
+class FlightsResult(NamedTuple):
+    # flight labels, in order of first appearance
+    flights: list
+    # each flight's Round (with its pot applied) and engine result dict
+    flight_rounds: list
+    flight_results: list
+    # name -> units / amount over all flights
+    total_units: dict
+    total_amount: dict
+
+
+def default_jobs(rnd):
+    """Workers worth using for `rnd`: one per flight, up to one per CPU."""
+    return max(1, min(os.cpu_count() or 1, len(rnd.flight_sizes())))
+
+
+def score_flights(rnd, jobs=1, progress=None):
+    """Score each flight of `rnd` as its own game and combine the payouts.
+
+    `jobs` > 1 computes flights in parallel: in a process pool from
+    PARALLEL_MIN_PLAYERS included players, else in threads. `progress` is
+    called with the fraction of flights scored and may raise to stop.
+    """
+    sizes = rnd.flight_sizes()
+    flights = list(sizes)
+    rounds = [rnd.flight_round(f, sizes) for f in flights]
+    pool = None
+    if jobs != 1 and len(rounds) > 1:
+        executor = ProcessPoolExecutor if sum(sizes.values()) >= PARALLEL_MIN_PLAYERS else ThreadPoolExecutor
+        pool = executor(max_workers=jobs)
+    results = []
+    try:
+        computed = pool.map(Round.compute, rounds) if pool is not None else map(Round.compute, rounds)
+        for k, res in enumerate(computed, start=1):
+            results.append(res)
+            if progress is not None:
+                progress(k / len(rounds))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    total_units, total_amount = {}, {}
+    for res in results:
+        for name, units in res["payout_map_units"].items():
+            total_units[name] = total_units.get(name, 0.0) + units
+            total_amount[name] = total_amount.get(name, 0.0) + res["payout_map_amount"][name]
+    return FlightsResult(flights, rounds, results, total_units, total_amount)
+
+
+def compare_flights(rnd):
+    """SkinsEngine.compare_rules() for each flight: [(settings, {flight: results})], current rules first.
+
+    Every flight is its own tie pool under its own pot; only the four rule
+    toggles vary, so the k-th variant of every flight is the same rule set.
+    An unflighted round is the single flight "".
+    """
+    sizes = rnd.flight_sizes()
+    per_flight = {}
+    for flight in sizes:
+        frnd = rnd.flight_round(flight, sizes)
+        per_flight[flight] = frnd.engine().compare_rules(*frnd.field())
+    if not per_flight:
+        return []
+    rules = [settings for settings, _ in next(iter(per_flight.values()))]
+    base = rnd.settings or SkinsSettings()
+    return [(replace(base, **{t: getattr(settings, t) for t in RULE_TOGGLES}),
+             {flight: variants[k][1] for flight, variants in per_flight.items()})
+            for k, settings in enumerate(rules)]
+
+
+def payout_results(scored):
+    """The combined payouts under the engine's result keys, for write_round(); there are no combined hole results."""
+    return {"payout_map_units": scored.total_units, "payout_map_amount": scored.total_amount}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a flighted round, one skins game per flight.")
+    parser.add_argument("round", help="round file (.skins, .json, .csv or report .xlsx) with player flights")
+    parser.add_argument("--pots", help='flight pots, e.g. "A=5, B=3, C=purse 120" (replaces any in the file)')
+    parser.add_argument("--out", help="write one workbook with the combined payouts and every flight's report")
+    parser.add_argument("--jobs", type=int, help="workers (default: one per flight, up to one per CPU)")
+    args = parser.parse_args(argv)
+
+    rnd = load_round(args.round)
+    if args.pots is not None:
+        try:
+            rnd.flight_pots = parse_flight_pots(args.pots)
+        except ValueError as e:
+            parser.error(str(e))
+    scored = score_flights(rnd, jobs=args.jobs or default_jobs(rnd))
+    for flight, frnd, res in zip(scored.flights, scored.flight_rounds, scored.flight_results):
+        paid = sum(res["payout_map_amount"].values())
+        print(f"{flight_label(flight)}: {len(frnd.included_players())} players, ${res['per_skin']:g}/skin, "
+              f"paid {paid:.2f}, carry out {res['carryover_remaining']}")
+    flight_of = {p.name: p.flight for p in rnd.included_players()}
+    print(f"{'Player':<20} {'Flight':<10} {'Units':>8} {'Amount$':>10}")
+    for name, units in sorted(scored.total_units.items(), key=lambda kv: -scored.total_amount[kv[0]]):
+        print(f"{name:<20} {flight_label(flight_of[name]):<10} {units:>8g} {scored.total_amount[name]:>10.2f}")
+    if args.out:
+        from skins_excel import build_flights_workbook
+        build_flights_workbook(rnd, scored).save(args.out)
+        print(f"Workbook written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
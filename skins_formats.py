@@ -0,0 +1,476 @@
+"""Native round files (.skins binary, CSV and JSON), a fast alternative to the Excel report.
+
+All of them carry the same fields as the report workbook: course, date,
+pars, stroke index, settings and the players with their 18 scores (CSV and
+JSON add units and amounts when written with results). CSV and JSON are read
+by streaming rows with the csv/json modules and converting the score columns
+in one NumPy pass, so no openpyxl is needed.
+
+CSV layout (metadata lines start with "#", then the report's player table):
+
+    #bigboyskins-round,1
+    #course,Pine Valley
+    #date,2026-05-01
+    #use_net,True
+    ...
+    #flight_pots,"A=5, B=purse 120"
+    Name,HCP,Included,H1,...,H18,Front9,Back9,Units,Amount$,Flight
+    Par,,,4,...
+    Stroke Index,,,1,...
+    Bob,4,True,4,5,...,A
+
+The .skins binary format (layout below) is for saving a round in progress:
+it is written in one go and read through mmap with no parsing at all.
+"""
+import csv
+import json
+import math
+import mmap
+import os
+import struct
+from dataclasses import asdict, fields
+
+import numpy as np
+
+from skins_diag import instrumented
+from skins_engine import HOLES, MAX_HOLE_SCORE, MISSING_SCORE, SkinsSettings, parse_handicap
+from skins_model import (DEFAULT_PAR, INCLUDED_WORDS, FlightPot, Player, Round, flight_pots_text,
+                         parse_flight_pots, parse_score_cells)
+
+
+ROUND_FORMAT = "bigboyskins-round"
+ROUND_FORMAT_VERSION = 1
+ROUND_SUFFIXES = (".skins", ".csv", ".json")
+HOLE_COLUMNS = [f"H{i + 1}" for i in range(HOLES)]
+CSV_COLUMNS = ["Name", "HCP", "Included"] + HOLE_COLUMNS + ["Front9", "Back9", "Units", "Amount$", "Flight"]
+
+
+class RoundFormatError(ValueError):
+    """The file is not a round in the native CSV/JSON format."""
+
+
+def _num_text(v):
+    # str() of a float round-trips exactly, unlike the :g the reports use
+    return "" if v is None else str(v)
+
+
+def _settings_from_text(values):
+    """SkinsSettings from "#field,value" metadata text (missing fields keep the defaults)."""
+    defaults = SkinsSettings()
+    kwargs = {}
+    for f in fields(SkinsSettings):
+        if f.name not in values:
+            continue
+        text = values[f.name].strip()
+        if isinstance(getattr(defaults, f.name), bool):
+            kwargs[f.name] = INCLUDED_WORDS.get(text.lower(), text == "1")
+        elif text != "":
+            kwargs[f.name] = float(text)
+        elif f.name != "per_skin":
+            kwargs[f.name] = None
+    return SkinsSettings(**kwargs)
+
+
+def _player_results(rnd, results):
+    """{name: (units, amount)} for the included players, or {} without results."""
+    if results is None:
+        return {}
+    units = results["payout_map_units"]
+    amounts = results["payout_map_amount"]
+    return {p.name: (units.get(p.name, 0.0), amounts.get(p.name, 0.0)) for p in rnd.included_players()}
+
+
+def write_round_csv(path, rnd, results=None):
+    """Write `rnd` as a native round CSV; Units/Amount$ are filled when `results` are given."""
+    money = _player_results(rnd, results)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow([f"#{ROUND_FORMAT}", ROUND_FORMAT_VERSION])
+        w.writerow(["#course", rnd.course])
+        w.writerow(["#date", rnd.date_text()])
+        if rnd.round_id:
+            w.writerow(["#round_id", rnd.round_id])
+        if rnd.settings is not None:
+            for key, value in asdict(rnd.settings).items():
+                w.writerow([f"#{key}", value if isinstance(value, bool) else _num_text(value)])
+        if rnd.flight_pots:
+            w.writerow(["#flight_pots", flight_pots_text(rnd.flight_pots)])
+        w.writerow(CSV_COLUMNS)
+        w.writerow(["Par", "", ""] + list(rnd.pars))
+        if rnd.stroke_index is not None:
+            w.writerow(["Stroke Index", "", ""] + list(rnd.stroke_index))
+        for p in rnd.players:
+            scores = ["" if s == MISSING_SCORE else s for s in p.scores.tolist()]
+            paid = ["", ""]
+            if p.included and p.name in money:
+                units, amount = money[p.name]
+                paid = [f"{units:g}", f"{amount:.2f}"]
+            w.writerow([p.name, _num_text(p.handicap), p.included] + scores + [p.front9, p.back9] + paid + [p.flight])
+
+
+def _hole_numbers(cells, default):
+    """Par or stroke index cells as ints; blank or bad cells get default(hole)."""
+    out = []
+    for i, v in enumerate(cells):
+        try:
+            out.append(int(v))
+        except ValueError:
+            out.append(default(i))
+    return out
+
+
+def is_round_csv(path):
+    """True when the CSV at `path` is a native round file rather than a saved report sheet."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return f.readline().startswith(f"#{ROUND_FORMAT}")
+
+
+def read_round_csv(path):
+    """Read a native round CSV into a Round (settings None if the file has none)."""
+    meta = {}
+    header = None
+    pars = stroke_index = None
+    names, handicaps, included, flights, cells = [], [], [], [], []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.reader(f):
+            if not row:
+                continue
+            if row[0].startswith("#"):
+                meta[row[0][1:].strip()] = row[1] if len(row) > 1 else ""
+                continue
+            if header is None:
+                header = {h.strip(): i for i, h in enumerate(row)}
+                missing = [c for c in ["Name", "HCP", "Included"] + HOLE_COLUMNS if c not in header]
+                if missing:
+                    raise RoundFormatError(f"{path}: missing columns {', '.join(missing)}")
+                name_col, hcp_col, inc_col = header["Name"], header["HCP"], header["Included"]
+                hole_cols = [header[c] for c in HOLE_COLUMNS]
+                flight_col = header.get("Flight")
+                continue
+            row += [""] * (len(header) - len(row))
+            label = row[name_col].strip()
+            holes = [row[c] for c in hole_cols]
+            if label.lower() == "par":
+                pars = holes
+            elif label.lower() in ("stroke index", "si"):
+                stroke_index = holes
+            elif label != "":
+                hcp = row[hcp_col].strip()
+                names.append(label)
+                handicaps.append(parse_handicap(hcp) if hcp != "" else None)
+                included.append(INCLUDED_WORDS.get(row[inc_col].strip().lower(), True))
+                flights.append(row[flight_col].strip() if flight_col is not None else "")
+                cells.append(holes)
+    if ROUND_FORMAT not in meta or header is None:
+        raise RoundFormatError(f"{path} is not a {ROUND_FORMAT} CSV file")
+
+    scores, _ = parse_score_cells(cells)
+    players = [Player(n, h, inc, s, fl) for n, h, inc, s, fl in zip(names, handicaps, included, scores, flights)]
+    settings_keys = {f.name for f in fields(SkinsSettings)} & meta.keys()
+    return Round(
+        _hole_numbers(pars, lambda i: DEFAULT_PAR) if pars is not None else None,
+        _hole_numbers(stroke_index, lambda i: i + 1) if stroke_index is not None else None,
+        _settings_from_text(meta) if settings_keys else None,
+        players,
+        course=meta.get("course", "").strip(),
+        date=meta.get("date", "").strip(),
+        flight_pots=parse_flight_pots(meta.get("flight_pots", "")),
+        round_id=meta.get("round_id", "").strip(),
+    )
+
+
+def round_to_dict(rnd, results=None):
+    """JSON-ready dict of `rnd`; with `results`, payouts and hole results are included too."""
+    money = _player_results(rnd, results)
+    data = {
+        "format": ROUND_FORMAT,
+        "version": ROUND_FORMAT_VERSION,
+        "round_id": rnd.round_id,
+        "course": rnd.course,
+        "date": rnd.date_text(),
+        "pars": list(rnd.pars),
+        "stroke_index": list(rnd.stroke_index) if rnd.stroke_index is not None else None,
+        "settings": asdict(rnd.settings) if rnd.settings is not None else None,
+        "players": [
+            {"name": p.name, "handicap": p.handicap, "included": p.included, "flight": p.flight,
+             "scores": [None if s == MISSING_SCORE else s for s in p.scores.tolist()]}
+            for p in rnd.players
+        ],
+        "flight_pots": {flight: pot._asdict() for flight, pot in rnd.flight_pots.items()},
+    }
+    if results is not None:
+        for entry in data["players"]:
+            if entry["name"] in money and entry["included"]:
+                entry["units"], entry["amount"] = money[entry["name"]]
+    # combined flight payouts (skins_flights.payout_results) have no single set of hole results
+    if results is not None and "hole_results" in results:
+        data["results"] = {
+            "per_skin": results["per_skin"],
+            "carryover_remaining": results["carryover_remaining"],
+            "hole_results": results["hole_results"],
+        }
+    return data
+
+
+def round_from_dict(data):
+    """Round from round_to_dict() output (any "results" are ignored; they are recomputed)."""
+    if data.get("format") != ROUND_FORMAT:
+        raise RoundFormatError(f"not a {ROUND_FORMAT} document")
+    players = data.get("players", [])
+    # one int16 matrix for the whole field; None and out-of-range scores become missing
+    gross = np.array([[MISSING_SCORE if s is None else s for s in p["scores"]] for p in players],
+                     dtype=np.int16).reshape(len(players), HOLES)
+    gross[(gross < 0) | (gross > MAX_HOLE_SCORE)] = MISSING_SCORE
+    settings = data.get("settings")
+    return Round(
+        data.get("pars"),
+        data.get("stroke_index"),
+        SkinsSettings(**settings) if settings is not None else None,
+        [Player(p["name"], p.get("handicap"), bool(p.get("included", True)), row, p.get("flight") or "")
+         for p, row in zip(players, gross.astype(np.int8))],
+        course=data.get("course") or "",
+        date=data.get("date") or "",
+        flight_pots={flight: FlightPot(**pot) for flight, pot in (data.get("flight_pots") or {}).items()},
+        round_id=data.get("round_id") or "",
+    )
+
+
+def write_round_json(path, rnd, results=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(round_to_dict(rnd, results), f, indent=1)
+
+
+def read_round_json(path):
+    with open(path, encoding="utf-8") as f:
+        return round_from_dict(json.load(f))
+
+
+# .skins binary layout (little-endian), everything at fixed or computed offsets:
+#   header    magic, version, flags (bit 0: stroke index, bit 1: settings, bit 2: flights), players
+#   holes     int8 pars[18], int8 stroke_index[18]
+#   settings  uint8 use_net, carryover, split_ties, bonus_enabled;
+#             float64 per_skin, total_purse, slope, course_rating (NaN = None)
+#   players   float64 handicaps[P] (NaN = blank), uint8 included[P], int8 scores[P][18]
+#   strings   uint32 offsets[S + 1] into a UTF-8 blob of course, date, names...;
+#             with flights (version 2) also the players' flights and the flight pots text
+#   round id  (flag bit 3) after the string blob: uint16 length, then the UTF-8 round id
+# Unflighted rounds are still written as version 1, so older builds can open them;
+# they ignore the unknown flag bit and the bytes after the strings.
+SKINS_MAGIC = b"BBSKINS\x00"
+SKINS_VERSION = 2
+SKINS_HEADER = struct.Struct("<8sHHI")
+SKINS_SETTINGS = struct.Struct("<4B4d")
+SKINS_HAS_SI = 1
+SKINS_HAS_SETTINGS = 2
+SKINS_HAS_FLIGHTS = 4
+SKINS_HAS_ROUND_ID = 8
+SKINS_ROUND_ID_LENGTH = struct.Struct("<H")
+SKINS_PLAYERS_OFFSET = SKINS_HEADER.size + 2 * HOLES + SKINS_SETTINGS.size
+
+
+def _nan_if_none(v):
+    return math.nan if v is None else float(v)
+
+
+def _none_if_nan(v):
+    return None if math.isnan(v) else float(v)
+
+
+def write_round_binary(path, rnd):
+    """Write `rnd` as a .skins file; written to a temp file and renamed so a crash never leaves half a round."""
+    players = rnd.players
+    n = len(players)
+    flighted = rnd.is_flighted() or bool(rnd.flight_pots)
+    round_id = rnd.round_id.encode("utf-8")
+    flags = ((SKINS_HAS_SI if rnd.stroke_index is not None else 0) | (SKINS_HAS_SETTINGS if rnd.settings else 0)
+             | (SKINS_HAS_FLIGHTS if flighted else 0) | (SKINS_HAS_ROUND_ID if round_id else 0))
+    st = rnd.settings or SkinsSettings()
+    texts = [rnd.course or "", rnd.date_text()] + [p.name for p in players]
+    if flighted:
+        texts += [p.flight for p in players] + [flight_pots_text(rnd.flight_pots)]
+    strings = [s.encode("utf-8") for s in texts]
+    offsets = np.zeros(len(strings) + 1, dtype="<u4")
+    offsets[1:] = np.cumsum([len(b) for b in strings])
+    gross = np.array([p.scores for p in players], dtype=np.int8).reshape(n, HOLES)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(SKINS_HEADER.pack(SKINS_MAGIC, 2 if flighted else 1, flags, n))
+        f.write(np.asarray(rnd.pars, dtype=np.int8).tobytes())
+        f.write(np.asarray(rnd.stroke_index if rnd.stroke_index is not None else [0] * HOLES, dtype=np.int8).tobytes())
+        f.write(SKINS_SETTINGS.pack(st.use_net, st.carryover, st.split_ties, st.bonus_enabled,
+                                    _nan_if_none(st.per_skin), _nan_if_none(st.total_purse),
+                                    _nan_if_none(st.slope), _nan_if_none(st.course_rating)))
+        f.write(np.array([_nan_if_none(p.handicap) for p in players], dtype="<f8").tobytes())
+        f.write(np.array([p.included for p in players], dtype=np.uint8).tobytes())
+        f.write(gross.tobytes())
+        f.write(offsets.tobytes())
+        f.write(b"".join(strings))
+        if round_id:
+            f.write(SKINS_ROUND_ID_LENGTH.pack(len(round_id)) + round_id)
+    os.replace(tmp, path)
+
+
+class SkinsFile:
+    """A memory-mapped .skins file.
+
+    `pars`, `stroke_index`, `handicaps`, `included` and `scores` are NumPy
+    views straight onto the mapping (nothing is parsed or copied); names are
+    decoded on demand. Use as a context manager, and copy any array that must
+    outlive close().
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise RoundFormatError(f"{path} is empty") from None
+        try:
+            self._load(path)
+        except Exception:
+            self._release()
+            raise
+
+    def _load(self, path):
+        buf = self._map
+        if len(buf) < SKINS_PLAYERS_OFFSET:
+            raise RoundFormatError(f"{path} is too short to be a .skins file")
+        magic, version, self.flags, n = SKINS_HEADER.unpack_from(buf, 0)
+        if magic != SKINS_MAGIC:
+            raise RoundFormatError(f"{path} is not a .skins file")
+        if version > SKINS_VERSION:
+            raise RoundFormatError(f"{path} is .skins version {version}; this program reads up to {SKINS_VERSION}")
+        strings = 2 * n + 3 if self.flags & SKINS_HAS_FLIGHTS else n + 2
+        if len(buf) < SKINS_PLAYERS_OFFSET + n * (9 + HOLES) + 4 * (strings + 1):
+            raise RoundFormatError(f"{path} is truncated")
+        self.version = version
+        self.player_count = n
+        pos = SKINS_HEADER.size
+        self.pars = np.frombuffer(buf, np.int8, HOLES, pos)
+        self.stroke_index = np.frombuffer(buf, np.int8, HOLES, pos + HOLES) if self.flags & SKINS_HAS_SI else None
+        self._settings = SKINS_SETTINGS.unpack_from(buf, pos + 2 * HOLES)
+        pos = SKINS_PLAYERS_OFFSET
+        self.handicaps = np.frombuffer(buf, "<f8", n, pos)
+        self.included = np.frombuffer(buf, np.uint8, n, pos + 8 * n)
+        pos += 9 * n
+        self.scores = np.frombuffer(buf, np.int8, n * HOLES, pos).reshape(n, HOLES)
+        pos += n * HOLES
+        self._offsets = np.frombuffer(buf, "<u4", strings + 1, pos)
+        self._strings = pos + 4 * (strings + 1)
+        self._round_id_at = self._strings + int(self._offsets[-1])
+        end = self._round_id_at
+        if self.flags & SKINS_HAS_ROUND_ID:
+            end += SKINS_ROUND_ID_LENGTH.size
+            if end <= len(buf):
+                end += SKINS_ROUND_ID_LENGTH.unpack_from(buf, self._round_id_at)[0]
+        if end > len(buf):
+            raise RoundFormatError(f"{path} is truncated")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _release(self):
+        # drop our views first; mmap refuses to close while buffers are exported
+        self.pars = self.stroke_index = self.handicaps = self.included = self.scores = self._offsets = None
+        self._map.close()
+
+    def close(self):
+        self._release()
+
+    def _string(self, k):
+        start, end = int(self._offsets[k]), int(self._offsets[k + 1])
+        return self._map[self._strings + start:self._strings + end].decode("utf-8")
+
+    @property
+    def course(self):
+        return self._string(0)
+
+    @property
+    def date(self):
+        return self._string(1)
+
+    @property
+    def names(self):
+        return [self._string(k + 2) for k in range(self.player_count)]
+
+    @property
+    def round_id(self):
+        """Round.round_id, or "" for a file saved without one."""
+        if not self.flags & SKINS_HAS_ROUND_ID:
+            return ""
+        start = self._round_id_at + SKINS_ROUND_ID_LENGTH.size
+        (size,) = SKINS_ROUND_ID_LENGTH.unpack_from(self._map, self._round_id_at)
+        return self._map[start:start + size].decode("utf-8")
+
+    @property
+    def flights(self):
+        """Each player's flight ("" for none)."""
+        if not self.flags & SKINS_HAS_FLIGHTS:
+            return [""] * self.player_count
+        return [self._string(k + 2 + self.player_count) for k in range(self.player_count)]
+
+    @property
+    def flight_pots(self):
+        if not self.flags & SKINS_HAS_FLIGHTS:
+            return {}
+        return parse_flight_pots(self._string(2 + 2 * self.player_count))
+
+    @property
+    def settings(self):
+        """SkinsSettings, or None when the round was saved without settings."""
+        if not self.flags & SKINS_HAS_SETTINGS:
+            return None
+        net, carry, split, bonus, per_skin, purse, slope, rating = self._settings
+        return SkinsSettings(bool(net), bool(carry), bool(split), bool(bonus), float(per_skin),
+                             _none_if_nan(purse), _none_if_nan(slope), _none_if_nan(rating))
+
+    def to_round(self):
+        """A Round holding copies of the mapped data."""
+        gross = self.scores.copy()
+        handicaps = [None if math.isnan(h) else (int(h) if h.is_integer() else h) for h in self.handicaps.tolist()]
+        players = [Player(name, h, bool(inc), row, flight) for name, h, inc, row, flight
+                   in zip(self.names, handicaps, self.included.tolist(), gross, self.flights)]
+        return Round(self.pars.tolist(), self.stroke_index.tolist() if self.stroke_index is not None else None,
+                     self.settings, players, course=self.course, date=self.date, flight_pots=self.flight_pots,
+                     round_id=self.round_id)
+
+
+def read_round_binary(path):
+    with SkinsFile(path) as f:
+        return f.to_round()
+
+
+@instrumented("round file save")
+def write_round(path, rnd, results=None):
+    """Write a round file, picking the format from the suffix (.skins, .csv or .json).
+
+    .skins files hold the round only; `results` are recomputed on load.
+    """
+    lower = path.lower()
+    if lower.endswith(".skins"):
+        write_round_binary(path, rnd)
+    elif lower.endswith(".json"):
+        write_round_json(path, rnd, results)
+    else:
+        write_round_csv(path, rnd, results)
+
+
+@instrumented("round file load")
+def load_round(path):
+    """Read any round file: native .skins/.json/.csv, a report sheet saved as CSV, or a report workbook."""
+    lower = path.lower()
+    if lower.endswith(".skins"):
+        return read_round_binary(path)
+    if lower.endswith(".json"):
+        return read_round_json(path)
+    if lower.endswith(".csv") and is_round_csv(path):
+        return read_round_csv(path)
+    # openpyxl is only needed for workbooks
+    from skins_excel import read_report, read_report_csv
+    if lower.endswith(".csv"):
+        return read_report_csv(path)
+    return read_report(path)
@@ -0,0 +1,253 @@
+"""Typed round model shared by the GUI, engine, Excel import/export, batch CLI and history store.
+
+A Round holds pars and stroke index as array('b') and a list of Players;
+each Player keeps its 18 hole scores as an int8 NumPy array with
+MISSING_SCORE for blanks, so no stage has to re-parse strings or "" sentinels.
+Players may carry a flight label; each flight is a separate skins game
+with its own pot (see flight_round()).
+"""
+from array import array
+import csv
+from dataclasses import replace
+from typing import NamedTuple, Optional
+import uuid
+
+import numpy as np
+
+from skins_engine import HOLES, MAX_HOLE_SCORE, MISSING_SCORE, SkinsEngine, SkinsSettings, parse_handicap
+
+
+DEFAULT_PAR = 4
+# first-column labels of lines in a pasted block that are not players
+BLOCK_SKIP_LABELS = ("name", "par", "stroke index", "si")
+INCLUDED_WORDS = {"true": True, "yes": True, "false": False, "no": False}
+# how players with no flight are labelled in reports
+UNFLIGHTED_LABEL = "Unflighted"
+# joins a round id and a flight label into the id of that flight's own round
+FLIGHT_ID_SEPARATOR = ":"
+
+
+def new_round_id():
+    """A fresh Round.round_id."""
+    return uuid.uuid4().hex
+
+
+def flight_label(flight):
+    return flight or UNFLIGHTED_LABEL
+
+
+class FlightPot(NamedTuple):
+    """A flight's own pot: a per-skin amount, or a total purse split over its skins."""
+    per_skin: Optional[float] = None
+    total_purse: Optional[float] = None
+
+
+def parse_flight_pots(text):
+    """{flight: FlightPot} from text like "A=5, B=2, C=purse 120".
+
+    A plain number is that flight's per-skin amount; "purse N" makes N the
+    flight's total purse. Raises ValueError naming the first bad entry.
+    """
+    pots = {}
+    for entry in text.replace(";", ",").split(","):
+        if entry.strip() == "":
+            continue
+        flight, sep, value = entry.partition("=")
+        value = value.strip().lower()
+        try:
+            if not sep or flight.strip() == "":
+                raise ValueError
+            if value.startswith("purse"):
+                pots[flight.strip()] = FlightPot(None, float(value[len("purse"):]))
+            else:
+                pots[flight.strip()] = FlightPot(float(value.lstrip("$")), None)
+        except ValueError:
+            raise ValueError(f"bad flight pot {entry.strip()!r} (expected e.g. A=5 or C=purse 120)") from None
+    return pots
+
+
+def flight_pots_text(pots):
+    """The text form parse_flight_pots() reads."""
+    return ", ".join(f"{flight}=purse {pot.total_purse:g}" if pot.total_purse is not None
+                     else f"{flight}={pot.per_skin:g}" for flight, pot in pots.items())
+
+
+class Player:
+    """One line of the scorecard. `handicap` is a number, or None when left blank; `flight` is "" when unflighted."""
+
+    __slots__ = ("name", "handicap", "included", "scores", "flight")
+
+    def __init__(self, name, handicap=None, included=True, scores=None, flight=""):
+        self.name = name
+        self.handicap = handicap
+        self.included = included
+        self.flight = flight
+        if scores is None:
+            self.scores = np.full(HOLES, MISSING_SCORE, dtype=np.int8)
+        else:
+            self.scores = np.asarray(scores, dtype=np.int8).reshape(HOLES)
+
+    def __repr__(self):
+        return f"Player({self.name!r}, {self.handicap!r}, included={self.included})"
+
+    def nine_total(self, nine):
+        row = self.scores[nine * 9:(nine + 1) * 9]
+        return int(row[row != MISSING_SCORE].sum())
+
+    @property
+    def front9(self):
+        return self.nine_total(0)
+
+    @property
+    def back9(self):
+        return self.nine_total(1)
+
+
+class Round:
+    """Course, date, hole layout, settings and players of one round.
+
+    `stroke_index` may be None (net scoring then falls back to gross) and
+    `settings` may be None for a sheet without an Export Summary; compute()
+    then uses the default SkinsSettings. `flight_pots` maps a flight label
+    to its FlightPot; flights without one use the round's per-skin/purse.
+    `round_id` identifies the round across saves, exports and imports, so a
+    corrected round (renamed or added players, scores) is still the same
+    round; "" when the file it came from had none.
+    """
+
+    __slots__ = ("course", "date", "pars", "stroke_index", "settings", "players", "flight_pots", "round_id")
+
+    def __init__(self, pars=None, stroke_index=None, settings=None, players=(), course="", date="",
+                 flight_pots=None, round_id=""):
+        self.round_id = round_id
+        self.course = course
+        self.date = date
+        self.pars = array("b", pars if pars is not None else [DEFAULT_PAR] * HOLES)
+        self.stroke_index = array("b", stroke_index) if stroke_index is not None else None
+        self.settings = settings
+        self.players = list(players)
+        self.flight_pots = dict(flight_pots or {})
+
+    def date_text(self):
+        """The date as YYYY-MM-DD when it is a date (Excel cells may hold datetimes), else as text."""
+        if hasattr(self.date, "strftime"):
+            return self.date.strftime("%Y-%m-%d")
+        return "" if self.date is None else str(self.date).strip()
+
+    def included_players(self):
+        return [p for p in self.players if p.included]
+
+    def flights(self):
+        """Flight labels of the included players, in order of first appearance."""
+        return list(self.flight_sizes())
+
+    def flight_sizes(self):
+        """{flight: number of included players}, in order of first appearance."""
+        sizes = {}
+        for p in self.included_players():
+            sizes[p.flight] = sizes.get(p.flight, 0) + 1
+        return sizes
+
+    def is_flighted(self):
+        return any(p.flight for p in self.players)
+
+    def flight_settings(self, flight, sizes=None):
+        """The round's settings with `flight`'s pot in place of its per-skin/purse.
+
+        A flight without a pot of its own plays for the round's per-skin, or
+        for its share of the round's total purse: the purse is split over
+        those flights in proportion to their included players. `sizes` is
+        flight_sizes(), for callers that already have it.
+        """
+        settings = self.settings or SkinsSettings()
+        pot = self.flight_pots.get(flight)
+        if pot is None:
+            if settings.total_purse is None:
+                return settings
+            sizes = self.flight_sizes() if sizes is None else sizes
+            sharing = sum(n for f, n in sizes.items() if f not in self.flight_pots)
+            if sharing == 0 or sizes.get(flight, 0) == sharing:
+                return settings
+            return replace(settings, total_purse=settings.total_purse * sizes.get(flight, 0) / sharing)
+        return replace(settings, per_skin=settings.per_skin if pot.per_skin is None else pot.per_skin,
+                       total_purse=pot.total_purse)
+
+    def flight_round(self, flight, sizes=None):
+        """The players of `flight` as a Round of their own, under that flight's pot."""
+        return Round(self.pars, self.stroke_index, self.flight_settings(flight, sizes),
+                     [p for p in self.players if p.flight == flight],
+                     course=self.course, date=self.date,
+                     round_id=f"{self.round_id}{FLIGHT_ID_SEPARATOR}{flight}" if self.round_id else "")
+
+    def engine(self, settings=None):
+        return SkinsEngine(self.pars, self.stroke_index, settings or self.settings or SkinsSettings())
+
+    def score_matrix(self, players=None):
+        """int8 players x holes gross matrix (default: included players) and its missing mask."""
+        players = self.included_players() if players is None else players
+        gross = np.array([p.scores for p in players], dtype=np.int8).reshape(len(players), HOLES)
+        return gross, gross == MISSING_SCORE
+
+    def field(self):
+        """(names, handicaps, gross, missing) of the included players, ready for SkinsEngine."""
+        players = self.included_players()
+        gross, missing = self.score_matrix(players)
+        return [p.name for p in players], [parse_handicap(p.handicap) for p in players], gross, missing
+
+    def compute(self, settings=None):
+        """Engine results for the included players (under `settings` if given)."""
+        return self.engine(settings).compute_matrix(*self.field())
+
+
+def parse_score_cells(cells):
+    """Vectorized parse_score() for a players x holes grid of text cells.
+
+    Returns the int8 score matrix (MISSING_SCORE for blank or invalid cells)
+    and a mask of the non-blank cells that were not valid scores.
+    """
+    cells = np.char.strip(np.array(cells, dtype=str).reshape(-1, HOLES))
+    # at most three digits so the int conversion can't overflow
+    numeric = np.char.isdigit(cells) & (np.char.str_len(cells) <= 3)
+    values = np.zeros(cells.shape, dtype=np.int16)
+    values[numeric] = cells[numeric].astype(np.int16)
+    valid = numeric & (values <= MAX_HOLE_SCORE)
+    return np.where(valid, values, MISSING_SCORE).astype(np.int8), (cells != "") & ~valid
+
+
+def parse_score_block(text):
+    """Players from a pasted tab- or comma-delimited block, plus the cells that were rejected.
+
+    Each line is name, handicap and 18 hole scores; a TRUE/FALSE "Included"
+    column after the handicap (as in the Excel report) is also accepted and
+    anything after the 18th hole (Front9, Back9, ...) is ignored. Header,
+    Par and Stroke Index lines and lines without a name are skipped. Scores
+    are validated for the whole block at once; a bad score is left blank and
+    reported as (line number, hole number, text).
+    """
+    lines = text.splitlines()
+    delimiter = "\t" if any("\t" in line for line in lines) else ","
+    names, handicaps, included, cells, line_nos = [], [], [], [], []
+    for line_no, row in enumerate(csv.reader(lines, delimiter=delimiter), start=1):
+        name = row[0].strip() if row else ""
+        if name == "" or name.lower().rstrip(":") in BLOCK_SKIP_LABELS:
+            continue
+        hcp = row[1].strip() if len(row) > 1 else ""
+        holes = row[2:]
+        flag = INCLUDED_WORDS.get(holes[0].strip().lower()) if holes else None
+        if flag is not None:
+            holes = holes[1:]
+        holes = holes[:HOLES]
+        names.append(name)
+        handicaps.append(parse_handicap(hcp) if hcp != "" else None)
+        included.append(True if flag is None else flag)
+        cells.append(holes + [""] * (HOLES - len(holes)))
+        line_nos.append(line_no)
+    if not names:
+        return [], []
+
+    scores, bad = parse_score_cells(cells)
+    bad_rows, bad_holes = np.nonzero(bad)
+    rejected = [(line_nos[r], h + 1, str(cells[r][h]).strip())
+                for r, h in zip(bad_rows.tolist(), bad_holes.tolist())]
+    players = [Player(n, h, inc, row) for n, h, inc, row in zip(names, handicaps, included, scores)]
+    return players, rejected
@@ -0,0 +1,134 @@
+"""Monte Carlo payout simulation from player handicaps.
+
+Synthetic rounds are drawn for a field of handicaps from a simple per-hole
+score model and scored in NumPy batches with SkinsEngine.batch_units, so the
+rules (net/gross, carryover, split ties, bonuses, purse) are the GUI's own.
+Batches can be spread over a process pool.
+
+    python skins_sim.py Bob=4 Jim=12 Al=18 Ed=25 --rounds 1000000 --net --jobs 4
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+import numpy as np
+
+from skins_engine import HOLES, MAX_HOLE_SCORE, SkinsEngine, SkinsSettings, allocate_strokes, parse_handicap
+
+
+# gross score relative to the player's net par (par + strokes received) on a
+# hole, and how often it happens; averages about 5 over handicap per round
+SCORE_MODEL_OFFSETS = np.array([-2, -1, 0, 1, 2, 3], dtype=np.int16)
+SCORE_MODEL_PROBS = np.array([0.02, 0.15, 0.47, 0.26, 0.08, 0.02])
+DEFAULT_BATCH = 20_000
+
+
+class SimulationResult(NamedTuple):
+    """Per-player arrays, in the order the handicaps were given."""
+    rounds: int
+    mean_units: np.ndarray
+    var_units: np.ndarray
+    mean_amount: np.ndarray
+    var_amount: np.ndarray
+    # chance of being the round's top earner (a shared top spot counts fractionally)
+    win_prob: np.ndarray
+
+
+def simulate_scores(rng, pars, stroke_index, course_handicaps, rounds):
+    """int8 rounds x players x holes gross scores drawn from the score model."""
+    si = stroke_index if stroke_index is not None else range(1, HOLES + 1)
+    net_par = np.asarray(pars, dtype=np.int16) + allocate_strokes(course_handicaps, si)
+    offsets = rng.choice(SCORE_MODEL_OFFSETS, size=(rounds,) + net_par.shape, p=SCORE_MODEL_PROBS)
+    return np.clip(net_par + offsets, 1, MAX_HOLE_SCORE).astype(np.int8)
+
+
+def _simulate_batch(pars, stroke_index, settings, handicaps, rounds, seed):
+    """Mergeable sums for one batch: (rounds, units, units**2, amount, amount**2, wins)."""
+    engine = SkinsEngine(pars, stroke_index, settings)
+    rng = np.random.default_rng(seed)
+    gross = simulate_scores(rng, pars, stroke_index, engine.course_handicaps(handicaps), rounds)
+    units = engine.batch_units(handicaps, gross)
+    amounts = engine.batch_amounts(units)
+    top = units == units.max(axis=1, keepdims=True)
+    wins = (top / top.sum(axis=1, keepdims=True)).sum(axis=0)
+    return (rounds, units.sum(axis=0), (units ** 2).sum(axis=0),
+            amounts.sum(axis=0), (amounts ** 2).sum(axis=0), wins)
+
+
+def simulate(pars, stroke_index, settings, handicaps, rounds=100_000, batch_size=DEFAULT_BATCH,
+             jobs=1, seed=None, progress=None):
+    """Simulate `rounds` rounds for the field and summarize each player's payouts.
+
+    `jobs` > 1 runs batches in a process pool. `progress` is called with the
+    fraction of rounds done after each batch and may raise to stop early.
+    """
+    handicaps = [parse_handicap(h) for h in handicaps]
+    sizes = [batch_size] * (rounds // batch_size) + ([rounds % batch_size] if rounds % batch_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(pars, stroke_index, settings, handicaps, n, s) for n, s in zip(sizes, seeds)]
+    totals = None
+
+    def add(batch):
+        nonlocal totals
+        totals = batch if totals is None else tuple(a + b for a, b in zip(totals, batch))
+        if progress is not None:
+            progress(totals[0] / rounds)
+
+    if jobs == 1 or len(args) < 2:
+        for a in args:
+            add(_simulate_batch(*a))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_simulate_batch, *a) for a in args]
+            try:
+                for f in as_completed(futures):
+                    add(f.result())
+            except BaseException:
+                for f in futures:
+                    f.cancel()
+                raise
+
+    n, su, su2, sa, sa2, wins = totals
+    mean_u, mean_a = su / n, sa / n
+    return SimulationResult(n, mean_u, su2 / n - mean_u ** 2, mean_a, sa2 / n - mean_a ** 2, wins / n)
+
+
+def _player_arg(text):
+    name, _, hcp = text.rpartition("=")
+    return (name or text), parse_handicap(hcp)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate skins payouts from handicaps.")
+    parser.add_argument("players", nargs="+", type=_player_arg, help="NAME=HANDICAP (or just a handicap)")
+    parser.add_argument("--rounds", type=int, default=100_000)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--pars", type=int, nargs=HOLES, default=[4] * HOLES)
+    parser.add_argument("--stroke-index", type=int, nargs=HOLES)
+    parser.add_argument("--net", action="store_true", help="score net instead of gross")
+    parser.add_argument("--no-carryover", dest="carryover", action="store_false")
+    parser.add_argument("--split-ties", action="store_true")
+    parser.add_argument("--no-bonus", dest="bonus_enabled", action="store_false")
+    parser.add_argument("--per-skin", type=float, default=1.0)
+    parser.add_argument("--total-purse", type=float)
+    args = parser.parse_args(argv)
+
+    settings = SkinsSettings(use_net=args.net, carryover=args.carryover, split_ties=args.split_ties,
+                             bonus_enabled=args.bonus_enabled, per_skin=args.per_skin, total_purse=args.total_purse)
+    stroke_index = args.stroke_index or list(range(1, HOLES + 1))
+    names = [n for n, _ in args.players]
+    result = simulate(args.pars, stroke_index, settings, [h for _, h in args.players],
+                      rounds=args.rounds, jobs=args.jobs, seed=args.seed)
+    print(f"{result.rounds} rounds")
+    print(f"{'Player':<16} {'HCP':>5} {'Units':>8} {'SD':>7} {'Amount$':>9} {'SD$':>8} {'Win%':>6}")
+    for i, (name, hcp) in enumerate(args.players):
+        print(f"{name:<16} {hcp:>5} {result.mean_units[i]:>8.3f} {np.sqrt(result.var_units[i]):>7.3f}"
+              f" {result.mean_amount[i]:>9.2f} {np.sqrt(result.var_amount[i]):>8.2f}"
+              f" {100 * result.win_prob[i]:>6.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,492 @@
+"""SQLite history of scored rounds.
+
+Every exported round is saved with its pars, stroke index, settings, each
+player's hole scores and the computed hole results and payouts, so season
+money lists, head-to-head records and per-hole winners come from indexed
+queries instead of re-opening workbooks. A flighted round is stored as one
+round per flight, since each flight is a separate game. A round is known by
+its Round.round_id (round_key()), so exporting or importing the same round
+again, even with renamed or added players, replaces the stored copy instead
+of counting its money twice.
+
+    python skins_store.py --season 2026 money
+    python skins_store.py h2h "Bob" "Jim"
+    python skins_store.py hole 7
+    python skins_store.py import rounds/*.json
+    python skins_store.py --season 2026 rounds
+    python skins_store.py replace 12 corrected.json
+    python skins_store.py delete 12
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import asdict
+from datetime import datetime
+
+import numpy as np
+
+from skins_engine import HOLES, MISSING_SCORE, SkinsSettings, hole_result_text, parse_handicap
+from skins_formats import load_round
+from skins_model import FLIGHT_ID_SEPARATOR, Player, Round
+
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), "BigBoySkins_rounds.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    course TEXT NOT NULL,
+    played_on TEXT NOT NULL,            -- YYYY-MM-DD as exported
+    pars TEXT NOT NULL,                 -- JSON lists
+    stroke_index TEXT,
+    settings TEXT NOT NULL,             -- JSON of SkinsSettings
+    per_skin REAL NOT NULL,
+    carryover_remaining REAL NOT NULL,
+    saved_at TEXT NOT NULL,
+    round_key TEXT                      -- round_key(): Round.round_id, or course, date and field
+);
+CREATE TABLE IF NOT EXISTS round_players (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    handicap TEXT NOT NULL,
+    included INTEGER NOT NULL,
+    scores BLOB NOT NULL,               -- HOLES int8 values, MISSING_SCORE for blanks
+    units REAL NOT NULL,
+    amount REAL NOT NULL,
+    PRIMARY KEY (round_id, seq)
+);
+CREATE TABLE IF NOT EXISTS hole_results (
+    round_id INTEGER NOT NULL REFERENCES rounds(id) ON DELETE CASCADE,
+    hole INTEGER NOT NULL,
+    winner TEXT,                        -- sole winner, NULL for carries/splits/no scores
+    tied TEXT NOT NULL,                 -- JSON list of names at the lowest score
+    lowest INTEGER,
+    units REAL NOT NULL,
+    reason TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (round_id, hole)
+);
+CREATE INDEX IF NOT EXISTS idx_rounds_played_on ON rounds(played_on);
+CREATE INDEX IF NOT EXISTS idx_rounds_course ON rounds(course, played_on);
+CREATE INDEX IF NOT EXISTS idx_round_players_name ON round_players(name, round_id);
+CREATE INDEX IF NOT EXISTS idx_hole_results_winner ON hole_results(hole, winner);
+"""
+
+# running season totals, kept in step with the rows above by _apply_round()
+AGGREGATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS player_totals (
+    season TEXT NOT NULL,               -- year of played_on
+    name TEXT NOT NULL,
+    rounds INTEGER NOT NULL,
+    units REAL NOT NULL,
+    amount REAL NOT NULL,
+    skins_won INTEGER NOT NULL,         -- holes won outright
+    birdies INTEGER NOT NULL,
+    eagles INTEGER NOT NULL,
+    PRIMARY KEY (season, name)
+);
+CREATE TABLE IF NOT EXISTS hole_totals (
+    season TEXT NOT NULL,
+    hole INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    wins INTEGER NOT NULL,
+    units REAL NOT NULL,
+    PRIMARY KEY (season, hole, name)
+);
+"""
+# bump when AGGREGATE_SCHEMA changes; older databases are backfilled on open
+# (2: rounds.round_key)
+SCHEMA_VERSION = 2
+
+
+def _date_filter(start, end, course, alias="r"):
+    clauses, params = [], []
+    if start:
+        clauses.append(f"{alias}.played_on >= ?")
+        params.append(start)
+    if end:
+        clauses.append(f"{alias}.played_on <= ?")
+        params.append(end)
+    if course:
+        clauses.append(f"{alias}.course = ?")
+        params.append(course)
+    return "".join(f" AND {c}" for c in clauses), params
+
+
+def season_of(played_on):
+    """Season key of a played_on date string ("" when the round has no usable date)."""
+    year = (played_on or "")[:4]
+    return year if year.isdigit() else ""
+
+
+def season_bounds(year):
+    """(start, end) date strings covering calendar year `year`."""
+    return f"{int(year):04d}-01-01", f"{int(year):04d}-12-31"
+
+
+def _key_of(course, played_on, names):
+    field = sorted({n.strip().casefold() for n in names})
+    text = json.dumps([(course or "").strip().casefold(), played_on or "", field])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def legacy_round_key(rnd):
+    """The key of a round saved without a round_id: its course, date and the names in its field."""
+    return _key_of(rnd.course, rnd.date_text(), [p.name for p in rnd.players])
+
+
+def round_key(rnd):
+    """Identity of a round in the history: its round_id, else legacy_round_key()."""
+    return rnd.round_id or legacy_round_key(rnd)
+
+
+def _round_values(rnd, results):
+    settings = rnd.settings or SkinsSettings()
+    return (rnd.course or "", rnd.date_text(), json.dumps(rnd.pars.tolist()),
+            json.dumps(rnd.stroke_index.tolist()) if rnd.stroke_index is not None else None,
+            json.dumps(asdict(settings)), float(results["per_skin"]),
+            float(results.get("carryover_remaining", 0)), datetime.now().isoformat(timespec="seconds"),
+            round_key(rnd))
+
+
+class RoundStore:
+    """One SQLite connection; create it on the thread that uses it."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA + AGGREGATE_SCHEMA)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._add_round_keys()
+            self.rebuild_aggregates()
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_rounds_key ON rounds(round_key)")
+
+    def _add_round_keys(self):
+        """Add and fill rounds.round_key in a database written before it existed."""
+        with self.conn:
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(rounds)")]
+            if "round_key" not in columns:
+                self.conn.execute("ALTER TABLE rounds ADD COLUMN round_key TEXT")
+            for round_id, course, played_on in self.conn.execute(
+                    "SELECT id, course, played_on FROM rounds WHERE round_key IS NULL").fetchall():
+                names = [n for (n,) in self.conn.execute(
+                    "SELECT name FROM round_players WHERE round_id = ?", (round_id,))]
+                self.conn.execute("UPDATE rounds SET round_key = ? WHERE id = ?",
+                                  (_key_of(course, played_on, names), round_id))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def find_round(self, rnd):
+        """Id of the stored round with `rnd`'s round_key(), or None.
+
+        A round with a round_id also finds a copy stored before it had one.
+        """
+        keys = [round_key(rnd)] + ([legacy_round_key(rnd)] if rnd.round_id else [])
+        for key in keys:
+            row = self.conn.execute("SELECT id FROM rounds WHERE round_key = ? ORDER BY id DESC LIMIT 1",
+                                    (key,)).fetchone()
+            if row is not None:
+                return row[0]
+        return None
+
+    def _retire_copies(self, base_id, keep):
+        """Delete rounds stored under `base_id` or one of its flights, except the ids in `keep`.
+
+        Drops flights that no longer exist, and the other form when a round
+        switches between flighted and unflighted.
+        """
+        prefix = base_id + FLIGHT_ID_SEPARATOR
+        stale = [round_id for (round_id,) in self.conn.execute(
+            "SELECT id FROM rounds WHERE round_key = ? OR substr(round_key, 1, ?) = ?",
+            (base_id, len(prefix), prefix)) if round_id not in keep]
+        for round_id in stale:
+            self.delete_round(round_id)
+
+    def save_round(self, rnd, results):
+        """Store a scored Round with its engine results. Returns the round id.
+
+        A round already stored under the same round_key() is replaced
+        (replace_round()), so saving a round again never double-counts it.
+        """
+        round_id = self.find_round(rnd)
+        if round_id is not None:
+            self.replace_round(round_id, rnd, results)
+        else:
+            round_id = self._insert_round(rnd, results)
+        if rnd.round_id and FLIGHT_ID_SEPARATOR not in rnd.round_id:
+            self._retire_copies(rnd.round_id, {round_id})
+        return round_id
+
+    def _insert_round(self, rnd, results):
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO rounds (course, played_on, pars, stroke_index, settings, per_skin,"
+                " carryover_remaining, saved_at, round_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _round_values(rnd, results),
+            )
+            round_id = cur.lastrowid
+            self._insert_round_rows(round_id, rnd.players, results)
+            self._apply_round(round_id, 1)
+        return round_id
+
+    def save_flights(self, scored):
+        """Store each flight of a skins_flights.score_flights() result as a round of its own. Returns the ids.
+
+        Flights of the same round_id that are no longer in the round are deleted.
+        """
+        ids = [self.save_round(frnd, res) for frnd, res in zip(scored.flight_rounds, scored.flight_results)]
+        flight_id = scored.flight_rounds[0].round_id if scored.flight_rounds else ""
+        if FLIGHT_ID_SEPARATOR in flight_id:
+            self._retire_copies(flight_id.rsplit(FLIGHT_ID_SEPARATOR, 1)[0], set(ids))
+        return ids
+
+    def replace_round(self, round_id, rnd, results):
+        """Correct a stored round in place (same id); season totals move by the difference."""
+        with self.conn:
+            self._apply_round(round_id, -1)
+            self.conn.execute("DELETE FROM round_players WHERE round_id = ?", (round_id,))
+            self.conn.execute("DELETE FROM hole_results WHERE round_id = ?", (round_id,))
+            self.conn.execute(
+                "UPDATE rounds SET course = ?, played_on = ?, pars = ?, stroke_index = ?, settings = ?,"
+                " per_skin = ?, carryover_remaining = ?, saved_at = ?, round_key = ? WHERE id = ?",
+                _round_values(rnd, results) + (round_id,),
+            )
+            self._insert_round_rows(round_id, rnd.players, results)
+            self._apply_round(round_id, 1)
+
+    def delete_round(self, round_id):
+        with self.conn:
+            self._apply_round(round_id, -1)
+            self.conn.execute("DELETE FROM rounds WHERE id = ?", (round_id,))
+
+    def _insert_round_rows(self, round_id, players, results):
+        units = results["payout_map_units"]
+        amounts = results["payout_map_amount"]
+        self.conn.executemany(
+            "INSERT INTO round_players VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(round_id, seq, p.name, "" if p.handicap is None else str(p.handicap), int(p.included),
+              p.scores.tobytes(),
+              float(units.get(p.name, 0.0)) if p.included else 0.0,
+              float(amounts.get(p.name, 0.0)) if p.included else 0.0)
+             for seq, p in enumerate(players)],
+        )
+        hole_rows = []
+        # hole_results come in hole order; their "hole" key is the "H1".."H18" label
+        for hole, hr in enumerate(results.get("hole_results", []), start=1):
+            text, hole_units = hole_result_text(hr)
+            hole_rows.append((round_id, hole, hr.get("sole_winner"), json.dumps(list(hr.get("tied", []))),
+                              hr.get("lowest"), float(hole_units or 0), hr.get("reason", ""), text))
+        self.conn.executemany("INSERT INTO hole_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", hole_rows)
+
+    def _apply_round(self, round_id, sign):
+        """Add (sign=1) or remove (sign=-1) one stored round's share of the season totals."""
+        row = self.conn.execute("SELECT played_on, pars FROM rounds WHERE id = ?", (round_id,)).fetchone()
+        if row is None:
+            return
+        season = season_of(row[0])
+        pars = np.array(json.loads(row[1]), dtype=np.int16)
+        players = self.conn.execute(
+            "SELECT name, scores, units, amount FROM round_players WHERE round_id = ? AND included = 1",
+            (round_id,)).fetchall()
+        holes = self.conn.execute(
+            "SELECT hole, winner, units FROM hole_results WHERE round_id = ? AND winner IS NOT NULL",
+            (round_id,)).fetchall()
+        if players:
+            # birdie/eagle counts exactly as the Export Summary sheet counts them
+            scores = np.frombuffer(b"".join(p[1] for p in players), dtype=np.int8).reshape(len(players), HOLES)
+            valid = scores != MISSING_SCORE
+            birdies = (valid & (scores == pars - 1)).sum(axis=1)
+            eagles = (valid & (scores <= pars - 2)).sum(axis=1)
+        wins = {}
+        for _, winner, _ in holes:
+            wins[winner] = wins.get(winner, 0) + 1
+        self.conn.executemany(
+            "INSERT INTO player_totals VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (season, name) DO UPDATE SET rounds = rounds + excluded.rounds,"
+            " units = units + excluded.units, amount = amount + excluded.amount,"
+            " skins_won = skins_won + excluded.skins_won, birdies = birdies + excluded.birdies,"
+            " eagles = eagles + excluded.eagles",
+            [(season, name, sign, sign * units, sign * amount, sign * wins.get(name, 0),
+              sign * int(birdies[i]), sign * int(eagles[i]))
+             for i, (name, _, units, amount) in enumerate(players)],
+        )
+        self.conn.executemany(
+            "INSERT INTO hole_totals VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (season, hole, name) DO UPDATE SET wins = wins + excluded.wins,"
+            " units = units + excluded.units",
+            [(season, hole, winner, sign, sign * units) for hole, winner, units in holes],
+        )
+        if sign < 0:
+            self.conn.execute("DELETE FROM player_totals WHERE rounds <= 0")
+            self.conn.execute("DELETE FROM hole_totals WHERE wins <= 0")
+
+    def rebuild_aggregates(self):
+        """Recompute every season total from the stored rounds (backfill or repair)."""
+        with self.conn:
+            self.conn.execute("DELETE FROM player_totals")
+            self.conn.execute("DELETE FROM hole_totals")
+            for (round_id,) in self.conn.execute("SELECT id FROM rounds").fetchall():
+                self._apply_round(round_id, 1)
+
+    def seasons(self):
+        return [r[0] for r in self.conn.execute("SELECT DISTINCT season FROM player_totals ORDER BY season")]
+
+    def season_money_list(self, season):
+        """[(name, rounds, units, amount, skins won, birdies, eagles)] from the running totals, richest first."""
+        return self.conn.execute(
+            "SELECT name, rounds, units, amount, skins_won, birdies, eagles FROM player_totals"
+            " WHERE season = ? ORDER BY amount DESC, name", (str(season),)).fetchall()
+
+    def season_hole_winners(self, season, hole):
+        """[(name, wins, units)] on one hole from the running totals, most wins first."""
+        return self.conn.execute(
+            "SELECT name, wins, units FROM hole_totals WHERE season = ? AND hole = ?"
+            " ORDER BY wins DESC, name", (str(season), hole)).fetchall()
+
+    def rounds(self, start=None, end=None, course=None):
+        """[(id, played_on, course)] in date order."""
+        where, params = _date_filter(start, end, course)
+        return self.conn.execute(
+            f"SELECT r.id, r.played_on, r.course FROM rounds r WHERE 1 = 1{where} ORDER BY r.played_on, r.id",
+            params).fetchall()
+
+    def load_round(self, round_id):
+        """The stored Round (settings included), or None if there is no such round."""
+        row = self.conn.execute(
+            "SELECT course, played_on, pars, stroke_index, settings, round_key FROM rounds WHERE id = ?",
+            (round_id,)).fetchone()
+        if row is None:
+            return None
+        course, played_on, pars, stroke_index, settings, key = row
+        players = [
+            Player(name, parse_handicap(hcp) if hcp != "" else None, bool(included),
+                   np.frombuffer(blob, dtype=np.int8).copy())
+            for name, hcp, included, blob in self.conn.execute(
+                "SELECT name, handicap, included, scores FROM round_players WHERE round_id = ? ORDER BY seq",
+                (round_id,))
+        ]
+        return Round(json.loads(pars), json.loads(stroke_index) if stroke_index is not None else None,
+                     SkinsSettings(**json.loads(settings)), players, course=course, date=played_on,
+                     round_id=key or "")
+
+    def player_scores(self, round_id):
+        """[(name, int8 score array)] for one round, in sheet order."""
+        rows = self.conn.execute(
+            "SELECT name, scores FROM round_players WHERE round_id = ? ORDER BY seq", (round_id,)).fetchall()
+        return [(name, np.frombuffer(blob, dtype=np.int8)) for name, blob in rows]
+
+    def money_list(self, start=None, end=None, course=None):
+        """[(name, rounds played, units, amount)] for included players, richest first."""
+        where, params = _date_filter(start, end, course)
+        return self.conn.execute(
+            "SELECT p.name, COUNT(*), SUM(p.units), SUM(p.amount) FROM round_players p"
+            f" JOIN rounds r ON r.id = p.round_id WHERE p.included = 1{where}"
+            " GROUP BY p.name ORDER BY SUM(p.amount) DESC, p.name", params).fetchall()
+
+    def head_to_head(self, a, b, start=None, end=None, course=None):
+        """[(played_on, course, a amount, b amount)] for rounds both players were in."""
+        where, params = _date_filter(start, end, course)
+        return self.conn.execute(
+            "SELECT r.played_on, r.course, pa.amount, pb.amount FROM round_players pa"
+            " JOIN round_players pb ON pb.round_id = pa.round_id AND pb.name = ? AND pb.included = 1"
+            f" JOIN rounds r ON r.id = pa.round_id WHERE pa.name = ? AND pa.included = 1{where}"
+            " ORDER BY r.played_on, r.id", [b, a] + params).fetchall()
+
+    def hole_winners(self, hole, start=None, end=None, course=None):
+        """[(name, skins won outright, units)] on one hole, most wins first."""
+        where, params = _date_filter(start, end, course)
+        return self.conn.execute(
+            "SELECT h.winner, COUNT(*), SUM(h.units) FROM hole_results h JOIN rounds r ON r.id = h.round_id"
+            f" WHERE h.hole = ? AND h.winner IS NOT NULL{where}"
+            " GROUP BY h.winner ORDER BY COUNT(*) DESC, h.winner", [hole] + params).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the Big Boy Skins round history.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--season", type=int, help="limit to one calendar year")
+    parser.add_argument("--course")
+    sub = parser.add_subparsers(dest="query", required=True)
+    sub.add_parser("money", help="season money list")
+    h2h = sub.add_parser("h2h", help="head-to-head amounts for two players")
+    h2h.add_argument("a")
+    h2h.add_argument("b")
+    hole = sub.add_parser("hole", help="who won a hole outright most often")
+    hole.add_argument("hole", type=int)
+    imp = sub.add_parser("import", help="score and save round files (.csv/.json, or report .xlsx)")
+    imp.add_argument("files", nargs="+")
+    sub.add_parser("rounds", help="list stored rounds with their ids")
+    replace = sub.add_parser("replace", help="re-score a round file and store it in place of round ID")
+    replace.add_argument("id", type=int)
+    replace.add_argument("file")
+    delete = sub.add_parser("delete", help="remove round ID from the history")
+    delete.add_argument("id", type=int)
+    args = parser.parse_args(argv)
+
+    start, end = season_bounds(args.season) if args.season else (None, None)
+    with RoundStore(args.db) as store:
+        if args.query == "import":
+            for path in args.files:
+                rnd = load_round(path)
+                if rnd.is_flighted():
+                    from skins_flights import score_flights
+                    ids = store.save_flights(score_flights(rnd))
+                    print(f"{path}: rounds {', '.join(map(str, ids))} ({rnd.course} {rnd.date_text()}, "
+                          f"{len(rnd.players)} players in {len(ids)} flights)")
+                    continue
+                round_id = store.save_round(rnd, rnd.compute())
+                print(f"{path}: round {round_id} ({rnd.course} {rnd.date_text()}, {len(rnd.players)} players)")
+        elif args.query == "rounds":
+            for round_id, played_on, course in store.rounds(start, end, args.course):
+                print(f"{round_id:>6}  {played_on}  {course}")
+        elif args.query in ("replace", "delete"):
+            if store.load_round(args.id) is None:
+                print(f"no round {args.id}")
+                return 1
+            if args.query == "delete":
+                store.delete_round(args.id)
+                print(f"round {args.id} deleted")
+            else:
+                rnd = load_round(args.file)
+                if rnd.is_flighted():
+                    # one stored round is one game; each flight is stored (and replaced) on its own
+                    print(f"{args.file} is flighted; use import, which replaces each flight's round")
+                    return 1
+                store.replace_round(args.id, rnd, rnd.compute())
+                print(f"round {args.id} replaced from {args.file}")
+        elif args.query == "money" and args.season and not args.course:
+            for name, n, units, amount, skins, birdies, eagles in store.season_money_list(args.season):
+                print(f"{name:<20} {n:>4} rounds {units:>8g} units  ${amount:,.2f}"
+                      f"  {skins} skins {birdies} birdies {eagles} eagles")
+        elif args.query == "money":
+            for name, n, units, amount in store.money_list(start, end, args.course):
+                print(f"{name:<20} {n:>4} rounds {units:>8g} units  ${amount:,.2f}")
+        elif args.query == "h2h":
+            rows = store.head_to_head(args.a, args.b, start, end, args.course)
+            for played_on, course, a_amt, b_amt in rows:
+                print(f"{played_on}  {course:<20} {args.a} ${a_amt:,.2f}  {args.b} ${b_amt:,.2f}")
+            print(f"{len(rows)} rounds: {args.a} ${sum(r[2] for r in rows):,.2f}, "
+                  f"{args.b} ${sum(r[3] for r in rows):,.2f}")
+        elif args.season and not args.course:
+            for name, wins, units in store.season_hole_winners(args.season, args.hole):
+                print(f"{name:<20} {wins:>4} skins {units:>8g} units")
+        else:
+            for name, wins, units in store.hole_winners(args.hole, start, end, args.course):
+                print(f"{name:<20} {wins:>4} skins {units:>8g} units")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
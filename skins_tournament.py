@@ -0,0 +1,126 @@
+"""Multi-round tournaments (36/54/72 holes) built from ordinary 18-hole Rounds.
+
+Each round keeps its own pars, stroke index, settings and field and is scored
+by the round engine. The per-round hole summaries (strokes, bonuses, minima
+and ties: the costly part) are independent and can be computed in a process
+pool; the carryover scan then runs round by round. With carry between rounds
+on, skins still unresolved after a round's 18th hole ride into the next
+round's first hole instead of being lost. Flighted rounds are refused: a
+tournament is one pool per round, and pooling the flights would undo them.
+
+    python skins_tournament.py day1.skins day2.skins day3.skins --carry --out member_member.xlsx
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from skins_engine import HOLES, bonus_matrix
+from skins_formats import load_round
+
+
+class Tournament:
+    """An ordered list of Rounds scored as one event."""
+
+    __slots__ = ("name", "rounds", "carry_between_rounds")
+
+    def __init__(self, rounds=(), name="", carry_between_rounds=False):
+        self.name = name
+        self.rounds = list(rounds)
+        self.carry_between_rounds = carry_between_rounds
+
+    def __repr__(self):
+        return f"Tournament({self.name!r}, {len(self.rounds)} rounds, carry={self.carry_between_rounds})"
+
+    @property
+    def holes(self):
+        return HOLES * len(self.rounds)
+
+
+class TournamentResult(NamedTuple):
+    # engine result dict per round, in round order
+    round_results: list
+    # units carried into each round from the one before
+    carry_in: list
+    # name -> units / amount over all rounds, in order of first appearance
+    total_units: dict
+    total_amount: dict
+    carryover_remaining: int
+
+
+def summarize_round(rnd):
+    """Hole summaries of a Round's included players (runs in a worker process)."""
+    engine = rnd.engine()
+    names, handicaps, gross, missing = rnd.field()
+    play = gross.astype(np.int16) - engine.strokes_matrix(handicaps)
+    return engine.summarize(play, missing, bonus_matrix(gross, missing, engine.pars))
+
+
+def score_tournament(tournament, jobs=1, progress=None):
+    """Score every round and total the payouts across rounds.
+
+    `jobs` > 1 summarizes rounds in a process pool. `progress` is called with
+    the fraction of rounds scored and may raise to stop. Raises ValueError
+    when a round is flighted.
+    """
+    rounds = tournament.rounds
+    flighted = [k for k, rnd in enumerate(rounds, start=1) if rnd.is_flighted()]
+    if flighted:
+        raise ValueError(f"round(s) {', '.join(map(str, flighted))} have flights; a tournament scores each round "
+                         f"as one pool, so score flighted rounds one at a time with skins_flights.py")
+    if jobs == 1 or len(rounds) < 2:
+        summaries = [summarize_round(rnd) for rnd in rounds]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            summaries = list(pool.map(summarize_round, rounds))
+
+    round_results, carry_in = [], []
+    total_units, total_amount = {}, {}
+    carry = 0
+    for k, (rnd, hole_summaries) in enumerate(zip(rounds, summaries), start=1):
+        incoming = carry if tournament.carry_between_rounds else 0
+        names = [p.name for p in rnd.included_players()]
+        results = rnd.engine().scan(names, hole_summaries, carry_in=incoming)
+        carry = results["carryover_remaining"]
+        round_results.append(results)
+        carry_in.append(incoming)
+        for name, units in results["payout_map_units"].items():
+            total_units[name] = total_units.get(name, 0.0) + units
+            total_amount[name] = total_amount.get(name, 0.0) + results["payout_map_amount"][name]
+        if progress is not None:
+            progress(k / len(rounds))
+    return TournamentResult(round_results, carry_in, total_units, total_amount, carry)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a multi-round skins tournament.")
+    parser.add_argument("rounds", nargs="+", help="round files in play order (.skins, .json, .csv or report .xlsx)")
+    parser.add_argument("--name", default="")
+    parser.add_argument("--carry", action="store_true",
+                        help="carry skins unresolved after a round into the next round")
+    parser.add_argument("--out", help="write one workbook with a totals sheet and every round's report")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    tournament = Tournament([load_round(p) for p in args.rounds], args.name, args.carry)
+    try:
+        scored = score_tournament(tournament, jobs=args.jobs)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"{tournament.holes} holes, {len(tournament.rounds)} rounds")
+    for k, (carry_in, res) in enumerate(zip(scored.carry_in, scored.round_results), start=1):
+        print(f"Round {k}: carry in {carry_in}, carry out {res['carryover_remaining']}")
+    print(f"{'Player':<20} {'Units':>8} {'Amount$':>10}")
+    for name, units in sorted(scored.total_units.items(), key=lambda kv: -scored.total_amount[kv[0]]):
+        print(f"{name:<20} {units:>8g} {scored.total_amount[name]:>10.2f}")
+    if args.out:
+        from skins_excel import build_tournament_workbook
+        build_tournament_workbook(tournament, scored).save(args.out)
+        print(f"Workbook written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,25 @@
+import os
+
+from skins_bench import synthetic_round
+from skins_formats import load_round, write_round
+from skins_batch import main, output_names
+
+
+def test_inputs_sharing_a_stem_keep_their_suffix():
+    assert output_names(["s/r0.xlsx", "s/r0.csv", "s/r1.json"], "csv") == ["r0_xlsx.csv", "r0_csv.csv", "r1.csv"]
+
+
+def test_outputs_never_overwrite_the_inputs(tmp_path, capsys):
+    rnd = synthetic_round(5, seed=1)
+    for name in ("r0.json", "r0.csv", "r1.json"):
+        write_round(str(tmp_path / name), rnd)
+    before = {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)}
+
+    assert main([str(tmp_path), "--out-dir", str(tmp_path), "--format", "json", "--jobs", "1"]) == 2
+    assert {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)} == before
+    assert "r1.json" in capsys.readouterr().err
+
+    out = tmp_path / "out"
+    assert main([str(tmp_path), "--out-dir", str(out), "--format", "csv", "--jobs", "1"]) == 0
+    assert sorted(os.listdir(out)) == ["r0_csv.csv", "r0_json.csv", "r1.csv"]
+    assert load_round(str(out / "r1.csv")).compute()["payout_map_amount"] == rnd.compute()["payout_map_amount"]
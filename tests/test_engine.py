@@ -0,0 +1,171 @@
+from dataclasses import replace
+from itertools import product
+
+import numpy as np
+import pytest
+
+from skins_bench import synthetic_scores
+from skins_engine import (
+    HOLES, MISSING_SCORE, REASON_CARRY, REASON_NO_SCORES, REASON_SOLE, REASON_SPLIT, RESULT_CACHE, RULE_TOGGLES,
+    LiveSkinsBoard, SkinsEngine, SkinsSettings, allocate_strokes, parse_handicap, parse_score,
+)
+
+
+SI = list(range(1, 19))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12", 12), ("-3", -3), ("+2", -2), (" +2.5 ", -2.5), ("+0", 0), ("+", 0), ("+-2", 0), ("abc", 0), (None, 0),
+])
+def test_parse_handicap_reads_plus_handicaps_as_negative(text, expected):
+    assert parse_handicap(text) == expected
+
+
+def test_plus_handicaps_give_strokes_back_on_the_easiest_holes():
+    strokes = allocate_strokes([parse_handicap("+2"), parse_handicap("+20"), 2], SI)
+    assert strokes[0].tolist() == [0] * 16 + [-1, -1]
+    assert strokes[1].tolist() == [-1] * 16 + [-2, -2]
+    assert strokes[2].tolist() == [1, 1] + [0] * 16
+    assert np.array_equal(allocate_strokes([-40], SI)[0], -allocate_strokes([40], SI)[0][::-1])
+
+
+# ---- parity with the rules of the original GUI scorer ----
+
+PARS = [4, 4, 3, 5, 4, 4, 3, 4, 5, 4, 3, 4, 5, 4, 4, 3, 5, 4]
+RULES = [SkinsSettings(*combo) for combo in product((False, True), repeat=len(RULE_TOGGLES))]
+
+
+def gross_bonus(score, par):
+    return 5 if score <= par - 2 else 1 if score == par - 1 else 0
+
+
+def baseline(pars, stroke_index, settings, names, handicaps, scores):
+    """The original _compute_skins_and_payouts rules, one hole at a time in plain Python.
+
+    Returns (units by name, per-hole (reason, sole winner, units paid), carry left after 18).
+    """
+    play = [[None if s is None else s - ((1 if si <= h % 18 else 0) + h // 18 if settings.use_net else 0)
+             for s, si in zip(row, stroke_index)] for h, row in zip(handicaps, scores)]
+    units = {name: 0.0 for name in names}
+    holes, carry = [], 0
+
+    def no_skin():
+        nonlocal carry
+        if settings.carryover:
+            carry += 1
+            return REASON_CARRY
+        return REASON_NO_SCORES
+
+    for h, par in enumerate(pars):
+        col = {i: row[h] for i, row in enumerate(play) if row[h] is not None}
+        if not col:
+            holes.append((REASON_NO_SCORES, None, 0))
+            continue
+        low = min(col.values())
+        tied = [i for i, v in col.items() if v == low]
+        if low > par:
+            holes.append((no_skin(), None, 0))
+        elif len(tied) == 1:
+            # the winner's own birdie/eagle bonus rides on the skin; the bonus pass below skips it
+            won = 1 + carry + (gross_bonus(scores[tied[0]][h], par) if settings.bonus_enabled else 0)
+            units[names[tied[0]]] += won
+            holes.append((REASON_SOLE, names[tied[0]], won))
+            carry = 0
+        elif low > par - 1 or len(tied) > 2 or not settings.split_ties:
+            holes.append((no_skin(), None, 0))
+        else:
+            for i in tied:
+                units[names[i]] += (1 + carry) / 2
+            holes.append((REASON_SPLIT, None, 1 + carry))
+            carry = 0
+
+    if settings.bonus_enabled:
+        for name, row in zip(names, scores):
+            for h, (score, par) in enumerate(zip(row, pars)):
+                if score is not None and holes[h][1] != name:
+                    units[name] += gross_bonus(score, par)
+    return units, holes, carry if settings.carryover else 0
+
+
+def random_field(seed, players=6, birdie_rate=0.3, missing_rate=0.1):
+    rng = np.random.default_rng(seed)
+    handicaps = rng.integers(0, 37, players).tolist()
+    gross = synthetic_scores(rng, handicaps, birdie_rate=birdie_rate, missing_rate=missing_rate)
+    scores = [[None if s == MISSING_SCORE else int(s) for s in row] for row in gross]
+    return [f"P{i}" for i in range(players)], handicaps, scores, gross
+
+
+def test_hand_scored_round():
+    # H1: A birdies alone; H2: all bogey, carry; H3: A and B birdie, split the carried skin;
+    # H4: nobody scores; H5: C wins with a net birdie; the rest are net pars all round and carry.
+    names, handicaps = ["A", "B", "C"], [0, 0, 18]
+    rows = [[3, 5, 2, None, 4] + [4] * 13, [4, 5, 2, None, 4] + [4] * 13, [5, 6, 4, None, 4] + [5] * 13]
+    pars = [4, 4, 3, 4, 4] + [4] * 13
+    settings = SkinsSettings(use_net=True, carryover=True, split_ties=True, bonus_enabled=True, per_skin=2.0)
+    res = SkinsEngine(pars, SI, settings).compute(names, handicaps, rows)
+
+    assert [h["reason"] for h in res["hole_results"][:5]] == [
+        REASON_SOLE, REASON_CARRY, REASON_SPLIT, REASON_NO_SCORES, REASON_SOLE]
+    # A: birdie skin 1 + bonus 1, half of 2 split units, birdie bonus 1 on H3
+    assert res["payout_map_units"] == {"A": 2 + 1 + 1, "B": 1 + 1, "C": 1}
+    assert res["payout_map_amount"] == {"A": 8.0, "B": 4.0, "C": 2.0}
+    assert res["carryover_remaining"] == 13
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("settings", RULES, ids=lambda s: "".join("NCSB"[i] for i, t in enumerate(RULE_TOGGLES)
+                                                                    if getattr(s, t)) or "-")
+def test_engine_matches_baseline_rules(seed, settings):
+    names, handicaps, scores, _ = random_field(seed)
+    settings = replace(settings, per_skin=2.5, total_purse=120.0 if seed % 2 else None)
+    res = SkinsEngine(PARS, SI, settings).compute(names, handicaps, scores)
+    units, holes, carry = baseline(PARS, SI, settings, names, handicaps, scores)
+
+    assert res["payout_map_units"] == pytest.approx(units)
+    assert [(h["reason"], h["sole_winner"], h["units_paid"]) for h in res["hole_results"]] == holes
+    assert res["carryover_remaining"] == carry
+    total = sum(units.values())
+    per_unit = (120.0 / total if total else 0.0) if seed % 2 else 2.5
+    assert res["payout_map_amount"] == pytest.approx({n: round(u * per_unit, 2) for n, u in units.items()})
+
+
+# ---- the fast paths agree with compute ----
+
+@pytest.mark.parametrize("settings", RULES[::3] + [replace(RULES[-1], total_purse=200.0)])
+def test_batch_units_match_compute(settings):
+    rng = np.random.default_rng(7)
+    handicaps = rng.integers(0, 37, 10).tolist()
+    gross = synthetic_scores(rng, handicaps, rounds=25, birdie_rate=0.3, missing_rate=0.05)
+    engine = SkinsEngine(PARS, SI, settings)
+    names = [f"P{i}" for i in range(10)]
+    units = engine.batch_units(handicaps, gross)
+    amounts = engine.batch_amounts(units)
+    for r in range(gross.shape[0]):
+        res = engine.compute_matrix(names, handicaps, gross[r], gross[r] == MISSING_SCORE)
+        assert units[r].tolist() == pytest.approx([res["payout_map_units"][n] for n in names])
+        assert amounts[r].tolist() == pytest.approx([res["payout_map_amount"][n] for n in names])
+
+
+def test_compare_rules_matches_compute():
+    names, handicaps, _, gross = random_field(3, players=8)
+    current = SkinsSettings(use_net=True, split_ties=True, total_purse=90.0)
+    variants = SkinsEngine(PARS, SI, current).compare_rules(names, handicaps, gross, gross == MISSING_SCORE)
+
+    assert len(variants) == 16 and variants[0][0] == current
+    assert {tuple(getattr(s, t) for t in RULE_TOGGLES) for s, _ in variants} == set(product((False, True), repeat=4))
+    for settings, res in variants:
+        RESULT_CACHE.clear()
+        assert res == SkinsEngine(PARS, SI, settings).compute_matrix(names, handicaps, gross, gross == MISSING_SCORE)
+
+
+def test_live_board_tracks_single_edits():
+    names, handicaps, scores, _ = random_field(5, players=7)
+    engine = SkinsEngine(PARS, SI, SkinsSettings(use_net=True, split_ties=True))
+    board = LiveSkinsBoard(engine, names, handicaps, scores)
+    rng = np.random.default_rng(11)
+    for value in rng.choice(["", "1", "2", "3", "4", "5", "6", "x", "12"], size=60):
+        player, hole = int(rng.integers(len(names))), int(rng.integers(HOLES))
+        results = board.set_score(player, hole, value)
+        scores[player][hole] = parse_score(value)
+        RESULT_CACHE.clear()
+        assert results == engine.compute(names, handicaps, scores)
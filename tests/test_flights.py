@@ -0,0 +1,71 @@
+from dataclasses import replace
+
+from skins_bench import synthetic_round
+from skins_engine import RESULT_CACHE, RULE_TOGGLES, SkinsSettings
+from skins_flights import compare_flights, score_flights
+from skins_model import parse_flight_pots
+
+
+def flighted_round(players=12, seed=3):
+    rnd = synthetic_round(players, seed=seed, birdie_rate=0.25,
+                          settings=SkinsSettings(use_net=True, split_ties=True, total_purse=300.0))
+    for i, p in enumerate(rnd.players):
+        p.flight = "ABC"[i % 3]
+    rnd.flight_pots = parse_flight_pots("A=5")
+    return rnd
+
+
+def test_compare_rules_keeps_flights_apart():
+    rnd = flighted_round()
+    variants = compare_flights(rnd)
+    assert len(variants) == 16 and variants[0][0] == rnd.settings
+
+    scored = score_flights(rnd)
+    current = variants[0][1]
+    assert list(current) == scored.flights
+    for flight, res in zip(scored.flights, scored.flight_results):
+        assert current[flight]["payout_map_amount"] == res["payout_map_amount"]
+    for settings, by_flight in variants:
+        RESULT_CACHE.clear()
+        toggles = {t: getattr(settings, t) for t in RULE_TOGGLES}
+        for flight, res in by_flight.items():
+            frnd = rnd.flight_round(flight)
+            assert res == frnd.compute(replace(frnd.settings, **toggles))
+
+
+def test_compare_rules_on_an_unflighted_round_is_one_pool():
+    rnd = synthetic_round(8, seed=4)
+    variants = compare_flights(rnd)
+    assert [list(by_flight) for _, by_flight in variants] == [[""]] * 16
+    assert variants[0][1][""] == rnd.engine().compare_rules(*rnd.field())[0][1]
+
+
+def test_flights_score_the_same_in_parallel():
+    rnd = flighted_round(players=30)
+    RESULT_CACHE.clear()
+    one = score_flights(rnd, jobs=1)
+    RESULT_CACHE.clear()
+    many = score_flights(rnd, jobs=3)
+    assert many.flights == one.flights
+    assert many.flight_results == one.flight_results
+    assert many.total_amount == one.total_amount
+
+
+def test_flights_without_a_pot_share_the_purse_by_players():
+    rnd = synthetic_round(10, settings=SkinsSettings(per_skin=2.0, total_purse=200.0))
+    for p, flight in zip(rnd.players, "AAAAABBBCC"):
+        p.flight = flight
+    rnd.players[9].included = False
+    rnd.flight_pots = parse_flight_pots("C=3")
+    assert rnd.flight_sizes() == {"A": 5, "B": 3, "C": 1}
+    # A and B have no pot of their own: 200 over their 8 included players
+    assert rnd.flight_settings("A").total_purse == 125.0
+    assert rnd.flight_settings("B").total_purse == 75.0
+    assert rnd.flight_settings("C") == replace(rnd.settings, per_skin=3.0, total_purse=None)
+    assert rnd.flight_round("B").settings.total_purse == 75.0
+
+    rnd.flight_pots = parse_flight_pots("B=3, C=3")
+    assert rnd.flight_settings("A") == rnd.settings
+
+    rnd.settings = SkinsSettings(per_skin=2.0)
+    assert rnd.flight_settings("B").per_skin == 3.0 and rnd.flight_settings("A") == rnd.settings
@@ -0,0 +1,105 @@
+from dataclasses import replace
+
+import pytest
+
+from skins_bench import synthetic_round
+from skins_engine import MISSING_SCORE, SkinsSettings
+from skins_excel import build_flights_workbook, build_report_workbook, read_report
+from skins_flights import score_flights
+from skins_formats import SkinsFile, load_round, write_round
+from skins_model import new_round_id, parse_flight_pots
+
+
+def state(rnd):
+    """Everything a round file is expected to keep."""
+    return (rnd.course, rnd.date_text(), list(rnd.pars), list(rnd.stroke_index or []), rnd.settings,
+            [(p.name, p.handicap, p.included, list(p.scores), p.flight) for p in rnd.players], rnd.flight_pots,
+            rnd.round_id)
+
+
+def sample_round(flighted=False):
+    rnd = synthetic_round(9, seed=2, birdie_rate=0.2, missing_rate=0.1,
+                          settings=SkinsSettings(use_net=True, split_ties=True, per_skin=2.5, total_purse=180.0,
+                                                 slope=128.0, course_rating=71.4))
+    rnd.players[0].handicap = -2
+    rnd.players[1].handicap = None
+    rnd.players[2].included = False
+    rnd.players[3].scores[:] = MISSING_SCORE
+    rnd.round_id = new_round_id()
+    if flighted:
+        for i, p in enumerate(rnd.players):
+            p.flight = "AB"[i % 2]
+        rnd.flight_pots = parse_flight_pots("A=5, B=purse 60")
+    return rnd
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".skins"])
+@pytest.mark.parametrize("flighted", [False, True], ids=["plain", "flighted"])
+def test_round_files_round_trip(tmp_path, suffix, flighted):
+    rnd = sample_round(flighted)
+    path = str(tmp_path / f"round{suffix}")
+    write_round(path, rnd, None if suffix == ".skins" else rnd.compute())
+    assert state(load_round(path)) == state(rnd)
+
+
+@pytest.mark.parametrize("flighted, version", [(False, 1), (True, 2)])
+def test_skins_files_stay_version_1_unless_flighted(tmp_path, flighted, version):
+    path = str(tmp_path / "round.skins")
+    write_round(path, sample_round(flighted))
+    with SkinsFile(path) as f:
+        assert f.version == version
+
+
+@pytest.mark.parametrize("total_purse", [None, 180.0])
+def test_report_workbook_round_trip(tmp_path, total_purse):
+    rnd = sample_round()
+    rnd.settings = replace(rnd.settings, total_purse=total_purse)
+    results = rnd.compute()
+    path = str(tmp_path / "report.xlsx")
+    build_report_workbook(rnd, results).save(path)
+
+    back = read_report(path)
+    # the report's Per-skin $ is the rate paid, which a total purse sets
+    assert back.settings == replace(rnd.settings, per_skin=results["per_skin"])
+    # the sheet lists excluded players after the included ones
+    assert sorted(state(back)[5]) == sorted(state(rnd)[5])
+    assert state(back)[:4] == state(rnd)[:4]
+    assert back.round_id == rnd.round_id
+    assert back.compute()["payout_map_amount"] == results["payout_map_amount"]
+
+
+def test_flights_workbook_round_trip(tmp_path):
+    rnd = sample_round(flighted=True)
+    scored = score_flights(rnd)
+    path = str(tmp_path / "flights.xlsx")
+    build_flights_workbook(rnd, scored).save(path)
+
+    back = read_report(path)
+    assert back.settings == rnd.settings
+    assert back.flight_pots == rnd.flight_pots
+    assert back.round_id == rnd.round_id
+    by_name = {p.name: p for p in back.players}
+    assert sorted(by_name) == sorted(p.name for p in rnd.players)
+    for p in rnd.players:
+        q = by_name[p.name]
+        assert (q.handicap, q.included, list(q.scores), q.flight) == (p.handicap, p.included, list(p.scores), p.flight)
+    assert score_flights(back).total_amount == scored.total_amount
+
+
+def test_skins_file_without_round_id_still_reads(tmp_path):
+    rnd = sample_round()
+    rnd.round_id = ""
+    path = str(tmp_path / "round.skins")
+    write_round(path, rnd)
+    assert state(load_round(path)) == state(rnd)
+
+
+def test_flights_whose_sheet_names_collide_all_read_back(tmp_path):
+    rnd = sample_round()
+    for i, p in enumerate(rnd.players):
+        p.flight = ["A/B", "AB", "a", "A", "x" * 40, "x" * 41][i % 6]
+    path = str(tmp_path / "flights.xlsx")
+    build_flights_workbook(rnd, score_flights(rnd)).save(path)
+
+    back = read_report(path)
+    assert sorted((p.name, p.flight) for p in back.players) == sorted((p.name, p.flight) for p in rnd.players)
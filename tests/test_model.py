@@ -0,0 +1,48 @@
+import numpy as np
+
+from skins_bench import scorecard_text, synthetic_round
+from skins_engine import MISSING_SCORE
+from skins_model import parse_score_block
+
+
+def holes(*scores):
+    return [str(s) for s in scores] + ["4"] * (18 - len(scores))
+
+
+def test_grid_text_round_trips():
+    rnd = synthetic_round(6, seed=2)
+    players, rejected = parse_score_block(scorecard_text(rnd))
+    assert rejected == []
+    assert [(p.name, p.handicap, p.included) for p in players] == [(p.name, p.handicap, True) for p in rnd.players]
+    assert np.array_equal(np.stack([p.scores for p in players]), rnd.score_matrix()[0])
+
+
+def test_report_rows_skip_labels_and_keep_the_included_column():
+    lines = [
+        "\t".join(["Name", "Handicap", "Included"] + [f"H{i}" for i in range(1, 19)] + ["Front9", "Back9"]),
+        "\t".join(["Par", ""] + ["4"] * 18),
+        "\t".join(["Stroke Index:", ""] + [str(i) for i in range(1, 19)]),
+        "\t".join(["Bob", "+2", "FALSE"] + holes(3) + ["35", "36"]),
+        "\t".join(["", "7"] + holes()),
+        "\t".join(["Jim", "", "yes"] + holes(5)),
+    ]
+    players, rejected = parse_score_block("\n".join(lines))
+    assert rejected == []
+    assert [(p.name, p.handicap, p.included) for p in players] == [("Bob", -2, False), ("Jim", None, True)]
+    assert players[0].scores[0] == 3 and players[1].scores[0] == 5
+
+
+def test_bad_cells_are_blanked_and_reported_by_line_and_hole():
+    text = "\n".join([
+        ",".join(["Bob", "4"] + holes("x", 12, "", 1000)),
+        ",".join(["Jim", "9", "5", "4"]),
+    ])
+    players, rejected = parse_score_block(text)
+    assert rejected == [(1, 1, "x"), (1, 2, "12"), (1, 4, "1000")]
+    assert players[0].scores[:4].tolist() == [MISSING_SCORE] * 4
+    # a short row is padded with blank holes
+    assert players[1].scores[:3].tolist() == [5, 4, MISSING_SCORE]
+
+
+def test_block_without_players_is_empty():
+    assert parse_score_block("Name,Handicap\nPar,,4,4\n\n") == ([], [])
@@ -0,0 +1,42 @@
+import numpy as np
+
+from skins_bench import DEFAULT_PARS
+from skins_engine import HOLES, SkinsSettings
+from skins_sim import simulate
+
+
+STROKE_INDEX = list(range(1, HOLES + 1))
+
+
+def test_seeded_runs_repeat_and_do_not_depend_on_jobs():
+    args = (DEFAULT_PARS, STROKE_INDEX, SkinsSettings(use_net=True), [4, 12, "+1", 20])
+    first = simulate(*args, rounds=3000, batch_size=1000, seed=7)
+    again = simulate(*args, rounds=3000, batch_size=1000, seed=7)
+    pooled = simulate(*args, rounds=3000, batch_size=1000, seed=7, jobs=2)
+    assert first.rounds == 3000
+    for a, b, c in zip(first[1:], again[1:], pooled[1:]):
+        assert np.array_equal(a, b)
+        assert np.allclose(a, c)
+
+
+def test_a_short_last_batch_is_counted_and_progress_reaches_one():
+    seen = []
+    result = simulate(DEFAULT_PARS, STROKE_INDEX, SkinsSettings(), [5, 15], rounds=2500, batch_size=1000,
+                      seed=1, progress=seen.append)
+    assert result.rounds == 2500
+    assert seen == [0.4, 0.8, 1.0]
+
+
+def test_payouts_follow_the_rules():
+    handicaps = [0, 10, 20, 30]
+    gross = simulate(DEFAULT_PARS, STROKE_INDEX, SkinsSettings(per_skin=2.0), handicaps, rounds=4000, seed=3)
+    assert np.isclose(gross.win_prob.sum(), 1.0)
+    assert np.allclose(gross.mean_amount, 2.0 * gross.mean_units)
+    # playing off the gross, the scratch player wins the most
+    assert np.all(np.diff(gross.mean_units) < 0)
+
+    purse = simulate(DEFAULT_PARS, STROKE_INDEX, SkinsSettings(use_net=True, total_purse=100.0), handicaps,
+                     rounds=4000, seed=3)
+    # strokes narrow the gap between the scratch player and the 30, and a round that awards skins pays the purse
+    assert purse.mean_units[0] / purse.mean_units[-1] < gross.mean_units[0] / gross.mean_units[-1]
+    assert 95.0 < purse.mean_amount.sum() < 100.01  # amounts are rounded to the cent
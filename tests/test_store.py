@@ -0,0 +1,125 @@
+import pytest
+
+from skins_bench import synthetic_round
+from skins_flights import score_flights
+from skins_formats import write_round
+from skins_model import Player, new_round_id
+from skins_store import RoundStore, main
+
+
+def totals(store):
+    players = store.conn.execute(
+        "SELECT season, name, rounds, round(units, 6), round(amount, 6), skins_won, birdies, eagles"
+        " FROM player_totals ORDER BY season, name").fetchall()
+    holes = store.conn.execute(
+        "SELECT season, hole, name, wins, round(units, 6) FROM hole_totals ORDER BY season, hole, name").fetchall()
+    return players, holes
+
+
+def assert_matches_rebuild(store):
+    incremental = totals(store)
+    store.rebuild_aggregates()
+    assert incremental == totals(store)
+
+
+def dated_round(seed, date, players=8):
+    rnd = synthetic_round(players, seed=seed, birdie_rate=0.2)
+    rnd.date = date
+    rnd.round_id = new_round_id()
+    return rnd
+
+
+def round_count(store):
+    return store.conn.execute("SELECT count(*) FROM rounds").fetchone()[0]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with RoundStore(str(tmp_path / "rounds.db")) as s:
+        yield s
+
+
+def test_saving_a_round_again_replaces_it(store):
+    rnd = dated_round(1, "2026-05-01")
+    first = store.save_round(rnd, rnd.compute())
+    money = store.money_list()
+    assert store.save_round(rnd, rnd.compute()) == first
+    assert len(store.rounds()) == 1
+    assert store.money_list() == money
+    assert_matches_rebuild(store)
+
+
+def test_renames_and_late_players_keep_the_round(store):
+    rnd = dated_round(2, "2026-05-02")
+    first = store.save_round(rnd, rnd.compute())
+    rnd.players[0].name = "Renamed"
+    rnd.players.append(Player("Late", 10, True, rnd.players[1].scores.copy()))
+    assert store.save_round(rnd, rnd.compute()) == first
+    assert round_count(store) == 1
+    assert all(rounds == 1 for _, rounds, _, _ in store.money_list())
+    assert_matches_rebuild(store)
+
+
+def test_rounds_saved_before_round_ids_are_replaced(store):
+    rnd = dated_round(4, "2026-05-04")
+    rnd.round_id = ""
+    first = store.save_round(rnd, rnd.compute())
+    rnd.round_id = new_round_id()
+    assert store.save_round(rnd, rnd.compute()) == first
+    assert store.load_round(first).round_id == rnd.round_id
+
+
+def test_flights_follow_their_round(store):
+    rnd = dated_round(5, "2026-05-05", players=9)
+    for i, p in enumerate(rnd.players):
+        p.flight = "ABC"[i % 3]
+    assert len(store.save_flights(score_flights(rnd))) == 3
+    # moving a player between flights replaces the flights' rounds
+    rnd.players[0].flight = "B"
+    store.save_flights(score_flights(rnd))
+    assert round_count(store) == 3
+    # a flight that empties out is dropped, and so are the flights once the round is unflighted
+    for p in rnd.players:
+        p.flight = "A" if p.flight == "C" else p.flight
+    store.save_flights(score_flights(rnd))
+    assert round_count(store) == 2
+    for p in rnd.players:
+        p.flight = ""
+    store.save_round(rnd, rnd.compute())
+    assert round_count(store) == 1
+    assert_matches_rebuild(store)
+
+
+def test_corrections_and_deletes_keep_totals_in_step(store):
+    rounds = [dated_round(seed, f"2026-05-0{seed}") for seed in range(1, 5)]
+    ids = [store.save_round(rnd, rnd.compute()) for rnd in rounds]
+    assert_matches_rebuild(store)
+
+    corrected = rounds[1]
+    corrected.players[0].scores[:] = 1
+    store.replace_round(ids[1], corrected, corrected.compute())
+    assert_matches_rebuild(store)
+    assert store.load_round(ids[1]).players[0].scores.tolist() == [1] * 18
+
+    store.delete_round(ids[2])
+    assert [r[0] for r in store.rounds()] == [ids[0], ids[1], ids[3]]
+    assert_matches_rebuild(store)
+
+
+def test_cli_replace_and_delete(store, tmp_path, capsys):
+    rnd = dated_round(3, "2026-06-01")
+    round_id = store.save_round(rnd, rnd.compute())
+    rnd.players[2].scores[:4] = 2
+    path = str(tmp_path / "corrected.json")
+    write_round(path, rnd)
+
+    assert main(["--db", store.path, "replace", str(round_id), path]) == 0
+    store.conn.commit()
+    assert store.load_round(round_id).players[2].scores[:4].tolist() == [2] * 4
+    assert_matches_rebuild(store)
+
+    assert main(["--db", store.path, "delete", str(round_id)]) == 0
+    assert store.rounds() == []
+    assert totals(store) == ([], [])
+    assert main(["--db", store.path, "delete", str(round_id)]) == 1
+    capsys.readouterr()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from skins_bench import DEFAULT_PARS, synthetic_round
+from skins_engine import HOLES, SkinsSettings
+from skins_formats import write_round
+from skins_model import Player, Round
+from skins_tournament import Tournament, main, score_tournament
+
+
+def two_player_round(al, bo, carryover=True):
+    settings = SkinsSettings(carryover=carryover, bonus_enabled=False)
+    return Round(DEFAULT_PARS, list(range(1, HOLES + 1)), settings,
+                 [Player("Al", 0, True, np.array(al, dtype=np.int8)),
+                  Player("Bo", 0, True, np.array(bo, dtype=np.int8))])
+
+
+def halved_then_won():
+    # every hole halved in round 1; Bo birdies the first hole of round 2
+    birdie = list(DEFAULT_PARS)
+    birdie[0] -= 1
+    return [two_player_round(DEFAULT_PARS, DEFAULT_PARS), two_player_round(DEFAULT_PARS, birdie)]
+
+
+def test_unresolved_skins_carry_into_the_next_round():
+    scored = score_tournament(Tournament(halved_then_won(), carry_between_rounds=True))
+    assert scored.carry_in == [0, HOLES]
+    assert scored.total_units == {"Al": 0.0, "Bo": HOLES + 1.0}
+    assert [res["carryover_remaining"] for res in scored.round_results] == [HOLES, HOLES - 1]
+    assert scored.carryover_remaining == HOLES - 1
+
+
+def test_without_carry_between_rounds_each_round_starts_fresh():
+    scored = score_tournament(Tournament(halved_then_won()))
+    assert scored.carry_in == [0, 0]
+    assert scored.total_units == {"Al": 0.0, "Bo": 1.0}
+
+
+def test_carry_needs_carryover_on_in_the_next_round():
+    first, second = halved_then_won()
+    second = two_player_round(second.players[0].scores, second.players[1].scores, carryover=False)
+    scored = score_tournament(Tournament([first, second], carry_between_rounds=True))
+    assert scored.total_units["Bo"] == 1.0
+
+
+def test_parallel_rounds_match_sequential():
+    rounds = [synthetic_round(10, seed=s) for s in range(3)]
+    tournament = Tournament(rounds, carry_between_rounds=True)
+    assert score_tournament(tournament, jobs=2) == score_tournament(tournament)
+
+
+def test_flighted_rounds_are_refused(tmp_path, capsys):
+    rounds = halved_then_won()
+    rounds[1].players[0].flight = "A"
+    with pytest.raises(ValueError, match=r"round\(s\) 2 have flights"):
+        score_tournament(Tournament(rounds))
+
+    paths = [str(tmp_path / f"day{k}.json") for k in (1, 2)]
+    for path, rnd in zip(paths, rounds):
+        write_round(path, rnd)
+    with pytest.raises(SystemExit) as exit_info:
+        main(paths + ["--jobs", "1"])
+    assert exit_info.value.code == 2
+    assert "skins_flights.py" in capsys.readouterr().err